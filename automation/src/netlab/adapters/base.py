@@ -1,8 +1,25 @@
 from dataclasses import dataclass
 
+DEFAULT_SOCKET = "/var/run/docker.sock"
+# Exit status reported for an exec that hit its deadline, as timeout(1) does.
+TIMEOUT_RC = 124
+
 
 @dataclass(slots=True)
 class CmdResult:
     rc: int
     stdout: str
     stderr: str
+    timed_out: bool = False
+    # Set instead of running the exec when the node's circuit breaker is open: the shared cause.
+    unreachable: str | None = None
+
+
+def exec_fields(result: CmdResult) -> dict:
+    # Only present when it happened, so ordinary evidence payloads (and their hashes) are unchanged.
+    out: dict = {}
+    if result.timed_out:
+        out["timed_out"] = True
+    if result.unreachable:
+        out["unreachable"] = result.unreachable
+    return out
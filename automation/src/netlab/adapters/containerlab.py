@@ -1,22 +1,83 @@
 from __future__ import annotations
 
-import subprocess
+import threading
+import uuid
 from pathlib import Path
 
 from netlab.adapters.base import CmdResult
+from netlab.adapters.docker_cli import DockerCliBackend
+from netlab.adapters.health import NodeHealth, container_state
+from netlab.adapters.replay import Recording
+from netlab.core.tracing import span
 from netlab.utils.yaml import load_yaml
 
 
+def eos_command_family(command: str) -> str:
+    """``show bgp evpn | json`` -> ``show bgp``; commands of one family need the same privilege level."""
+    return " ".join(command.split("|", 1)[0].split()[:2])
+
+
+def _needs_enable(result: CmdResult) -> bool:
+    combined = (result.stdout + "\n" + result.stderr).lower()
+    return "privileged mode required" in combined or "% invalid input" in combined
+
+
+def _enable_worked(result: CmdResult) -> bool:
+    combined = (result.stdout + "\n" + result.stderr).lower()
+    return result.rc == 0 and "privileged mode required" not in combined
+
+
+def _eos_error(text: str) -> bool:
+    lowered = text.lower()
+    return lowered.startswith("% ") or "privileged mode required" in lowered
+
+
+def split_eos_batch(stdout: str, marker: str, count: int) -> list[str]:
+    chunks: dict[int, list[str]] = {}
+    current: int | None = None
+    for line in stdout.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(marker):
+            tag = stripped[len(marker):]
+            current = int(tag) if tag.isdigit() else None
+            if current is not None:
+                chunks[current] = []
+            continue
+        if current is not None:
+            chunks[current].append(line)
+    return ["\n".join(chunks[i]).strip() if i in chunks else "" for i in range(count)]
+
+
 class ContainerlabAdapter:
-    def __init__(self, repo_root: Path, lab: str) -> None:
+    def __init__(
+        self,
+        repo_root: Path,
+        lab: str,
+        eos_batch: bool = False,
+        backend=None,
+        record: bool = False,
+        exec_timeout: float | None = None,
+        breaker_threshold: int = 3,
+    ) -> None:
         self.repo_root = repo_root
         self.lab = lab
+        self.backend = backend or DockerCliBackend()
+        self.eos_batch = eos_batch
+        # Deadline in seconds for every exec; None waits forever.
+        self.exec_timeout = exec_timeout
+        self.health = NodeHealth(breaker_threshold, probe=self._probe)
+        self._eos_primed: dict[tuple[str, str], CmdResult] = {}
+        self._eos_primed_lock = threading.Lock()
+        # (node, command family) pairs that only answer through `enable`, learned on first use.
+        self._eos_enable_only: set[tuple[str, str]] = set()
         self.lab_dir = repo_root / lab
         self.topology_file = self._resolve_topology_path()
         self.topology = load_yaml(self.topology_file)
         self.clab_name = self.topology.get("name", lab)
         self.nodes_map = dict(self.topology.get("topology", {}).get("nodes", {}))
         self.nodes = list(self.nodes_map.keys())
+        # Outputs served to callers are captured here for ReplayAdapter when recording.
+        self.recording = Recording(lab, {n: self.node_kind(n) for n in self.nodes}) if record else None
 
     def _resolve_topology_path(self) -> Path:
         direct = self.lab_dir / f"{self.lab}.clab.yml"
@@ -33,27 +94,102 @@ class ContainerlabAdapter:
     def container_name(self, node: str) -> str:
         return f"clab-{self.clab_name}-{node}"
 
+    def _record(self, channel: str, node: str, command: str, result: CmdResult) -> CmdResult:
+        # Short-circuited results are not device output and stay out of recordings.
+        if self.recording is not None and result.unreachable is None:
+            self.recording.add(channel, node, command, result)
+        return result
+
+    def _probe(self, node: str) -> str | None:
+        try:
+            return container_state(self.backend.inspect(self.container_name(node), timeout=self.exec_timeout))
+        except TimeoutError as exc:
+            # A daemon that cannot answer inspect will not run execs either.
+            return str(exc)
+
+    def _exec(self, node: str, argv: list[str]) -> CmdResult:
+        cause = self.health.cause(node)
+        if cause is not None:
+            return CmdResult(1, "", f"node unreachable: {cause}", unreachable=cause)
+        result = self.backend.exec(self.container_name(node), argv, timeout=self.exec_timeout)
+        self.health.record(node, result)
+        return result
+
     def exec(self, node: str, cmd: str) -> CmdResult:
-        p = subprocess.run(["docker", "exec", self.container_name(node), "bash", "-lc", cmd], capture_output=True, text=True)
-        return CmdResult(p.returncode, p.stdout.strip(), p.stderr.strip())
+        with span("adapter", f"exec {node}", node=node, cmd=cmd.splitlines()[0] if cmd else "") as args:
+            result = self._exec(node, ["bash", "-lc", cmd])
+            args["rc"] = result.rc
+        return self._record("exec", node, cmd, result)
+
+    def eos_cli_batch(self, node: str, commands: list[str]) -> list[CmdResult]:
+        if not commands:
+            return []
+        # One Cli session for all commands; `bash echo` markers delimit each output.
+        marker = f"__NETLAB_{uuid.uuid4().hex[:8]}_"
+        lines = ["enable"]
+        for idx, command in enumerate(commands):
+            lines.append(f"bash echo {marker}{idx}")
+            lines.append(command)
+        lines.append(f"bash echo {marker}end")
+        script = "cat <<'EOF' | Cli\n" + "\n".join(lines) + "\nEOF"
+        with span("adapter", f"eos_cli_batch {node}", node=node, commands=len(commands)):
+            p = self._exec(node, ["bash", "-lc", script])
+        stderr = p.stderr
+        if p.rc != 0:
+            return [CmdResult(p.rc, "", stderr, p.timed_out, p.unreachable) for _ in commands]
+
+        out: list[CmdResult] = []
+        for chunk in split_eos_batch(p.stdout, marker, len(commands)):
+            rc = 1 if _eos_error(chunk) else 0
+            out.append(CmdResult(rc, chunk, stderr))
+        return out
+
+    def prime_eos(self, node: str, commands: list[str]) -> None:
+        with self._eos_primed_lock:
+            pending = [c for c in dict.fromkeys(commands) if (node, c) not in self._eos_primed]
+        results = self.eos_cli_batch(node, pending)
+        with self._eos_primed_lock:
+            for command, result in zip(pending, results):
+                if result.rc == 0:
+                    self._eos_primed[(node, command)] = result
+
+    def forget_eos(self) -> None:
+        with self._eos_primed_lock:
+            self._eos_primed.clear()
 
     def eos_cli(self, node: str, command: str) -> CmdResult:
-        container = self.container_name(node)
-        p = subprocess.run(["docker", "exec", container, "Cli", "-c", command], capture_output=True, text=True)
-        first = CmdResult(p.returncode, p.stdout.strip(), p.stderr.strip())
+        with self._eos_primed_lock:
+            primed = self._eos_primed.get((node, command))
+        if primed is not None:
+            return self._record("eos", node, command, primed)
+        with span("adapter", f"eos_cli {node}: {command}", node=node, command=command) as args:
+            result = self._eos_cli(node, command, args)
+            args["rc"] = result.rc
+        return self._record("eos", node, command, result)
+
+    def _eos_enable(self, node: str, command: str) -> CmdResult:
+        script = "cat <<'EOF' | Cli\nenable\n" + command + "\nEOF"
+        return self._exec(node, ["bash", "-lc", script])
+
+    def _eos_cli(self, node: str, command: str, trace: dict) -> CmdResult:
+        family = (node, eos_command_family(command))
+        if family in self._eos_enable_only:
+            trace["style"] = "enable"
+            result = self._eos_enable(node, command)
+            if result.timed_out or _enable_worked(result):
+                return result
+            # No longer true for this node (e.g. redeployed with other AAA); learn it again below.
+            self._eos_enable_only.discard(family)
 
-        combined = (first.stdout + "\n" + first.stderr).lower()
-        needs_enable = "privileged mode required" in combined or "% invalid input" in combined
-        if not needs_enable:
+        first = self._exec(node, ["Cli", "-c", command])
+        if first.timed_out or not _needs_enable(first):
             return first
 
         # Retry via interactive CLI flow with enable mode.
-        script = "cat <<'EOF' | Cli\nenable\n" + command + "\nEOF"
-        p2 = subprocess.run(["docker", "exec", container, "bash", "-lc", script], capture_output=True, text=True)
-        second = CmdResult(p2.returncode, p2.stdout.strip(), p2.stderr.strip())
-
-        second_combined = (second.stdout + "\n" + second.stderr).lower()
-        if second.rc == 0 and "privileged mode required" not in second_combined:
+        trace["enable_retry"] = True
+        second = self._eos_enable(node, command)
+        if _enable_worked(second):
+            self._eos_enable_only.add(family)
             return second
         return first
 
@@ -61,12 +197,15 @@ class ContainerlabAdapter:
         return list(self.nodes)
 
     def get_mgmt_ip(self, node: str) -> str | None:
-        p = subprocess.run(
-            ["docker", "inspect", "-f", "{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}", self.container_name(node)],
-            capture_output=True,
-            text=True,
-        )
-        if p.returncode != 0:
+        try:
+            info = self.backend.inspect(self.container_name(node), timeout=self.exec_timeout)
+        except TimeoutError:
+            return None
+        if not info:
             return None
-        ip = p.stdout.strip()
+        networks = (info.get("NetworkSettings") or {}).get("Networks") or {}
+        ip = "".join(str(n.get("IPAddress") or "") for n in networks.values())
         return ip if ip else None
+
+    def close(self) -> None:
+        self.backend.close()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import struct
+import threading
+from urllib.parse import quote
+
+from netlab.adapters.base import DEFAULT_SOCKET, TIMEOUT_RC, CmdResult
+from netlab.core.errors import DockerApiError, DockerApiTimeout
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float | None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class _ConnectionPool:
+    def __init__(self, socket_path: str, size: int, timeout: float | None) -> None:
+        self.socket_path = socket_path
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle: list[_UnixHTTPConnection] = []
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def acquire(self, fresh: bool = False) -> tuple[_UnixHTTPConnection, bool]:
+        with self._lock:
+            if self._idle and not fresh:
+                return self._idle.pop(), True
+            self.opened += 1
+        return _UnixHTTPConnection(self.socket_path, self.timeout), False
+
+    def release(self, conn: _UnixHTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def demux_stream(raw: bytes) -> tuple[bytes, bytes]:
+    # Non-TTY exec output is framed: [stream, 0, 0, 0, size(4, big endian)] + payload.
+    stdout = bytearray()
+    stderr = bytearray()
+    pos = 0
+    while pos + 8 <= len(raw):
+        stream, size = struct.unpack(">BxxxL", raw[pos : pos + 8])
+        chunk = raw[pos + 8 : pos + 8 + size]
+        pos += 8 + size
+        if stream == 2:
+            stderr.extend(chunk)
+        else:
+            stdout.extend(chunk)
+    return bytes(stdout), bytes(stderr)
+
+
+class DockerApiBackend:
+    name = "api"
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, pool_size: int = 8, timeout: float | None = None) -> None:
+        self.pool = _ConnectionPool(socket_path, pool_size, timeout)
+
+    def _request(
+        self, method: str, path: str, body: dict | None = None, timeout: float | None = None
+    ) -> tuple[int, bytes]:
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        for attempt in range(2):
+            conn, reused = self.pool.acquire(fresh=attempt > 0)
+            if timeout is not None:
+                # Bounds each socket wait of this request, so a silent exec stream cannot hang the run.
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except TimeoutError as exc:
+                conn.close()
+                raise DockerApiTimeout(f"{method} {path}: timed out after {timeout:g}s") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                # The daemon may have dropped an idle keep-alive connection; retry once on a new one.
+                if reused and attempt == 0:
+                    continue
+                raise DockerApiError(f"{method} {path}: {exc}") from exc
+            if timeout is not None and not resp.will_close:
+                conn.timeout = self.pool.timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(self.pool.timeout)
+            self.pool.release(conn, reusable=not resp.will_close)
+            return resp.status, data
+        raise DockerApiError(f"{method} {path}: no connection available")
+
+    def _json(
+        self,
+        method: str,
+        path: str,
+        body: dict | None = None,
+        expect: tuple[int, ...] = (200,),
+        timeout: float | None = None,
+    ) -> dict:
+        status, data = self._request(method, path, body, timeout)
+        if status not in expect:
+            raise DockerApiError(f"{method} {path}: HTTP {status} {data[:200]!r}")
+        return json.loads(data) if data else {}
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        try:
+            created = self._json(
+                "POST",
+                f"/containers/{quote(container, safe='')}/exec",
+                {"AttachStdout": True, "AttachStderr": True, "Cmd": argv},
+                expect=(201,),
+                timeout=timeout,
+            )
+            exec_id = str(created["Id"])
+            status, raw = self._request("POST", f"/exec/{exec_id}/start", {"Detach": False, "Tty": False}, timeout)
+            if status != 200:
+                return CmdResult(1, "", f"exec start failed: HTTP {status} {raw[:200]!r}")
+            info = self._json("GET", f"/exec/{exec_id}/json", timeout=timeout)
+        except DockerApiTimeout as exc:
+            return CmdResult(TIMEOUT_RC, "", str(exc), timed_out=True)
+        except (DockerApiError, KeyError, ValueError) as exc:
+            return CmdResult(1, "", str(exc))
+
+        stdout, stderr = demux_stream(raw)
+        rc = info.get("ExitCode")
+        return CmdResult(int(rc) if rc is not None else 1, stdout.decode("utf-8", "replace").strip(), stderr.decode("utf-8", "replace").strip())
+
+    def inspect(self, container: str, timeout: float | None = None) -> dict | None:
+        try:
+            status, data = self._request("GET", f"/containers/{quote(container, safe='')}/json", timeout=timeout)
+        except DockerApiTimeout:
+            raise
+        except DockerApiError:
+            return None
+        if status != 200:
+            return None
+        return json.loads(data)
+
+    def close(self) -> None:
+        self.pool.close()
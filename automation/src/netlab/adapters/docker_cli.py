@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import subprocess
+
+from netlab.adapters.base import TIMEOUT_RC, CmdResult
+
+
+def _text(value: str | bytes | None) -> str:
+    # TimeoutExpired carries whatever was captured, as bytes even in text mode.
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return value or ""
+
+
+class DockerCliBackend:
+    name = "cli"
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        try:
+            p = subprocess.run(["docker", "exec", container, *argv], capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired as exc:
+            # Only the docker client is killed; the process in the container may linger.
+            return CmdResult(TIMEOUT_RC, _text(exc.stdout).strip(), f"timed out after {timeout:g}s", timed_out=True)
+        return CmdResult(p.returncode, p.stdout.strip(), p.stderr.strip())
+
+    def inspect(self, container: str, timeout: float | None = None) -> dict | None:
+        """Container details, None if docker does not know it; raises TimeoutError past ``timeout``."""
+        try:
+            p = subprocess.run(["docker", "inspect", container], capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired as exc:
+            raise TimeoutError(f"docker inspect timed out after {timeout:g}s") from exc
+        if p.returncode != 0:
+            return None
+        try:
+            data = json.loads(p.stdout)
+        except json.JSONDecodeError:
+            return None
+        return data[0] if isinstance(data, list) and data else None
+
+    def close(self) -> None:
+        return None
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from netlab.adapters.base import CmdResult
+
+# Docker-level errors (as opposed to the command itself exiting non-zero, e.g. a ping with loss).
+_EXEC_ERRORS = (
+    "error response from daemon",
+    "no such container",
+    "is not running",
+    "cannot connect to the docker daemon",
+    "http 404",
+    "http 409",
+)
+
+
+def exec_failed(result: CmdResult) -> bool:
+    """True when the exec itself did not happen or did not finish, whatever the command would have said."""
+    if result.timed_out:
+        return True
+    stderr = result.stderr.lower()
+    return any(marker in stderr for marker in _EXEC_ERRORS)
+
+
+def container_state(info: dict | None) -> str | None:
+    """Why an inspected container cannot take execs, or None if it is running."""
+    if not info:
+        return "container not found"
+    state = info.get("State") or {}
+    if not state.get("Running", False):
+        return f"container not running ({state.get('Status', 'unknown')})"
+    return None
+
+
+class NodeHealth:
+    """Per-run circuit breaker: once open for a node, execs to it are answered without touching Docker.
+
+    It opens after ``threshold`` consecutive failed execs, or straight away when the inspect probe that
+    follows the first failure shows the container is gone or stopped.
+    """
+
+    def __init__(self, threshold: int = 3, probe: Callable[[str], str | None] | None = None) -> None:
+        self.threshold = threshold
+        self.probe = probe
+        self._failures: dict[str, int] = {}
+        self._probed: set[str] = set()
+        self._open: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def cause(self, node: str) -> str | None:
+        return self._open.get(node)
+
+    def trip(self, node: str, cause: str) -> None:
+        with self._lock:
+            self._open.setdefault(node, cause)
+
+    def record(self, node: str, result: CmdResult) -> None:
+        if not self.enabled:
+            return
+        if not exec_failed(result):
+            with self._lock:
+                self._failures.pop(node, None)
+            return
+        with self._lock:
+            failures = self._failures[node] = self._failures.get(node, 0) + 1
+            probe = self.probe is not None and node not in self._probed
+            self._probed.add(node)
+        if probe:
+            state = self.probe(node)
+            if state is not None:
+                self.trip(node, state)
+                return
+        if failures >= self.threshold:
+            reason = "timed out" if result.timed_out else (result.stderr.splitlines() or ["exec failed"])[0]
+            self.trip(node, f"{failures} consecutive exec failures, last: {reason}")
+
+    def open_nodes(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._open)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._probed.clear()
+            self._open.clear()
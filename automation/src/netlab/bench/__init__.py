@@ -0,0 +1 @@
+DEFAULT_SCALES = (100, 250, 500, 1000)
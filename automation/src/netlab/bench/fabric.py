@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import ipaddress
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+from netlab.adapters.base import CmdResult
+from netlab.adapters.replay import Recording
+from netlab.evidence.collectors.eos import bgp_oc, evpn_cli, interfaces_oc, running_config_cli
+from netlab.evidence.collectors.linux.host_net import ping_many
+
+_P2P_BASE = ipaddress.ip_address("10.0.0.0")
+_LOOPBACK_BASE = ipaddress.ip_address("10.254.0.0")
+_HOST_BASE = ipaddress.ip_address("192.168.0.0")
+_PING_OK = (
+    "2 packets transmitted, 2 received, 0% packet loss, time 1001ms\n"
+    "rtt min/avg/max/mdev = 0.101/0.150/0.199/0.049 ms"
+)
+
+
+@dataclass(slots=True)
+class Fabric:
+    lab: str
+    spines: list[str]
+    leaves: list[str]
+    hosts: list[str]
+    configs: dict[str, str] = field(default_factory=dict)
+    recording: Recording | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.spines) + len(self.leaves)
+
+
+class _PingScript:
+    # Stands in for a container: answers ping_many scripts with one successful ping per target.
+    def __init__(self, recording: Recording, count: int) -> None:
+        self.recording = recording
+        self.count = count
+
+    def exec(self, node: str, cmd: str) -> CmdResult:
+        body = "\n".join(f"@@NETLAB-PING {i} 0\n{_PING_OK}" for i in range(self.count))
+        result = CmdResult(0, body, "")
+        self.recording.add("exec", node, cmd, result)
+        return result
+
+
+def _link(spine: int, leaf: int, spines: int) -> tuple[str, str]:
+    base = int(_P2P_BASE) + 2 * (leaf * spines + spine)
+    return str(ipaddress.ip_address(base)), str(ipaddress.ip_address(base + 1))
+
+
+def _config(name: str, asn: int, loopback: str, links: list[tuple[str, str, str]], leaf: bool) -> str:
+    lines = [f"hostname {name}", "!", "ip routing", "!"]
+    lines += ["interface Loopback0", f"   ip address {loopback}/32", "!"]
+    for idx, (peer, local_ip, _) in enumerate(links, start=1):
+        lines += [f"interface Ethernet{idx}", f"   description to-{peer}", "   no switchport", f"   ip address {local_ip}/31", "!"]
+    if leaf:
+        lines += ["interface Vxlan1", "   vxlan source-interface Loopback0", "   vxlan vlan 10 vni 10100", "!"]
+    lines += [f"router bgp {asn}", f"   router-id {loopback}"]
+    for _, _, peer_ip in links:
+        lines.append(f"   neighbor {peer_ip} remote-as {65000 if leaf else 65100}")
+    lines += ["!", "end"]
+    return "\n".join(lines) + "\n"
+
+
+def _interfaces(links: list[tuple[str, str, str]]) -> str:
+    rows = ["Interface                      Status         Protocol           Description"]
+    rows += [f"Et{idx:<29}up             up                 to-{peer}" for idx, (peer, _, _) in enumerate(links, start=1)]
+    rows.append("Lo0                            up             up")
+    return "\n".join(rows)
+
+
+def _interfaces_json(links: list[tuple[str, str, str]]) -> str:
+    items = {
+        f"Ethernet{idx}": {"interfaceStatus": "up", "lineProtocolStatus": "up", "description": f"to-{peer}"}
+        for idx, (peer, _, _) in enumerate(links, start=1)
+    }
+    items["Loopback0"] = {"interfaceStatus": "up", "lineProtocolStatus": "up", "description": ""}
+    return json.dumps({"interfaceDescriptions": items})
+
+
+def _bgp_summary_json(links: list[tuple[str, str, str]], asn: int) -> str:
+    peers = {peer_ip: {"peerState": "Established", "asn": str(asn)} for _, _, peer_ip in links}
+    return json.dumps({"vrfs": {"default": {"peers": peers}}})
+
+
+def _bgp_summary(links: list[tuple[str, str, str]], asn: int) -> str:
+    rows = ["BGP summary information for VRF default", "  Neighbor         V  AS      MsgRcvd  MsgSent  State"]
+    rows += [f"  {peer_ip:<16} 4  {asn:<7} 120      118      Established" for _, _, peer_ip in links]
+    return "\n".join(rows)
+
+
+def _evpn_routes(idx: int, loopback: str) -> str:
+    return "\n".join(
+        [
+            "BGP routing table information for VRF default",
+            f" * >      RD: {loopback}:10100 mac-ip 0000.{idx:04x}.0001",
+            f" * >      RD: {loopback}:10000 ip-prefix 192.168.10.0/24",
+        ]
+    )
+
+
+def build_fabric(lab: str, nodes: int, hosts: int = 4) -> Fabric:
+    """Spine/leaf fabric of ``nodes`` EOS switches (about 1 spine per 25 leaves) plus Linux hosts."""
+    spine_count = max(2, nodes // 26)
+    leaf_count = max(1, nodes - spine_count)
+    spines = [f"spine{i + 1}" for i in range(spine_count)]
+    leaves = [f"leaf{i + 1}" for i in range(leaf_count)]
+    host_names = [f"host{i + 1}" for i in range(hosts)]
+    kinds = {n: "arista_ceos" for n in spines + leaves}
+    kinds.update({h: "linux" for h in host_names})
+    fabric = Fabric(lab, spines, leaves, host_names, recording=Recording(lab, kinds))
+    rec = fabric.recording
+
+    links: dict[str, list[tuple[str, str, str]]] = {n: [] for n in spines + leaves}
+    for li, leaf in enumerate(leaves):
+        for si, spine in enumerate(spines):
+            spine_ip, leaf_ip = _link(si, li, spine_count)
+            links[spine].append((leaf, spine_ip, leaf_ip))
+            links[leaf].append((spine, leaf_ip, spine_ip))
+
+    for idx, node in enumerate(spines + leaves):
+        leaf = node in leaves
+        asn = 65100 + idx if leaf else 65000
+        loopback = str(ipaddress.ip_address(int(_LOOPBACK_BASE) + idx + 1))
+        config = _config(node, asn, loopback, links[node], leaf)
+        fabric.configs[node] = config
+        peer_asn = 65000 if leaf else 65100
+        rec.add("eos", node, interfaces_oc.COMMAND, CmdResult(0, _interfaces(links[node]), ""))
+        rec.add("eos", node, bgp_oc.COMMAND, CmdResult(0, _bgp_summary(links[node], peer_asn), ""))
+        rec.add("eos", node, interfaces_oc.EOS_JSON.cli, CmdResult(0, _interfaces_json(links[node]), ""))
+        rec.add("eos", node, bgp_oc.EOS_JSON.cli, CmdResult(0, _bgp_summary_json(links[node], peer_asn), ""))
+        rec.add("eos", node, evpn_cli.ROUTES_COMMAND, CmdResult(0, _evpn_routes(idx, loopback) if leaf else "", ""))
+        rec.add("eos", node, running_config_cli.COMMAND, CmdResult(0, config, ""))
+
+    host_ips = [str(ipaddress.ip_address(int(_HOST_BASE) + 10 + i)) for i in range(hosts)]
+    for host, own in zip(host_names, host_ips):
+        targets = [ip for ip in host_ips if ip != own]
+        ping_many(_PingScript(rec, len(targets)), host, targets)
+    return fabric
+
+
+def write_fabric(root: Path, fabric: Fabric) -> Path:
+    """Write intent, configs and the command recording for ``fabric`` under ``root``; returns the recording path."""
+    lab_dir = root / fabric.lab
+    (lab_dir / "intent").mkdir(parents=True, exist_ok=True)
+    (lab_dir / "configs").mkdir(parents=True, exist_ok=True)
+    for node, config in fabric.configs.items():
+        (lab_dir / "configs" / f"{node}.cfg").write_text(config, encoding="utf-8")
+
+    nodes = {n: {"kind": "arista_ceos", "roles": ["eos", "spine"]} for n in fabric.spines}
+    nodes.update({n: {"kind": "arista_ceos", "roles": ["eos", "leaf"]} for n in fabric.leaves})
+    nodes.update({h: {"kind": "linux", "roles": ["host"]} for h in fabric.hosts})
+    host_ips = [str(ipaddress.ip_address(int(_HOST_BASE) + 10 + i)) for i in range(len(fabric.hosts))]
+    intent = {
+        "version": 1,
+        "inventory": {"nodes": nodes},
+        "services": {"tenant": {"vlan10": {"vni": 10100}, "l3": {"vni": 10000}}},
+        "checks": [
+            {"name": "intent-vni-distinct", "phase": "intent", "kind": "intent_distinct",
+             "params": {"paths": ["services.tenant.vlan10.vni", "services.tenant.l3.vni"]}},
+            {"name": "intent-leaf-vxlan", "phase": "intent", "kind": "config_contains",
+             "params": {"selector": {"role": "leaf"}, "required": ["interface Vxlan1"]}},
+            {"name": "underlay-interfaces", "phase": "underlay", "kind": "interfaces_up",
+             "params": {"selector": {"role": "eos"}, "required_description_regex": ["^to-"]}},
+            {"name": "underlay-bgp", "phase": "underlay", "kind": "bgp_established",
+             "params": {"selector": {"role": "eos"}, "min_total": 1}},
+            {"name": "evpn-routes", "phase": "control-plane", "kind": "evpn_routes_present",
+             "params": {"selector": {"role": "leaf"}, "min_routes": [{"type": "mac-ip", "vni": 10100, "count": 1}]}},
+            {"name": "host-reachability", "phase": "dataplane", "kind": "ping_targets",
+             "params": {"probes": [
+                 {"source": h, "targets": [ip for ip in host_ips if ip != own]}
+                 for h, own in zip(fabric.hosts, host_ips)
+             ]}},
+        ],
+    }
+    (lab_dir / "intent" / "intent.yml").write_text(yaml.safe_dump(intent, sort_keys=False), encoding="utf-8")
+    path = root / "recordings" / f"{fabric.lab}.json"
+    fabric.recording.save(path)
+    return path
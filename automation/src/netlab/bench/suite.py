@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from netlab.adapters.replay import Recording, ReplayAdapter
+from netlab.bench import DEFAULT_SCALES
+from netlab.bench.fabric import build_fabric, write_fabric
+from netlab.core.model import ValidationContext
+from netlab.core.results import RunSummary
+from netlab.drift.baseline import collect_baseline
+from netlab.drift.diff import diff_dict, diff_fingerprints
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.compiler import clear_compiled_plans
+from netlab.intent.loader import load_intent
+from netlab.render.report_json import write_json_report
+from netlab.render.report_md import write_markdown_report
+from netlab.validators.engine import run_checks
+
+
+def _best(fn: Callable[[], object], repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    out: object = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, out
+
+
+def replay_context(root: Path, lab: str, recording: Recording | Path) -> ValidationContext:
+    # A path keeps the call picklable, for sharded runs where every worker loads its own copy.
+    if not isinstance(recording, Recording):
+        recording = Recording.load(recording)
+    adapter = ReplayAdapter(root, lab, recording)
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    return ValidationContext(lab=lab, profile="fast", intent=load_intent(root, lab), adapter=adapter, evidence_client=client)
+
+
+def bench_scale(root: Path, nodes: int, repeat: int = 3, jobs: int = 1) -> dict:
+    """Time the hot paths against a synthetic fabric of ``nodes`` switches; best of ``repeat`` in seconds."""
+    lab = f"synthetic-{nodes}"
+    fabric = build_fabric(lab, nodes)
+    recording = Recording.load(write_fabric(root, fabric))
+    timings: dict[str, float] = {}
+
+    def _load():
+        clear_compiled_plans()
+        return load_intent(root, lab)
+
+    timings["load_intent"], _ = _best(_load, repeat)
+    # Fresh context per run so evidence is recollected (from the recording) every time.
+    timings["run_checks"], results = _best(lambda: run_checks(replay_context(root, lab, recording), "all", jobs=jobs), repeat)
+    timings["collect_baseline"], old = _best(lambda: collect_baseline(replay_context(root, lab, recording), jobs=jobs), repeat)
+
+    new = dict(old, fingerprints=dict(old["fingerprints"]))
+    first = fabric.leaves[0]
+    new["fingerprints"][first] = dict(new["fingerprints"][first], hash="changed")
+    timings["diff_dict"], diffs = _best(lambda: diff_dict(old, new), repeat)
+    timings["diff_fingerprints"], _ = _best(lambda: diff_fingerprints(old["fingerprints"], new["fingerprints"]), repeat)
+
+    payload = RunSummary(results=list(results)).to_dict()
+    timings["write_json_report"], _ = _best(lambda: write_json_report(payload, root / "out" / f"{lab}.json"), repeat)
+    timings["write_markdown_report"], _ = _best(lambda: write_markdown_report(payload, root / "out" / f"{lab}.md"), repeat)
+
+    return {
+        "nodes": fabric.size,
+        "hosts": len(fabric.hosts),
+        "results": len(results),
+        "exit_code": payload["summary"]["exit_code"],
+        "diffs": len(diffs),
+        "seconds": timings,
+    }
+
+
+def run_suite(scales: tuple[int, ...] = DEFAULT_SCALES, repeat: int = 3, jobs: int = 1, workdir: Path | None = None) -> list[dict]:
+    if workdir is not None:
+        return [bench_scale(workdir, n, repeat, jobs) for n in scales]
+    with tempfile.TemporaryDirectory(prefix="netlab-bench-") as tmp:
+        return [bench_scale(Path(tmp), n, repeat, jobs) for n in scales]
+
+
+def format_table(rows: list[dict]) -> list[str]:
+    if not rows:
+        return []
+    names = list(rows[0]["seconds"])
+    lines = ["nodes  " + "  ".join(f"{n:>21}" for n in names)]
+    for row in rows:
+        lines.append(f"{row['nodes']:>5}  " + "  ".join(f"{row['seconds'][n] * 1000:>19.1f}ms" for n in names))
+    return lines
@@ -1,84 +1,491 @@
 from __future__ import annotations
 
 import json
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import typer
 
-from netlab.adapters.containerlab import ContainerlabAdapter
-from netlab.core.logging import configure_logging
-from netlab.core.model import CheckResult, CheckStatus, Severity, ValidationContext
-from netlab.core.results import RunSummary
-from netlab.drift.baseline import collect_baseline
-from netlab.drift.config_drift import compute_config_drift
-from netlab.drift.diff import diff_dict
-from netlab.evidence.cli import CliTransport
-from netlab.evidence.client import EvidenceClient
-from netlab.evidence.gnmi import GnmiTransport
-from netlab.intent.loader import load_intent
-from netlab.render.report_json import write_json_report
-from netlab.render.report_md import write_markdown_report
-from netlab.validators.engine import run_checks
+from netlab.adapters.base import DEFAULT_SOCKET
+from netlab.bench import DEFAULT_SCALES
+
+# Subcommands import what they use when they run, so `netlab --help` and short
+# commands do not pay for the engine, collectors, gNMI or report renderers.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from netlab.core.model import CheckResult, ValidationContext
+    from netlab.core.results import RunSummary
 
 app = typer.Typer(add_completion=False)
+evidence_app = typer.Typer(add_completion=False, help="Inspect stored evidence")
+app.add_typer(evidence_app, name="evidence")
+
+JOBS_OPTION = typer.Option(1, "--jobs", "-j", min=1, help="Number of nodes/check units worked on in parallel")
+EOS_BATCH_OPTION = typer.Option(False, "--eos-batch", help="Run all EOS commands for a node in one Cli session")
+DOCKER_BACKEND_OPTION = typer.Option("cli", "--docker-backend", help="Container exec transport: cli|api")
+DOCKER_SOCKET_OPTION = typer.Option(DEFAULT_SOCKET, "--docker-socket", help="Docker Engine API socket for --docker-backend api")
+GNMI_OPTION = typer.Option(True, "--gnmi/--no-gnmi", help="Try gNMI before CLI scraping (needs the gnmi extra)")
+CACHE_OPTION = typer.Option(False, "--cache/--no-cache", help="Reuse fresh evidence from the on-disk cache (off by default)")
+REFRESH_OPTION = typer.Option(False, "--refresh", help="Ignore cached evidence and recollect (cache is still updated)")
+CACHE_TTL_OPTION = typer.Option(60.0, "--cache-ttl", min=0, help="Seconds cached evidence stays fresh")
+CACHE_DIR_OPTION = typer.Option(Path("artifacts/.cache/evidence"), "--cache-dir")
+RECORD_OPTION = typer.Option(None, "--record", help="Save every command output to <dir>/<lab>.json for --replay")
+REPLAY_OPTION = typer.Option(None, "--replay", help="Serve command outputs from <dir>/<lab>.json instead of containers")
+BLOB_DIR_OPTION = typer.Option(
+    None, "--blob-dir", help="Keep long raw command output in a content-addressed store here (off by default)"
+)
+EXEC_TIMEOUT_OPTION = typer.Option(
+    30.0, "--exec-timeout", min=0, help="Seconds before a container exec is abandoned and reported as TIMEOUT (0 = no limit)"
+)
+BREAKER_OPTION = typer.Option(
+    3, "--breaker-threshold", min=0, help="Consecutive failed execs before a node is treated as unreachable (0 = never)"
+)
+TRACE_OUT_OPTION = typer.Option(None, "--trace-out", help="Write timing spans as Chrome trace-event JSON")
+TRACE_TOP_OPTION = typer.Option(10, "--trace-top", min=0, help="Slowest spans to print with --trace-out")
+
+
+@dataclass(slots=True)
+class RunOptions:
+    eos_batch: bool = False
+    docker_backend: str = "cli"
+    docker_socket: str = DEFAULT_SOCKET
+    gnmi: bool = True
+    cache: bool = False
+    refresh: bool = False
+    cache_ttl: float = 60.0
+    cache_dir: Path = Path("artifacts/.cache/evidence")
+    record: Path | None = None
+    replay: Path | None = None
+    blob_dir: Path | None = None
+    exec_timeout: float = 30.0
+    breaker_threshold: int = 3
 
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
-def _ctx(lab: str, profile: str) -> ValidationContext:
+def _backend(name: str, socket_path: str):
+    if name == "cli":
+        from netlab.adapters.docker_cli import DockerCliBackend
+
+        return DockerCliBackend()
+    if name == "api":
+        from netlab.adapters.docker_api import DockerApiBackend
+
+        return DockerApiBackend(socket_path)
+    raise typer.BadParameter("docker backend must be cli|api")
+
+
+def _ctx(lab: str, profile: str, opts: RunOptions | None = None) -> ValidationContext:
+    from netlab.adapters.replay import Recording, ReplayAdapter
+    from netlab.core.model import ValidationContext
+    from netlab.evidence.cli import CliTransport
+    from netlab.evidence.client import EvidenceClient
+    from netlab.evidence.gnmi import GnmiTransport
+    from netlab.intent.loader import load_intent
+
+    opts = opts or RunOptions()
     root = _repo_root()
     intent = load_intent(root, lab)
-    adapter = ContainerlabAdapter(root, lab)
-    evidence = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    if opts.replay is not None:
+        # Recordings are the only source: no gNMI, no disk cache.
+        adapter = ReplayAdapter(root, lab, Recording.load(opts.replay / f"{lab}.json"))
+        evidence = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+        return ValidationContext(lab=lab, profile=profile, intent=intent, adapter=adapter, evidence_client=evidence)
+    from netlab.adapters.containerlab import ContainerlabAdapter
+    from netlab.evidence.blobs import BlobStore
+    from netlab.evidence.cache import DiskEvidenceCache
+
+    adapter = ContainerlabAdapter(
+        root,
+        lab,
+        eos_batch=opts.eos_batch,
+        backend=_backend(opts.docker_backend, opts.docker_socket),
+        record=opts.record is not None,
+        exec_timeout=opts.exec_timeout or None,
+        breaker_threshold=opts.breaker_threshold,
+    )
+    transport = GnmiTransport(intent.gnmi, resolve_target=adapter.get_mgmt_ip) if opts.gnmi else GnmiTransport()
+    # A recording must capture every command, so cached evidence is not reused.
+    disk_cache = DiskEvidenceCache(opts.cache_dir, lab, ttl=opts.cache_ttl) if opts.cache and opts.record is None else None
+    blobs = BlobStore(opts.blob_dir) if opts.blob_dir is not None else None
+    evidence = EvidenceClient(
+        gnmi=transport, cli=CliTransport(adapter), disk_cache=disk_cache, refresh=opts.refresh, blobs=blobs
+    )
     return ValidationContext(lab=lab, profile=profile, intent=intent, adapter=adapter, evidence_client=evidence)
 
 
-def _print_console(summary: RunSummary) -> None:
+def _shard_ctx(lab: str, profile: str, opts: RunOptions, yaml_cache: Path | None) -> ValidationContext:
+    # Runs in each shard worker process, which starts without the parent's global options.
+    from netlab.utils.yaml import set_yaml_cache
+
+    set_yaml_cache(yaml_cache)
+    return _ctx(lab, profile, opts)
+
+
+def _run_sharded(
+    lab: str,
+    profile: str,
+    opts: RunOptions,
+    mode: str,
+    jobs: int,
+    node_concurrency: int,
+    shards: int,
+    shard_by: str,
+    max_failures: int = 0,
+    sink: Callable[[int, list[CheckResult]], None] | None = None,
+) -> list[CheckResult]:
+    from functools import partial
+
+    from netlab.utils.yaml import yaml_cache_dir
+    from netlab.validators.sharding import run_sharded
+
+    factory = partial(_shard_ctx, lab, profile, opts, yaml_cache_dir())
+    return run_sharded(
+        factory, mode, shards, by=shard_by, jobs=jobs, per_node=node_concurrency, sink=sink, max_failures=max_failures
+    )
+
+
+def _save_recording(ctx: ValidationContext, opts: RunOptions) -> None:
+    from netlab.adapters.replay import ReplayAdapter
+
+    recording = getattr(ctx.adapter, "recording", None)
+    if opts.record is not None and recording is not None and not isinstance(ctx.adapter, ReplayAdapter):
+        recording.save(opts.record / f"{ctx.lab}.json")
+
+
+def _start_trace(trace_out: Path | None) -> None:
+    if trace_out is not None:
+        from netlab.core.tracing import start_tracing
+
+        start_tracing()
+
+
+def _finish_trace(trace_out: Path | None, top: int) -> None:
+    from netlab.core.tracing import stop_tracing
+
+    tracer = stop_tracing()
+    if tracer is None or trace_out is None:
+        return
+    tracer.write(trace_out)
+    typer.echo(f"Trace written: {trace_out} ({len(tracer.events)} spans)")
+    for title, cats in (("Slowest commands", {"adapter", "parse"}), ("Slowest checks", {"check"})):
+        slowest = tracer.slowest(top, cats)
+        if slowest:
+            typer.echo(f"{title}:")
+        for event in slowest:
+            typer.echo(f"  {event.dur_ns / 1e6:9.1f}ms  {event.name}")
+
+
+def _echo_result(result: CheckResult, prefix: str = "") -> None:
+    typer.echo(f"{prefix}[{result.phase}] {result.status.value:4} {result.name} - {result.message}")
+
+
+def _print_console(summary: RunSummary, prefix: str = "") -> None:
     for result in summary.results:
-        typer.echo(f"[{result.phase}] {result.status.value:4} {result.name} - {result.message}")
-    typer.echo(f"Exit code: {summary.exit_code}")
+        _echo_result(result, prefix)
+    typer.echo(f"{prefix}Exit code: {summary.exit_code}")
+
+
+def _lab_report_path(combined: Path | None, lab: str, ext: str) -> Path:
+    # Per-lab reports sit next to an explicit combined report: out/run.json -> out/run-<lab>.json.
+    if combined is None:
+        return Path("artifacts") / f"{lab}-validate.{ext}"
+    return combined.with_name(f"{combined.stem}-{lab}{combined.suffix}")
 
 
 def _normalized_baseline(payload: dict) -> dict:
     # Exclude volatile fields that are expected to change on every run.
     normalized = dict(payload)
     normalized.pop("timestamp", None)
+    # Fingerprints are compared as hash trees by diff_fingerprints.
+    normalized.pop("fingerprints", None)
     return normalized
 
 
-def _run_validate(ctx: ValidationContext, mode: str) -> RunSummary:
+def _run_validate(
+    ctx: ValidationContext,
+    mode: str,
+    jobs: int = 1,
+    node_concurrency: int = 1,
+    pool: Executor | None = None,
+    max_failures: int = 0,
+) -> RunSummary:
+    from netlab.core.results import RunSummary
+    from netlab.validators.engine import run_checks
+
     summary = RunSummary()
-    for result in run_checks(ctx, mode):
+    for result in run_checks(ctx, mode, jobs=jobs, per_node=node_concurrency, pool=pool, max_failures=max_failures):
         summary.add(result)
     return summary
 
 
+def _validate_lab(
+    ctx: ValidationContext,
+    opts: RunOptions,
+    mode: str,
+    jobs: int,
+    node_concurrency: int,
+    pool: Executor | None = None,
+    max_failures: int = 0,
+) -> RunSummary:
+    summary = _run_validate(ctx, mode, jobs, node_concurrency, pool, max_failures)
+    _save_recording(ctx, opts)
+    return summary
+
+
+def _run_validate_labs(
+    labs: list[str],
+    profile: str,
+    opts: RunOptions,
+    mode: str,
+    jobs: int,
+    node_concurrency: int,
+    max_failures: int = 0,
+) -> dict[str, RunSummary]:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # One bounded pool does all device work; per-lab threads only plan and wait on it.
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="netlab-work") as pool:
+        with ThreadPoolExecutor(max_workers=len(labs), thread_name_prefix="netlab-lab") as labs_pool:
+
+            def _one(name: str) -> RunSummary:
+                with _ctx(name, profile, opts) as ctx:
+                    return _validate_lab(ctx, opts, mode, jobs, node_concurrency, pool, max_failures)
+
+            futures = {name: labs_pool.submit(_one, name) for name in labs}
+            return {name: future.result() for name, future in futures.items()}
+
+
+@app.callback()
+def main(
+    yaml_cache: bool = typer.Option(
+        False, "--yaml-cache/--no-yaml-cache", help="Reuse parsed intent/topology YAML (off by default)"
+    ),
+    yaml_cache_dir: Path | None = typer.Option(
+        None, "--yaml-cache-dir", help="Where --yaml-cache keeps entries (default: ~/.cache/netlab/yaml)"
+    ),
+) -> None:
+    from netlab.utils.yaml import default_yaml_cache_dir, set_yaml_cache
+
+    set_yaml_cache((yaml_cache_dir or default_yaml_cache_dir()) if yaml_cache else None)
+
+
 @app.command()
 def validate(
-    lab: str = typer.Option(..., "--lab"),
+    lab: list[str] = typer.Option([], "--lab", help="Lab to validate; repeat for several labs"),
+    all_labs: bool = typer.Option(False, "--all-labs", help="Validate every lab with an intent/intent.yml"),
     mode: str = typer.Option("all", "--mode"),
     profile: str = typer.Option("fast", "--profile"),
-    json_out: Path | None = typer.Option(None, "--json-out"),
-    md_out: Path | None = typer.Option(None, "--md-out"),
+    json_out: Path | None = typer.Option(
+        None, "--json-out", help="Report path; with several labs the combined report, per-lab ones get a -<lab> suffix"
+    ),
+    md_out: Path | None = typer.Option(
+        None, "--md-out", help="Report path; with several labs the combined report, per-lab ones get a -<lab> suffix"
+    ),
+    jobs: int = JOBS_OPTION,
+    node_concurrency: int = typer.Option(1, "--node-concurrency", min=1, help="Max parallel check units per node"),
+    eos_batch: bool = EOS_BATCH_OPTION,
+    docker_backend: str = DOCKER_BACKEND_OPTION,
+    docker_socket: str = DOCKER_SOCKET_OPTION,
+    gnmi: bool = GNMI_OPTION,
+    exec_timeout: float = EXEC_TIMEOUT_OPTION,
+    breaker_threshold: int = BREAKER_OPTION,
+    cache: bool = CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
+    cache_ttl: float = CACHE_TTL_OPTION,
+    cache_dir: Path = CACHE_DIR_OPTION,
+    record: Path | None = RECORD_OPTION,
+    replay: Path | None = REPLAY_OPTION,
+    blob_dir: Path | None = BLOB_DIR_OPTION,
+    trace_out: Path | None = TRACE_OUT_OPTION,
+    trace_top: int = TRACE_TOP_OPTION,
+    ndjson_out: Path | None = typer.Option(
+        None, "--ndjson-out", help="Stream results to this NDJSON file as they complete; reports are rendered from it"
+    ),
+    plan: bool = typer.Option(False, "--plan", help="Print the evidence plan and exit without touching containers"),
+    fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop scheduling checks after the first failure"),
+    max_failures: int = typer.Option(
+        0, "--max-failures", min=0, help="Stop scheduling checks after N failures (0 = no limit)"
+    ),
+    shards: int = typer.Option(
+        0, "--shards", min=0, help="Evaluate checks in N worker processes, partitioned by node (0 = in-process)"
+    ),
+    shard_by: str = typer.Option("hash", "--shard-by", help="Node partitioning for --shards: hash|role|group"),
     verbose: bool = typer.Option(False, "--verbose"),
 ) -> None:
+    from netlab.core.logging import configure_logging
+    from netlab.core.results import RunSummary, combine_summaries
+    from netlab.intent.loader import discover_labs
+    from netlab.render.report_json import write_json_report, write_json_report_from_stream
+    from netlab.render.report_md import write_markdown_report, write_markdown_report_from_stream
+    from netlab.render.report_ndjson import ResultStream
+    from netlab.validators.engine import build_units, plan_evidence, run_checks
+
     configure_logging(verbose)
     if mode == "control_plane":
         mode = "control-plane"
     if mode not in {"intent", "underlay", "control-plane", "dataplane", "all"}:
         raise typer.BadParameter("mode must be intent|underlay|control-plane|dataplane|all")
+    labs = list(dict.fromkeys(discover_labs(_repo_root()) if all_labs else lab))
+    if not labs:
+        raise typer.BadParameter("pass --lab (repeatable) or --all-labs")
+    if ndjson_out is not None and len(labs) > 1:
+        raise typer.BadParameter("--ndjson-out supports a single lab")
+    if fail_fast and not max_failures:
+        max_failures = 1
+    if shards:
+        if len(labs) > 1:
+            raise typer.BadParameter("--shards supports a single lab")
+        if record is not None or trace_out is not None:
+            raise typer.BadParameter("--shards cannot be combined with --record or --trace-out")
+        if shard_by not in {"hash", "role", "group"}:
+            raise typer.BadParameter("shard-by must be hash|role|group")
 
-    ctx = _ctx(lab, profile)
-    summary = _run_validate(ctx, mode)
-    payload = summary.to_dict()
-    _print_console(summary)
+    opts = RunOptions(
+        eos_batch,
+        docker_backend,
+        docker_socket,
+        gnmi,
+        cache,
+        refresh,
+        cache_ttl,
+        cache_dir,
+        record,
+        replay,
+        blob_dir,
+        exec_timeout,
+        breaker_threshold,
+    )
+    if plan:
+        for name in labs:
+            with _ctx(name, profile, opts) as ctx:
+                units = build_units(ctx, mode)
+            if len(labs) > 1:
+                typer.echo(f"== {name}")
+            for line in plan_evidence(units).to_lines():
+                typer.echo(line)
+        raise typer.Exit(code=0)
 
-    out_json = json_out or Path("artifacts") / f"{lab}-validate.json"
-    out_md = md_out or Path("artifacts") / f"{lab}-validate.md"
-    write_json_report(payload, out_json)
-    write_markdown_report(payload, out_md)
+    _start_trace(trace_out)
+    if ndjson_out is not None:
+        ctx = None if shards else _ctx(labs[0], profile, opts)
+        with ResultStream(ndjson_out) as stream:
+
+            def _sink(unit: int, results: list[CheckResult]) -> None:
+                stream.write(results, unit)
+                for result in results:
+                    _echo_result(result)
+
+            if ctx is None:
+                _run_sharded(labs[0], profile, opts, mode, jobs, node_concurrency, shards, shard_by, max_failures, _sink)
+            else:
+                try:
+                    run_checks(ctx, mode, jobs=jobs, per_node=node_concurrency, sink=_sink, max_failures=max_failures)
+                finally:
+                    ctx.close()
+        if ctx is not None:
+            _save_recording(ctx, opts)
+        summary = stream.summary()
+        typer.echo(f"Exit code: {summary['exit_code']}")
+        _finish_trace(trace_out, trace_top)
+
+        write_json_report_from_stream(ndjson_out, summary, json_out or Path("artifacts") / f"{labs[0]}-validate.json")
+        write_markdown_report_from_stream(ndjson_out, summary, md_out or Path("artifacts") / f"{labs[0]}-validate.md")
+        raise typer.Exit(code=summary["exit_code"])
+
+    if len(labs) == 1:
+        if shards:
+            results = _run_sharded(labs[0], profile, opts, mode, jobs, node_concurrency, shards, shard_by, max_failures)
+            summary = RunSummary(results=results)
+        else:
+            with _ctx(labs[0], profile, opts) as ctx:
+                summary = _validate_lab(ctx, opts, mode, jobs, node_concurrency, max_failures=max_failures)
+        payload = summary.to_dict()
+        _print_console(summary)
+        _finish_trace(trace_out, trace_top)
+
+        out_json = json_out or Path("artifacts") / f"{labs[0]}-validate.json"
+        out_md = md_out or Path("artifacts") / f"{labs[0]}-validate.md"
+        write_json_report(payload, out_json)
+        write_markdown_report(payload, out_md)
+        raise typer.Exit(code=summary.exit_code)
+
+    summaries = _run_validate_labs(labs, profile, opts, mode, jobs, node_concurrency, max_failures)
+    _finish_trace(trace_out, trace_top)
+    for name, summary in summaries.items():
+        payload = summary.to_dict()
+        write_json_report(payload, _lab_report_path(json_out, name, "json"))
+        write_markdown_report(payload, _lab_report_path(md_out, name, "md"))
+        _print_console(summary, prefix=f"{name} ")
+
+    combined = combine_summaries(summaries)
+    write_json_report(combined, json_out or Path("artifacts") / "all-labs-validate.json")
+    write_markdown_report(combined, md_out or Path("artifacts") / "all-labs-validate.md")
+    exit_code = combined["summary"]["exit_code"]
+    typer.echo(f"Combined exit code: {exit_code} ({len(labs)} labs)")
+    raise typer.Exit(code=exit_code)
+
+
+@app.command()
+def watch(
+    lab: str = typer.Option(..., "--lab"),
+    interval: float = typer.Option(5.0, "--interval", min=0.5, help="Seconds between evidence polls"),
+    count: int = typer.Option(0, "--count", min=0, help="Stop after N polls (0 = until interrupted)"),
+    mode: str = typer.Option("all", "--mode"),
+    profile: str = typer.Option("fast", "--profile"),
+    jobs: int = JOBS_OPTION,
+    node_concurrency: int = typer.Option(1, "--node-concurrency", min=1, help="Max parallel check units per node"),
+    eos_batch: bool = EOS_BATCH_OPTION,
+    docker_backend: str = DOCKER_BACKEND_OPTION,
+    docker_socket: str = DOCKER_SOCKET_OPTION,
+    gnmi: bool = GNMI_OPTION,
+    exec_timeout: float = EXEC_TIMEOUT_OPTION,
+    breaker_threshold: int = BREAKER_OPTION,
+    verbose: bool = typer.Option(False, "--verbose"),
+) -> None:
+    from netlab.core.logging import configure_logging
+    from netlab.validators.watch import Watcher
+
+    configure_logging(verbose)
+    if mode == "control_plane":
+        mode = "control-plane"
+    if mode not in {"intent", "underlay", "control-plane", "dataplane", "all"}:
+        raise typer.BadParameter("mode must be intent|underlay|control-plane|dataplane|all")
+
+    opts = RunOptions(
+        eos_batch,
+        docker_backend,
+        docker_socket,
+        gnmi,
+        cache=False,
+        exec_timeout=exec_timeout,
+        breaker_threshold=breaker_threshold,
+    )
+    ctx = _ctx(lab, profile, opts)
+    watcher = Watcher(ctx, mode, jobs=jobs, per_node=node_concurrency)
+    try:
+        while True:
+            started = time.monotonic()
+            transitions = watcher.poll()
+            stamp = time.strftime("%H:%M:%S")
+            for transition in transitions:
+                typer.echo(f"{stamp} {transition.to_line()}")
+            if verbose:
+                typer.echo(f"{stamp} poll {watcher.polls}: {watcher.evaluated} units evaluated so far")
+            if count and watcher.polls >= count:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ctx.close()
+    summary = watcher.summary()
+    typer.echo(f"Exit code: {summary.exit_code}")
     raise typer.Exit(code=summary.exit_code)
 
 
@@ -87,9 +494,50 @@ def baseline(
     lab: str = typer.Option(..., "--lab"),
     out: Path = typer.Option(..., "--out"),
     profile: str = typer.Option("fast", "--profile"),
+    jobs: int = JOBS_OPTION,
+    eos_batch: bool = EOS_BATCH_OPTION,
+    docker_backend: str = DOCKER_BACKEND_OPTION,
+    docker_socket: str = DOCKER_SOCKET_OPTION,
+    gnmi: bool = GNMI_OPTION,
+    exec_timeout: float = EXEC_TIMEOUT_OPTION,
+    breaker_threshold: int = BREAKER_OPTION,
+    cache: bool = CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
+    cache_ttl: float = CACHE_TTL_OPTION,
+    cache_dir: Path = CACHE_DIR_OPTION,
+    record: Path | None = RECORD_OPTION,
+    replay: Path | None = REPLAY_OPTION,
+    blob_dir: Path | None = BLOB_DIR_OPTION,
+    trace_out: Path | None = TRACE_OUT_OPTION,
+    trace_top: int = TRACE_TOP_OPTION,
 ) -> None:
-    ctx = _ctx(lab, profile)
-    payload = collect_baseline(ctx)
+    from netlab.drift.baseline import collect_baseline, collection_failures
+
+    _start_trace(trace_out)
+    opts = RunOptions(
+        eos_batch,
+        docker_backend,
+        docker_socket,
+        gnmi,
+        cache,
+        refresh,
+        cache_ttl,
+        cache_dir,
+        record,
+        replay,
+        blob_dir,
+        exec_timeout,
+        breaker_threshold,
+    )
+    with _ctx(lab, profile, opts) as ctx:
+        payload = collect_baseline(ctx, jobs=jobs)
+        _save_recording(ctx, opts)
+    _finish_trace(trace_out, trace_top)
+    failures = collection_failures(payload)
+    if failures:
+        # An outage or a half-collected node must not become the golden state.
+        typer.echo(f"Baseline not written, collection failed for: {', '.join(failures)}", err=True)
+        raise typer.Exit(code=1)
     out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
     typer.echo(f"Baseline saved: {out}")
@@ -102,13 +550,64 @@ def drift(
     json_out: Path | None = typer.Option(None, "--json-out"),
     md_out: Path | None = typer.Option(None, "--md-out"),
     profile: str = typer.Option("fast", "--profile"),
+    jobs: int = JOBS_OPTION,
+    eos_batch: bool = EOS_BATCH_OPTION,
+    docker_backend: str = DOCKER_BACKEND_OPTION,
+    docker_socket: str = DOCKER_SOCKET_OPTION,
+    gnmi: bool = GNMI_OPTION,
+    exec_timeout: float = EXEC_TIMEOUT_OPTION,
+    breaker_threshold: int = BREAKER_OPTION,
+    cache: bool = CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
+    cache_ttl: float = CACHE_TTL_OPTION,
+    cache_dir: Path = CACHE_DIR_OPTION,
+    record: Path | None = RECORD_OPTION,
+    replay: Path | None = REPLAY_OPTION,
+    blob_dir: Path | None = BLOB_DIR_OPTION,
+    trace_out: Path | None = TRACE_OUT_OPTION,
+    trace_top: int = TRACE_TOP_OPTION,
 ) -> None:
+    from netlab.core.model import CheckResult, CheckStatus, Severity
+    from netlab.core.results import RunSummary
+    from netlab.drift.baseline import baseline_plan, collect_baseline, is_legacy_baseline
+    from netlab.drift.config_drift import compute_config_drift
+    from netlab.drift.diff import diff_dict, diff_fingerprints
+    from netlab.evidence.plan import prefetch
+    from netlab.render.report_json import write_json_report
+    from netlab.render.report_md import write_markdown_report
+
     old = json.loads(baseline.read_text(encoding="utf-8"))
-    ctx = _ctx(lab, profile)
-    new = collect_baseline(ctx)
+    if is_legacy_baseline(old):
+        raise typer.BadParameter(
+            f"{baseline} uses the old flat fingerprint format, which cannot be compared; "
+            "re-create it with `netlab baseline`",
+            param_hint="--baseline",
+        )
+    _start_trace(trace_out)
+    opts = RunOptions(
+        eos_batch,
+        docker_backend,
+        docker_socket,
+        gnmi,
+        cache,
+        refresh,
+        cache_ttl,
+        cache_dir,
+        record,
+        replay,
+        blob_dir,
+        exec_timeout,
+        breaker_threshold,
+    )
+    with _ctx(lab, profile, opts) as ctx:
+        prefetch(ctx.evidence_client, ctx.adapter, baseline_plan(ctx, ("running-config",)), jobs=jobs)
+        new = collect_baseline(ctx, jobs=jobs)
+        config_drift = compute_config_drift(ctx)
+        _save_recording(ctx, opts)
 
     state_diffs = diff_dict(_normalized_baseline(old), _normalized_baseline(new))
-    config_drift = compute_config_drift(ctx)
+    state_diffs += diff_fingerprints(old.get("fingerprints", {}), new.get("fingerprints", {}))
+    _finish_trace(trace_out, trace_top)
 
     summary = RunSummary()
     if state_diffs:
@@ -133,5 +632,36 @@ def drift(
     raise typer.Exit(code=summary.exit_code)
 
 
+@evidence_app.command("show")
+def evidence_show(
+    digest: str = typer.Argument(..., help="Blob digest (or unique prefix) from a report or evidence payload"),
+    blob_dir: Path = typer.Option(Path("artifacts/blobs"), "--blob-dir", help="Blob store the run wrote to"),
+) -> None:
+    from netlab.evidence.blobs import BlobStore
+
+    matches = BlobStore(blob_dir).resolve(digest)
+    if len(matches) != 1:
+        typer.echo(f"{'No' if not matches else 'Ambiguous'} blob for {digest!r} in {blob_dir}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(BlobStore(blob_dir).get(matches[0]), nl=False)
+
+
+@app.command()
+def bench(
+    nodes: list[int] = typer.Option(list(DEFAULT_SCALES), "--nodes", help="Synthetic fabric size; repeat for several"),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Runs per measurement; the best is reported"),
+    jobs: int = JOBS_OPTION,
+    workdir: Path | None = typer.Option(None, "--workdir", help="Keep generated fabrics here instead of a temp dir"),
+    json_out: Path | None = typer.Option(None, "--json-out"),
+) -> None:
+    from netlab.bench.suite import format_table, run_suite
+    from netlab.render.report_json import write_json_report
+
+    rows = run_suite(tuple(nodes), repeat=repeat, jobs=jobs, workdir=workdir)
+    for line in format_table(rows):
+        typer.echo(line)
+    write_json_report({"benchmarks": rows}, json_out or Path("artifacts") / "bench.json")
+
+
 if __name__ == "__main__":
     app()
@@ -4,3 +4,11 @@ class NetlabError(Exception):
 
 class IntentValidationError(NetlabError):
     """Raised when intent yaml is invalid."""
+
+
+class DockerApiError(NetlabError):
+    """Raised when a Docker Engine API request fails."""
+
+
+class DockerApiTimeout(DockerApiError, TimeoutError):
+    """Raised when a Docker Engine API request exceeds its deadline."""
@@ -10,6 +10,8 @@ class CheckStatus(str, Enum):
     FAIL = "FAIL"
     WARN = "WARN"
     SKIP = "SKIP"
+    # Evidence could not be collected before the exec deadline.
+    TIMEOUT = "TIMEOUT"
 
 
 class Severity(str, Enum):
@@ -28,6 +30,10 @@ class CheckResult:
     evidence: dict[str, Any] = field(default_factory=dict)
     remediation: str | None = None
 
+    @property
+    def fails_run(self) -> bool:
+        return self.status in (CheckStatus.FAIL, CheckStatus.TIMEOUT) and self.severity == Severity.ERROR
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "phase": self.phase,
@@ -47,3 +53,16 @@ class ValidationContext:
     intent: Any
     adapter: Any
     evidence_client: Any
+
+    def close(self) -> None:
+        """Release the adapter's Docker connections and the gNMI channels."""
+        for owner in (self.adapter, getattr(self.evidence_client, "gnmi", None)):
+            close = getattr(owner, "close", None)
+            if close is not None:
+                close()
+
+    def __enter__(self) -> ValidationContext:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
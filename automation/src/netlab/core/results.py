@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-from .model import CheckResult, CheckStatus, Severity
+from .model import CheckResult, CheckStatus
 
 
 @dataclass(slots=True)
@@ -30,7 +30,7 @@ class RunSummary:
 
     @property
     def exit_code(self) -> int:
-        return 1 if any(r.status == CheckStatus.FAIL and r.severity == Severity.ERROR for r in self.results) else 0
+        return 1 if any(r.fails_run for r in self.results) else 0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -41,3 +41,16 @@ class RunSummary:
             },
             "results": [r.to_dict() for r in self.results],
         }
+
+
+def combine_summaries(summaries: dict[str, RunSummary]) -> dict[str, Any]:
+    """Report payload for several labs; result names are prefixed with their lab."""
+    combined = RunSummary()
+    results: list[dict[str, Any]] = []
+    for lab, summary in summaries.items():
+        combined.extend(summary.results)
+        results.extend(dict(r.to_dict(), lab=lab, name=f"{lab}/{r.name}") for r in summary.results)
+    payload = combined.to_dict()
+    payload["results"] = results
+    payload["labs"] = {lab: summary.to_dict()["summary"] for lab, summary in summaries.items()}
+    return payload
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass(slots=True)
+class SpanEvent:
+    cat: str
+    name: str
+    start_ns: int
+    dur_ns: int
+    tid: int
+    args: dict[str, Any]
+
+    def to_chrome(self, origin_ns: int, pid: int) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": (self.start_ns - origin_ns) / 1000,
+            "dur": self.dur_ns / 1000,
+            "pid": pid,
+            "tid": self.tid,
+            "args": self.args,
+        }
+
+
+class Tracer:
+    """Collects timing spans from every thread of a run."""
+
+    def __init__(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self.events: list[SpanEvent] = []
+        self._lock = threading.Lock()
+
+    def add(self, event: SpanEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome(self) -> dict[str, Any]:
+        pid = os.getpid()
+        return {
+            "traceEvents": [e.to_chrome(self.origin_ns, pid) for e in self.events],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome()), encoding="utf-8")
+
+    def slowest(self, n: int = 10, cats: set[str] | None = None) -> list[SpanEvent]:
+        events = [e for e in self.events if cats is None or e.cat in cats]
+        return sorted(events, key=lambda e: e.dur_ns, reverse=True)[:n]
+
+
+_TRACER: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    global _TRACER
+    _TRACER = Tracer()
+    return _TRACER
+
+
+def stop_tracing() -> Tracer | None:
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    return tracer
+
+
+@contextmanager
+def span(cat: str, name: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Time the block when tracing is on; callers may add to the yielded args (e.g. cache outcome)."""
+    tracer = _TRACER
+    if tracer is None:
+        yield args
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield args
+    finally:
+        tracer.add(SpanEvent(cat, name, start, time.perf_counter_ns() - start, threading.get_ident(), args))
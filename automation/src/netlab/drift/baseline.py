@@ -1,19 +1,79 @@
+from typing import Any
+
 from netlab.evidence.collectors.eos.bgp_oc import collect_bgp_summary
 from netlab.evidence.collectors.eos.interfaces_oc import collect_interfaces
+from netlab.evidence.plan import EvidencePlan, prefetch
 from netlab.utils.hashing import sha256_json
 from netlab.utils.time import utc_now_iso
 
 
-def collect_baseline(ctx) -> dict:
+BASELINE_EVIDENCE = ("interfaces", "bgp-summary")
+
+
+def _eos_nodes(ctx) -> list[str]:
+    return [node for node in ctx.adapter.list_nodes() if ctx.adapter.node_kind(node) != "linux"]
+
+
+def baseline_plan(ctx, extra: tuple[str, ...] = ()) -> EvidencePlan:
+    plan = EvidencePlan()
+    for node in _eos_nodes(ctx):
+        plan.add(node, BASELINE_EVIDENCE + extra)
+    return plan
+
+
+def merkle_fingerprint(evidence: dict[str, dict[str, Any]], status: dict[str, str] | None = None) -> dict:
+    """Hash tree for one node: evidence type -> item -> leaf hash, with each branch's collection status."""
+    status = status or {}
+    branches = {}
+    for kind, items in evidence.items():
+        leaves = {name: sha256_json(value) for name, value in items.items()}
+        state = status.get(kind, "ok")
+        # A failed collection never hashes like a healthy one, even when both have no items.
+        digest = sha256_json(leaves) if state == "ok" else sha256_json({"status": state, "items": leaves})
+        branches[kind] = {"hash": digest, "status": state, "items": leaves}
+    root = sha256_json({kind: branch["hash"] for kind, branch in branches.items()})
+    return {"hash": root, "key_count": len(branches), "evidence": branches}
+
+
+def is_legacy_baseline(payload: dict) -> bool:
+    """Flat per-node hashes from before fingerprints were hash trees; they cannot be compared and need re-baselining."""
+    return any("evidence" not in entry for entry in payload.get("fingerprints", {}).values())
+
+
+def collection_status(data: dict) -> str:
+    """"ok", or why a collector's output cannot be trusted as device state."""
+    if data.get("timed_out"):
+        return "timed out"
+    if data.get("unreachable"):
+        return f"unreachable: {data['unreachable']}"
+    if data.get("rc", 1) != 0:
+        return f"rc={data.get('rc')}"
+    return "ok"
+
+
+def collection_failures(payload: dict) -> list[str]:
+    """``node.kind: status`` for every branch of a baseline whose collection failed."""
+    return [
+        f"{node}.{kind}: {branch['status']}"
+        for node, entry in sorted(payload.get("fingerprints", {}).items())
+        for kind, branch in sorted(entry.get("evidence", {}).items())
+        if branch.get("status", "ok") != "ok"
+    ]
+
+
+def collect_baseline(ctx, jobs: int = 1) -> dict:
+    prefetch(ctx.evidence_client, ctx.adapter, baseline_plan(ctx), jobs=jobs)
     fingerprints = {}
-    for node in ctx.adapter.list_nodes():
-        if ctx.adapter.node_kind(node) == "linux":
-            continue
-        payload = {
-            "interfaces": collect_interfaces(ctx.evidence_client, node).get("data", {}),
-            "bgp": collect_bgp_summary(ctx.evidence_client, node).get("data", {}),
-        }
-        fingerprints[node] = {"hash": sha256_json(payload), "key_count": len(payload.keys())}
+    for node in _eos_nodes(ctx):
+        interfaces = collect_interfaces(ctx.evidence_client, node).get("data", {})
+        bgp = collect_bgp_summary(ctx.evidence_client, node).get("data", {})
+        fingerprints[node] = merkle_fingerprint(
+            {
+                "interfaces": {item["interface"]: item for item in interfaces.get("parsed", [])},
+                "bgp": dict(bgp.get("parsed", {}).get("neighbors", {})),
+            },
+            {"interfaces": collection_status(interfaces), "bgp": collection_status(bgp)},
+        )
 
     return {
         "lab": ctx.lab,
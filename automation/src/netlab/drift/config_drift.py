@@ -1,7 +1,7 @@
 from pathlib import Path
 
+from netlab.drift.eos_config import diff_sections, parse_config
 from netlab.evidence.collectors.eos.running_config_cli import collect_running_config
-from netlab.utils.hashing import sha256_text
 
 
 def _is_valid_running_config(raw: str) -> bool:
@@ -26,7 +26,7 @@ def compute_config_drift(ctx) -> list[dict]:
             continue
         desired = desired_path.read_text(encoding="utf-8")
         running_payload = collect_running_config(ctx.evidence_client, node)
-        running = running_payload.get("raw", "")
+        running = ctx.evidence_client.text(running_payload.get("raw", ""))
         running_rc = int(running_payload.get("rc", 1))
 
         if running_rc != 0 or not _is_valid_running_config(running):
@@ -42,14 +42,16 @@ def compute_config_drift(ctx) -> list[dict]:
             )
             continue
 
-        desired_hash = sha256_text(desired)
-        running_hash = sha256_text(running)
-        if desired_hash != running_hash:
+        desired_tree = parse_config(desired)
+        running_tree = parse_config(running)
+        sections = diff_sections(desired_tree, running_tree)
+        if sections:
             drifts.append({
                 "node": node,
-                "desired_hash": desired_hash,
-                "running_hash": running_hash,
-                "desired_lines": len(desired.splitlines()),
-                "running_lines": len(running.splitlines()),
+                "type": "config_drift",
+                "desired_hash": desired_tree.digest,
+                "running_hash": running_tree.digest,
+                "changed_sections": len(sections),
+                "sections": sections,
             })
     return drifts
@@ -18,3 +18,42 @@ def diff_dict(old: dict[str, Any], new: dict[str, Any], prefix: str = "") -> lis
         elif ov != nv:
             out.append({"path": path, "type": "changed", "old": ov, "new": nv})
     return out
+
+
+def _diff_hashes(old: dict[str, Any], new: dict[str, Any], prefix: list[str], descend) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for key in sorted(set(old) | set(new)):
+        # Keys are interface names and neighbor addresses, so paths stay lists rather than dotted strings.
+        path = [*prefix, key]
+        if key not in old:
+            out.append({"path": path, "type": "added"})
+        elif key not in new:
+            out.append({"path": path, "type": "removed"})
+        else:
+            out.extend(descend(old[key], new[key], path))
+    return out
+
+
+def _diff_leaf(old: str, new: str, path: list[str]) -> list[dict[str, Any]]:
+    return [] if old == new else [{"path": path, "type": "changed", "old": old, "new": new}]
+
+
+def _diff_branch(old: dict[str, Any], new: dict[str, Any], path: list[str]) -> list[dict[str, Any]]:
+    if old.get("hash") == new.get("hash"):
+        return []
+    status = new.get("status", "ok")
+    if status != "ok":
+        # Nothing usable was collected; item diffs against an empty branch would be noise.
+        return [{"path": path, "type": "uncollected", "status": status}]
+    return _diff_hashes(old.get("items", {}), new.get("items", {}), path, _diff_leaf)
+
+
+def _diff_node(old: dict[str, Any], new: dict[str, Any], path: list[str]) -> list[dict[str, Any]]:
+    if old.get("hash") == new.get("hash"):
+        return []
+    return _diff_hashes(old["evidence"], new.get("evidence", {}), path, _diff_branch)
+
+
+def diff_fingerprints(old: dict[str, Any], new: dict[str, Any], prefix: str = "fingerprints") -> list[dict[str, Any]]:
+    """Walk Merkle fingerprints, descending only into subtrees whose hashes differ; paths are key lists."""
+    return _diff_hashes(old, new, [prefix], _diff_node)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import difflib
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Lines EOS may render for implicit defaults; they carry no intent.
+DEFAULT_LINES = {"no shutdown", "exit", "end"}
+
+# Top-level sections the platform or containerlab adds on its own. They are
+# ignored when present only in running-config.
+PLATFORM_SECTIONS = [
+    re.compile(p)
+    for p in (
+        r"^interface Management\d",
+        r"^management ",
+        r"^transceiver ",
+        r"^spanning-tree mode ",
+        r"^no aaa root$",
+        r"^aaa ",
+        r"^(no )?ip routing vrf MGMT$",
+        r"^vrf instance MGMT$",
+        r"^ip route vrf MGMT ",
+        r"^ip name-server ",
+        r"^dns domain ",
+        r"^ntp ",
+        r"^daemon ",
+    )
+]
+
+# Sections whose entries are evaluated in order; their children are compared
+# as sequences, so reordered or duplicated entries show up as drift. EOS sorts
+# entries that carry a sequence number by it, so those compare by number.
+ORDERED_SECTIONS = [re.compile(p) for p in (r"^(ipv6|ip) access-list ", r"^(ipv6|ip) prefix-list ")]
+
+_SEQ_RX = re.compile(r"^(?:seq )?(\d+) ")
+
+_SECRET_RX = re.compile(r"\b(secret|password|key)\s+(?:\d+|sha512|7)?\s*\S+")
+_SPACE_RX = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class ConfigSection:
+    line: str
+    # keyed by normalized line so sibling order does not matter, or by
+    # position in ordered sections
+    children: dict[str, ConfigSection] = field(default_factory=dict)
+    digest: str = ""
+    ordered: bool = False
+
+    def ordered_children(self) -> list[ConfigSection]:
+        """Children in evaluation order: by sequence number when every entry has one, else as written."""
+        children = list(self.children.values())
+        if children and all(_SEQ_RX.match(child.line) for child in children):
+            return sorted(children, key=lambda child: int(_SEQ_RX.match(child.line).group(1)))
+        return children
+
+    def count(self) -> int:
+        return 1 + sum(child.count() for child in self.children.values())
+
+    def lines(self, prefix: str = "") -> list[str]:
+        path = f"{prefix} > {self.line}" if prefix else self.line
+        if not self.children:
+            return [path]
+        children = self.ordered_children() if self.ordered else [self.children[k] for k in sorted(self.children)]
+        out: list[str] = []
+        for child in children:
+            out.extend(child.lines(path))
+        return out
+
+
+def normalize_line(line: str) -> str:
+    text = _SPACE_RX.sub(" ", line.strip())
+    # Repo configs carry cleartext secrets, running-config carries hashes.
+    text = _SECRET_RX.sub(lambda m: f"{m.group(1)} <redacted>", text)
+    # EOS adds default roles to usernames in running-config.
+    if text.startswith("username "):
+        text = text.replace(" role network-admin", "")
+    return text
+
+
+def _hash(section: ConfigSection) -> str:
+    for child in section.children.values():
+        _hash(child)
+    h = hashlib.sha256(section.line.encode("utf-8"))
+    if section.ordered:
+        digests = [child.digest for child in section.ordered_children()]
+    else:
+        digests = sorted(child.digest for child in section.children.values())
+    for digest in digests:
+        h.update(b"\n")
+        h.update(digest.encode("ascii"))
+    section.digest = h.hexdigest()
+    return section.digest
+
+
+def parse_config(text: str) -> ConfigSection:
+    """Parse indented EOS config into a section tree with per-section hashes."""
+    root = ConfigSection("")
+    stack: list[tuple[int, ConfigSection]] = [(-1, root)]
+    for raw in text.splitlines():
+        stripped = raw.strip()
+        if not stripped or stripped.startswith("!"):
+            continue
+        key = normalize_line(stripped)
+        if key in DEFAULT_LINES:
+            continue
+        indent = len(raw) - len(raw.lstrip(" "))
+        while stack[-1][0] >= indent:
+            stack.pop()
+        parent = stack[-1][1]
+        if parent.ordered:
+            section = parent.children[str(len(parent.children))] = ConfigSection(key)
+        else:
+            section = parent.children.get(key)
+            if section is None:
+                ordered = any(rx.search(key) for rx in ORDERED_SECTIONS)
+                section = parent.children[key] = ConfigSection(key, ordered=ordered)
+        stack.append((indent, section))
+    _hash(root)
+    return root
+
+
+def _diff_ordered(desired: ConfigSection, running: ConfigSection, prefix: str, missing: list, unexpected: list) -> None:
+    d = desired.ordered_children()
+    r = running.ordered_children()
+    matcher = difflib.SequenceMatcher(None, [c.digest for c in d], [c.digest for c in r], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            for child in d[i1:i2]:
+                missing.extend(child.lines(prefix))
+            for child in r[j1:j2]:
+                unexpected.extend(child.lines(prefix))
+
+
+def _diff_children(desired: ConfigSection, running: ConfigSection, prefix: str, missing: list, unexpected: list) -> None:
+    if desired.ordered:
+        _diff_ordered(desired, running, prefix, missing, unexpected)
+        return
+    for key in sorted(set(desired.children) | set(running.children)):
+        d = desired.children.get(key)
+        r = running.children.get(key)
+        if r is None:
+            missing.extend(d.lines(prefix))
+        elif d is None:
+            unexpected.extend(r.lines(prefix))
+        elif d.digest != r.digest:
+            _diff_children(d, r, f"{prefix} > {key}" if prefix else key, missing, unexpected)
+
+
+def diff_sections(desired: ConfigSection, running: ConfigSection) -> list[dict[str, Any]]:
+    """Compact per-section delta; only subtrees whose hashes differ are visited."""
+    out: list[dict[str, Any]] = []
+    if desired.digest == running.digest:
+        return out
+    for key in sorted(set(desired.children) | set(running.children)):
+        d = desired.children.get(key)
+        r = running.children.get(key)
+        if r is None:
+            out.append({"section": key, "status": "missing", "lines": d.count()})
+        elif d is None:
+            if not any(rx.search(key) for rx in PLATFORM_SECTIONS):
+                out.append({"section": key, "status": "unexpected", "lines": r.count()})
+        elif d.digest != r.digest:
+            missing: list[str] = []
+            unexpected: list[str] = []
+            _diff_children(d, r, "", missing, unexpected)
+            out.append({"section": key, "status": "changed", "missing": missing, "unexpected": unexpected})
+    return out
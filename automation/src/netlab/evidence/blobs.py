@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# Outputs up to this many characters stay inline; longer ones become blob references.
+INLINE_LIMIT = 160
+BLOB_FIELDS = ("raw", "err")
+
+
+class BlobStore:
+    """Content-addressed store of gzip-compressed command outputs, one file per SHA-256 digest."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def put(self, text: str) -> str:
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            return digest
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(data, mtime=0))
+            os.replace(tmp, path)
+        return digest
+
+    def has(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def get(self, digest: str) -> str:
+        return gzip.decompress(self._path(digest).read_bytes()).decode("utf-8")
+
+    def resolve(self, prefix: str) -> list[str]:
+        if len(prefix) < 2:
+            return []
+        return sorted(p.name[:-3] for p in (self.root / prefix[:2]).glob(f"{prefix}*.gz"))
+
+    def ref(self, text: str) -> dict[str, Any]:
+        return {"digest": self.put(text), "bytes": len(text.encode("utf-8")), "preview": text[:INLINE_LIMIT]}
+
+    def externalize(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Copy of an evidence payload with long raw/err strings replaced by blob references."""
+        out = dict(data)
+        for key in BLOB_FIELDS:
+            value = out.get(key)
+            if isinstance(value, str) and len(value) > INLINE_LIMIT:
+                out[key] = self.ref(value)
+        return out
+
+
+def is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and "digest" in value
+
+
+def preview(value: Any) -> Any:
+    """What reports keep of a raw output: a blob reference as-is, long inline text cut to a preview."""
+    if is_ref(value) or not isinstance(value, str) or len(value) <= INLINE_LIMIT:
+        return value
+    return {"bytes": len(value.encode("utf-8")), "preview": value[:INLINE_LIMIT]}
+
+
+def blob_text(blobs: BlobStore | None, value: Any) -> str:
+    """Full text of an inline string or a blob reference."""
+    if is_ref(value):
+        if blobs is None:
+            return str(value.get("preview", ""))
+        return blobs.get(value["digest"])
+    return value if isinstance(value, str) else ""
+
+
+def expand(blobs: BlobStore | None, data: dict[str, Any]) -> dict[str, Any]:
+    return {k: blob_text(blobs, v) if k in BLOB_FIELDS else v for k, v in data.items()}
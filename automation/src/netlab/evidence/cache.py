@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class DiskEvidenceCache:
+    """Evidence cache shared across netlab commands, keyed by lab, node and evidence key."""
+
+    def __init__(self, root: Path, lab: str, ttl: float = 300.0, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.root = Path(root) / lab
+        self.lab = lab
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size), filled by one directory scan and then kept current by put().
+        self._entries: dict[Path, tuple[int, int]] | None = None
+        self._total = 0
+
+    def _path(self, node: str, key: str) -> Path:
+        digest = hashlib.sha256(f"{self.lab}\0{node}\0{key}".encode("utf-8")).hexdigest()
+        return self.root / f"{digest}.json"
+
+    def get(self, node: str, key: str) -> dict | None:
+        path = self._path(node, key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("node") != node or entry.get("key") != key:
+            return None
+        return entry.get("value")
+
+    def put(self, node: str, key: str, value: dict) -> None:
+        path = self._path(node, key)
+        payload = json.dumps({"node": node, "key": key, "value": value}, sort_keys=True)
+        with self._lock:
+            if self._entries is None:
+                self._scan()
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, path)
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total -= old[1]
+            size = len(payload.encode("utf-8"))
+            self._entries[path] = (time.time_ns(), size)
+            self._total += size
+            if self._total > self.max_bytes:
+                self._evict(keep=path)
+
+    def _scan(self) -> None:
+        self._entries = {}
+        now = time.time()
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                continue
+            self._entries[path] = (st.st_mtime_ns, st.st_size)
+        self._total = sum(size for _, size in self._entries.values())
+
+    def _evict(self, keep: Path) -> None:
+        # Oldest first, down to 3/4 of the bound so the next puts do not each trigger another pass.
+        target = self.max_bytes * 3 // 4
+        for path, (_, size) in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            if self._total <= target:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            del self._entries[path]
+            self._total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.root.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._entries = None
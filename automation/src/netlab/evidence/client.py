@@ -1,28 +1,189 @@
+import json
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Callable
 
+from netlab.adapters.base import exec_fields
+from netlab.core.tracing import span
+from netlab.evidence.blobs import BlobStore, blob_text, is_ref
+from netlab.evidence.cache import DiskEvidenceCache
 from netlab.evidence.cli import CliTransport
-from netlab.evidence.gnmi import GnmiTransport
+from netlab.evidence.gnmi import GnmiResponse, GnmiTransport
+
+
+@dataclass(frozen=True, slots=True)
+class EosJson:
+    # Structured variant of an EOS show command and the mapper to the collector's parsed shape.
+    command: str
+    mapper: Callable[[dict], dict | None]
+
+    @property
+    def cli(self) -> str:
+        return f"{self.command} | json"
 
 
 class EvidenceClient:
-    def __init__(self, gnmi: GnmiTransport, cli: CliTransport) -> None:
+    def __init__(
+        self,
+        gnmi: GnmiTransport,
+        cli: CliTransport,
+        disk_cache: DiskEvidenceCache | None = None,
+        refresh: bool = False,
+        blobs: BlobStore | None = None,
+    ) -> None:
         self.gnmi = gnmi
         self.cli = cli
+        self.disk_cache = disk_cache
+        self.refresh = refresh
+        self.blobs = blobs
         self._cache: dict[str, dict] = {}
         self._unsupported: set[str] = set()
+        # (node, command): one node rejecting `| json` says nothing about the others.
+        self._json_unsupported: set[tuple[str, str]] = set()
+        self._gnmi_prefetched: dict[tuple[str, str], GnmiResponse] = {}
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch_gnmi(self, node: str, paths: list[str]) -> None:
+        # Fetch several OpenConfig paths for a node in a single Get request.
+        pending = [p for p in dict.fromkeys(paths) if p not in self._unsupported and (node, p) not in self._gnmi_prefetched]
+        if not pending or not getattr(self.gnmi, "enabled", False):
+            return
+        for path, res in self.gnmi.get_many(node, pending).items():
+            self._gnmi_prefetched[(node, path)] = res
+
+    def invalidate(self) -> None:
+        # Drop in-memory evidence so the next collect goes back to the device.
+        with self._lock:
+            self._cache.clear()
+            self._gnmi_prefetched.clear()
 
-    def collect(self, cache_key: str, gnmi_path: str, node: str, cli_fetcher: Callable[[], dict]) -> dict:
+    def _cached(self, cache_key: str, node: str) -> dict | None:
         if cache_key in self._cache:
             return self._cache[cache_key]
+        if self.disk_cache is not None and not self.refresh:
+            cached = self.disk_cache.get(node, cache_key)
+            if cached is not None and not self._blobs_present(cached):
+                cached = None
+            if cached is not None:
+                self._cache[cache_key] = cached
+                return cached
+        return None
 
-        if gnmi_path not in self._unsupported:
-            res = self.gnmi.get(node=node, path=gnmi_path)
-            if res.ok:
-                out = {"source": "gnmi", "data": res.payload}
-                self._cache[cache_key] = out
-                return out
-            self._unsupported.add(gnmi_path)
+    def _blobs_present(self, entry: dict) -> bool:
+        refs = [v for v in entry.get("data", {}).values() if is_ref(v)]
+        return not refs or (self.blobs is not None and all(self.blobs.has(v["digest"]) for v in refs))
+
+    def text(self, value) -> str:
+        """Full text of an evidence field that may hold a blob reference."""
+        return blob_text(self.blobs, value)
 
-        out = {"source": "cli", "data": cli_fetcher()}
-        self._cache[cache_key] = out
+    def is_cached(self, cache_key: str, node: str) -> bool:
+        return self._cached(cache_key, node) is not None
+
+    def collect(
+        self,
+        cache_key: str,
+        gnmi_path: str | None,
+        node: str,
+        cli_fetcher: Callable[[], dict],
+        gnmi_mapper: Callable[[dict], dict | None] | None = None,
+        eos_json: EosJson | None = None,
+    ) -> dict:
+        with span("evidence", f"collect {cache_key}", node=node, key=cache_key) as args:
+            out = self._collect(cache_key, gnmi_path, node, cli_fetcher, gnmi_mapper, eos_json, args)
+            args["source"] = out.get("source")
         return out
+
+    def _collect(
+        self,
+        cache_key: str,
+        gnmi_path: str | None,
+        node: str,
+        cli_fetcher: Callable[[], dict],
+        gnmi_mapper: Callable[[dict], dict | None] | None,
+        eos_json: EosJson | None,
+        trace: dict,
+    ) -> dict:
+        in_memory = cache_key in self._cache
+        cached = self._cached(cache_key, node)
+        if cached is not None:
+            trace["cache"] = "hit" if in_memory else "disk"
+            return cached
+
+        # Single-flight: concurrent callers for the same key wait on the first fetch.
+        with self._lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            pending = self._inflight.get(cache_key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[cache_key] = Future()
+        if not owner:
+            trace["cache"] = "wait"
+            return pending.result()
+        trace["cache"] = "miss"
+
+        try:
+            out = self._fetch(gnmi_path, node, cli_fetcher, gnmi_mapper, eos_json)
+            if self.blobs is not None:
+                # Long outputs live in the blob store; evidence keeps digest + preview.
+                out = {**out, "data": self.blobs.externalize(out["data"])}
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._cache[cache_key] = out
+            self._inflight.pop(cache_key, None)
+        pending.set_result(out)
+        # Failed collections are not persisted so the next command retries the device.
+        if self.disk_cache is not None and out["data"].get("rc", 0) == 0:
+            self.disk_cache.put(node, cache_key, out)
+        return out
+
+    def _fetch(
+        self,
+        gnmi_path: str | None,
+        node: str,
+        cli_fetcher: Callable[[], dict],
+        gnmi_mapper: Callable[[dict], dict | None] | None,
+        eos_json: EosJson | None = None,
+    ) -> dict:
+        if gnmi_path is not None and gnmi_path not in self._unsupported:
+            res = self._gnmi_prefetched.pop((node, gnmi_path), None) or self.gnmi.get(node=node, path=gnmi_path)
+            data = res.payload if res.ok else None
+            if data is not None and gnmi_mapper is not None:
+                with span("parse", f"gnmi map {gnmi_path}", node=node):
+                    data = gnmi_mapper(data)
+            if data is not None:
+                return {"source": "gnmi", "data": data}
+            self._unsupported.add(gnmi_path)
+
+        if eos_json is not None and (node, eos_json.command) not in self._json_unsupported:
+            data = self._fetch_json(node, eos_json)
+            if data is not None:
+                return {"source": "cli-json", "data": data}
+
+        return {"source": "cli", "data": cli_fetcher()}
+
+    def _fetch_json(self, node: str, eos_json: EosJson) -> dict | None:
+        r = self.cli.eos(node, eos_json.cli)
+        if r.timed_out or r.unreachable:
+            # The text command would wait out the same wedged node; report the timeout instead.
+            return {"rc": r.rc, "raw": r.stdout, "err": r.stderr, **exec_fields(r)}
+        if r.rc != 0:
+            # Could be the node rather than the command; scrape text this time only.
+            return None
+        with span("parse", f"json map {eos_json.command}", node=node):
+            try:
+                payload = json.loads(r.stdout)
+            except ValueError:
+                payload = None
+            mapped = eos_json.mapper(payload) if isinstance(payload, dict) else None
+        if mapped is None:
+            self._json_unsupported.add((node, eos_json.command))
+            return None
+        return {"rc": 0, **mapped, "raw": r.stdout, "err": r.stderr}
@@ -1,28 +1,93 @@
-import re
+import ipaddress
 
-from netlab.evidence.client import EvidenceClient
+from netlab.adapters.base import exec_fields
+from netlab.core.tracing import span
+from netlab.evidence.client import EosJson, EvidenceClient
+from netlab.evidence.collectors.eos.normalize import bgp_neighbors, bgp_state
+from netlab.evidence.gnmi import strip_prefixes
+
+COMMAND = "show bgp summary"
+GNMI_PATH = "/network-instances/network-instance/protocols/protocol/bgp/neighbors/neighbor/state/session-state"
+
+
+def _find_session_states(value, out: dict[str, str]) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _find_session_states(item, out)
+        return
+    if not isinstance(value, dict):
+        return
+    body = strip_prefixes(value)
+    address = body.get("neighbor-address")
+    if address is not None:
+        session = strip_prefixes(body.get("state")).get("session-state")
+        if session is not None:
+            out[str(address)] = str(session)
+            return
+    for child in body.values():
+        _find_session_states(child, out)
 
 
 def _parse_bgp_summary(text: str) -> dict:
-    established = 0
-    total = 0
+    sessions: dict[str, str] = {}
     for line in text.splitlines():
-        stripped = line.strip()
-        if re.match(r"^\d+\.", stripped):
-            total += 1
-            if "Established" in stripped:
-                established += 1
-    return {"established": established, "total": total}
+        parts = line.split()
+        try:
+            ipaddress.ip_address(parts[0] if parts else "")
+        except ValueError:
+            continue
+        # Neighbor rows, IPv4 or IPv6; the state is the first column that names one.
+        sessions[parts[0]] = next((p for p in parts[1:] if bgp_state(p)), "")
+    return bgp_neighbors(sessions)
+
+
+def _from_openconfig(payload: dict) -> dict | None:
+    # Mirror `show bgp summary`, which only covers the default VRF.
+    sessions: dict[str, str] = {}
+    for update in payload.get("updates", []):
+        keys = {e["name"].split(":")[-1]: e["key"] for e in update["elems"]}
+        instance = keys.get("network-instance", {}).get("name", "default")
+        if instance.lower() != "default":
+            continue
+        address = keys.get("neighbor", {}).get("neighbor-address")
+        val = update["val"]
+        if address is not None and isinstance(val, dict):
+            body = strip_prefixes(val)
+            val = body.get("session-state", strip_prefixes(body.get("state")).get("session-state", val))
+        if address is not None and not isinstance(val, (dict, list)):
+            sessions[address] = str(val)
+            continue
+        _find_session_states(val, sessions)
+
+    if not sessions:
+        return None
+    return {"rc": 0, "parsed": bgp_neighbors(sessions)}
+
+
+def _from_eos_json(payload: dict) -> dict | None:
+    # Same scope as the text and OpenConfig paths: default VRF only.
+    vrfs = payload.get("vrfs")
+    if not isinstance(vrfs, dict):
+        return None
+    peers = (vrfs.get("default") or {}).get("peers", {})
+    return {"parsed": bgp_neighbors({str(address): peer.get("peerState", "") for address, peer in peers.items()})}
+
+
+EOS_JSON = EosJson(COMMAND, _from_eos_json)
 
 
 def collect_bgp_summary(client: EvidenceClient, node: str) -> dict:
     def _cli() -> dict:
-        r = client.cli.eos(node, "show bgp summary")
-        return {"rc": r.rc, "parsed": _parse_bgp_summary(r.stdout), "raw": r.stdout, "err": r.stderr}
+        r = client.cli.eos(node, COMMAND)
+        with span("parse", f"parse {COMMAND}", node=node):
+            parsed = _parse_bgp_summary(r.stdout)
+        return {"rc": r.rc, "parsed": parsed, "raw": r.stdout, "err": r.stderr, **exec_fields(r)}
 
     return client.collect(
         cache_key=f"bgp-summary:{node}",
-        gnmi_path="/network-instances/network-instance/protocols/protocol/bgp/neighbors/neighbor/state/session-state",
+        gnmi_path=GNMI_PATH,
         node=node,
         cli_fetcher=_cli,
+        gnmi_mapper=_from_openconfig,
+        eos_json=EOS_JSON,
     )
@@ -1,6 +1,34 @@
+import io
 import re
+from typing import Iterable
 
+from netlab.adapters.base import exec_fields
+from netlab.core.tracing import span
 from netlab.evidence.client import EvidenceClient
+from netlab.evidence.collectors.eos.bgp_oc import collect_bgp_summary
+
+SUMMARY_COMMAND = "show bgp evpn summary"
+ROUTES_COMMAND = "show bgp evpn"
+
+ROUTE_TYPES = {
+    "1": "auto-discovery",
+    "2": "mac-ip",
+    "3": "imet",
+    "4": "ethernet-segment",
+    "5": "ip-prefix",
+    "6": "smet",
+    "7": "join-sync",
+    "8": "leave-sync",
+    "10": "spmsi",
+}
+_TYPE_NAMES = set(ROUTE_TYPES.values())
+_ROUTE_LINE = re.compile(r"RD:\s*(\S+)\s+(\S+)\s*(.*)")
+_DETAIL_LINE = re.compile(r"routing table entry for (\S+)\s+(.*?),\s*Route Distinguisher:\s*(\S+)")
+_VNI_LINE = re.compile(r"\bVNI:\s*(\d+)")
+_MAC = re.compile(r"^[0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4}$")
+# RD assigned numbers at or above this are taken to be the VNI (e.g. ``rd 10.255.1.1:10000``);
+# smaller ones are VLAN ids from ``rd auto`` and say nothing about the VNI.
+_MIN_RD_VNI = 4096
 
 
 def parse_evpn_summary(text: str) -> dict:
@@ -14,9 +42,140 @@ def parse_evpn_summary(text: str) -> dict:
     return {"neighbors": neighbors, "established": established}
 
 
+def route_type(value: object) -> str:
+    """Canonical EOS route type name for ``mac-ip``, ``2``, ``type-2`` or ``type2``."""
+    text = str(value).strip().lower()
+    number = text.removeprefix("type").lstrip("-")
+    return ROUTE_TYPES.get(number, text)
+
+
+def normalize_mac(value: str) -> str:
+    digits = re.sub(r"[^0-9a-f]", "", value.lower())
+    if len(digits) != 12:
+        return value.lower()
+    return ".".join(digits[i : i + 4] for i in range(0, 12, 4))
+
+
+class _EvpnIndexer:
+    def __init__(self) -> None:
+        self.seen: set[tuple[str, str, str]] = set()
+        self.by_type: dict[str, int] = {}
+        self.by_rd: dict[str, dict[str, int]] = {}
+        self.by_vni: dict[str, dict[str, int]] = {}
+        self.macs: dict[str, int] = {}
+        self.ips: dict[str, int] = {}
+
+    def add(self, rd: str, rtype: str, rest: str, vni: str | None) -> None:
+        key = (rd, rtype, rest)
+        if key in self.seen:
+            # Additional paths for a route EOS already listed.
+            return
+        self.seen.add(key)
+        tokens = rest.split()
+        if vni is None and tokens and tokens[0].isdigit() and tokens[0] != "0":
+            # VLAN-aware bundles print the ethernet tag (the VNI) before the MAC.
+            vni = tokens[0]
+        if vni is None:
+            assigned = rd.rsplit(":", 1)[-1]
+            if assigned.isdigit() and int(assigned) >= _MIN_RD_VNI:
+                vni = assigned
+        self.by_type[rtype] = self.by_type.get(rtype, 0) + 1
+        rd_counts = self.by_rd.setdefault(rd, {})
+        rd_counts[rtype] = rd_counts.get(rtype, 0) + 1
+        if vni is not None:
+            vni_counts = self.by_vni.setdefault(vni, {})
+            vni_counts[rtype] = vni_counts.get(rtype, 0) + 1
+        if rtype == "mac-ip":
+            for token in tokens:
+                token = token.lower()
+                if _MAC.match(token):
+                    self.macs[token] = self.macs.get(token, 0) + 1
+                elif "." in token or ":" in token:
+                    self.ips[token] = self.ips.get(token, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {
+            "routes": len(self.seen),
+            "by_type": self.by_type,
+            "by_rd": self.by_rd,
+            "by_vni": self.by_vni,
+            "macs": self.macs,
+            "ips": self.ips,
+        }
+
+
+def index_evpn_routes(lines: Iterable[str]) -> dict:
+    """Count EVPN routes by type, RD and VNI in one pass over ``show bgp evpn`` (plain or ``detail``) lines."""
+    indexer = _EvpnIndexer()
+    pending: tuple[str, str, str] | None = None
+    for line in lines:
+        if pending is not None:
+            vni = _VNI_LINE.search(line)
+            if vni is not None:
+                indexer.add(*pending, vni.group(1))
+                pending = None
+                continue
+        detail = _DETAIL_LINE.search(line)
+        if detail is not None:
+            if pending is not None:
+                indexer.add(*pending, None)
+            rtype, rest, rd = detail.groups()
+            pending = (rd, route_type(rtype), rest.strip())
+            continue
+        match = _ROUTE_LINE.search(line)
+        if match is None:
+            continue
+        rd, rtype, rest = match.groups()
+        rtype = route_type(rtype)
+        if rtype in _TYPE_NAMES:
+            indexer.add(rd, rtype, rest.strip(), None)
+    if pending is not None:
+        indexer.add(*pending, None)
+    return indexer.to_dict()
+
+
+def route_count(index: dict, rtype: str | None = None, vni: str | None = None, rd: str | None = None) -> int:
+    if vni is not None:
+        counts = index.get("by_vni", {}).get(str(vni), {})
+    elif rd is not None:
+        counts = index.get("by_rd", {}).get(rd, {})
+    else:
+        counts = index.get("by_type", {})
+    if rtype is None:
+        return sum(counts.values())
+    return counts.get(rtype, 0)
+
+
 def collect_evpn_summary(client: EvidenceClient, node: str) -> dict:
-    r = client.cli.eos(node, "show bgp summary")
-    parsed = parse_evpn_summary(r.stdout)
-    evpn = client.cli.eos(node, "show bgp evpn summary")
-    lines = [ln for ln in evpn.stdout.splitlines() if ln.strip()]
-    return {"summary": parsed, "evpn_summary_rc": evpn.rc, "evpn_summary_lines": len(lines), "raw": evpn.stdout, "err": evpn.stderr}
+    bgp = collect_bgp_summary(client, node).get("data", {}).get("parsed", {})
+    parsed = {"neighbors": int(bgp.get("total", 0)), "established": int(bgp.get("established", 0))}
+
+    def _cli() -> dict:
+        evpn = client.cli.eos(node, SUMMARY_COMMAND)
+        lines = [ln for ln in evpn.stdout.splitlines() if ln.strip()]
+        return {
+            "rc": evpn.rc,
+            "evpn_summary_lines": len(lines),
+            "raw": evpn.stdout,
+            "err": evpn.stderr,
+            **exec_fields(evpn),
+        }
+
+    data = client.collect(cache_key=f"evpn-summary:{node}", gnmi_path=None, node=node, cli_fetcher=_cli).get("data", {})
+    return {
+        "summary": parsed,
+        "evpn_summary_rc": data.get("rc", 1),
+        "evpn_summary_lines": data.get("evpn_summary_lines", 0),
+        "raw": data.get("raw", ""),
+        "err": data.get("err", ""),
+    }
+
+
+def collect_evpn_routes(client: EvidenceClient, node: str) -> dict:
+    def _cli() -> dict:
+        r = client.cli.eos(node, ROUTES_COMMAND)
+        with span("parse", f"parse {ROUTES_COMMAND}", node=node):
+            parsed = index_evpn_routes(io.StringIO(r.stdout))
+        return {"rc": r.rc, "parsed": parsed, "raw": r.stdout, "err": r.stderr, **exec_fields(r)}
+
+    return client.collect(cache_key=f"evpn-routes:{node}", gnmi_path=None, node=node, cli_fetcher=_cli)
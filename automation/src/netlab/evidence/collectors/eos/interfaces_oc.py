@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from netlab.evidence.client import EvidenceClient
+from netlab.adapters.base import exec_fields
+from netlab.core.tracing import span
+from netlab.evidence.client import EosJson, EvidenceClient
+from netlab.evidence.collectors.eos.normalize import interface_name, link_state
+from netlab.evidence.gnmi import strip_prefixes
+
+COMMAND = "show interfaces description"
+GNMI_PATH = "/interfaces/interface/state"
 
 
 def _parse_interfaces_description(raw: str) -> list[dict[str, str]]:
@@ -12,41 +19,94 @@ def _parse_interfaces_description(raw: str) -> list[dict[str, str]]:
         if stripped.startswith("Interface"):
             continue
         parts = stripped.split()
+        if len(parts) > 3 and parts[1] == "admin":
+            # Status column reads "admin down".
+            parts[1:3] = ["admindown"]
         if len(parts) < 3:
             continue
-        iface = parts[0]
-        status = parts[1]
-        protocol = parts[2]
-        description = " ".join(parts[3:]) if len(parts) > 3 else ""
-        entries.append(
-            {
-                "interface": iface,
-                "status": status.lower(),
-                "protocol": protocol.lower(),
-                "description": description,
-            }
-        )
+        entries.append(_entry(parts[0], parts[1], parts[2], " ".join(parts[3:])))
     return entries
 
 
+def _entry(name: object, status: object, protocol: object, description: object) -> dict[str, str]:
+    # Same names and states whichever source answered: gNMI, `| json` or text.
+    return {
+        "interface": interface_name(str(name)),
+        "status": link_state(status),
+        "protocol": link_state(protocol),
+        "description": str(description),
+    }
+
+
+def _summarize(parsed: list[dict[str, str]]) -> dict:
+    up_count = sum(1 for item in parsed if item["status"] == "up" and item["protocol"] == "up")
+    down_count = sum(1 for item in parsed if item["status"] != "up" or item["protocol"] != "up")
+    return {"up": up_count, "down": down_count, "parsed": parsed}
+
+
+def _from_openconfig(payload: dict) -> dict | None:
+    states: dict[str, dict] = {}
+    for update in payload.get("updates", []):
+        names = [e["name"].split(":")[-1] for e in update["elems"]]
+        iface = next((e["key"]["name"] for e in update["elems"] if e["name"].split(":")[-1] == "interface" and "name" in e["key"]), None)
+        val = update["val"]
+        if iface is None:
+            # Container-level answer: {"interface": [{"name": ..., "state": {...}}, ...]}
+            body = strip_prefixes(val)
+            body = strip_prefixes(body.get("interfaces")) or body
+            for item in body.get("interface", []):
+                item = strip_prefixes(item)
+                states.setdefault(str(item.get("name")), {}).update(strip_prefixes(item.get("state")))
+            continue
+        if names[-1] == "state":
+            states.setdefault(iface, {}).update(strip_prefixes(val))
+        elif "state" in names:
+            states.setdefault(iface, {})[names[-1]] = val
+        else:
+            states.setdefault(iface, {}).update(strip_prefixes(strip_prefixes(val).get("state")))
+
+    parsed = [
+        _entry(name, state.get("admin-status", ""), state.get("oper-status", ""), state.get("description", ""))
+        for name, state in states.items()
+        if state
+    ]
+    if not parsed:
+        return None
+    return {"rc": 0, **_summarize(parsed)}
+
+
+def _from_eos_json(payload: dict) -> dict | None:
+    descriptions = payload.get("interfaceDescriptions")
+    if not isinstance(descriptions, dict):
+        return None
+    parsed = [
+        _entry(name, item.get("interfaceStatus", ""), item.get("lineProtocolStatus", ""), item.get("description", ""))
+        for name, item in descriptions.items()
+    ]
+    return _summarize(parsed)
+
+
+EOS_JSON = EosJson(COMMAND, _from_eos_json)
+
+
 def collect_interfaces(client: EvidenceClient, node: str) -> dict:
     def _cli() -> dict:
-        r = client.cli.eos(node, "show interfaces description")
-        parsed = _parse_interfaces_description(r.stdout)
-        up_count = sum(1 for item in parsed if item["status"] == "up" and item["protocol"] == "up")
-        down_count = sum(1 for item in parsed if item["status"] != "up" or item["protocol"] != "up")
+        r = client.cli.eos(node, COMMAND)
+        with span("parse", f"parse {COMMAND}", node=node):
+            parsed = _parse_interfaces_description(r.stdout)
         return {
             "rc": r.rc,
-            "up": up_count,
-            "down": down_count,
-            "parsed": parsed,
+            **_summarize(parsed),
             "raw": r.stdout,
             "err": r.stderr,
+            **exec_fields(r),
         }
 
     return client.collect(
         cache_key=f"interfaces:{node}",
-        gnmi_path="/interfaces/interface/state",
+        gnmi_path=GNMI_PATH,
         node=node,
         cli_fetcher=_cli,
+        gnmi_mapper=_from_openconfig,
+        eos_json=EOS_JSON,
     )
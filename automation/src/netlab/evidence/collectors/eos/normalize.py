@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+
+# Short names EOS prints in text tables; gNMI and `| json` use the long form.
+_IFACE_PREFIXES = {
+    "et": "Ethernet",
+    "ma": "Management",
+    "lo": "Loopback",
+    "po": "Port-Channel",
+    "vl": "Vlan",
+    "vx": "Vxlan",
+    "tu": "Tunnel",
+}
+_IFACE_RX = re.compile(r"^([A-Za-z-]+)(\d[\d/.:]*)$")
+
+# One BGP session-state vocabulary for text, `| json` and OpenConfig (RFC 4271 names, upper case).
+BGP_STATES = ("IDLE", "CONNECT", "ACTIVE", "OPENSENT", "OPENCONFIRM", "ESTABLISHED")
+_BGP_ALIASES = {"ESTAB": "ESTABLISHED"}
+
+
+def interface_name(name: str) -> str:
+    """Long-form interface name: "Et1" and "ethernet1" both become "Ethernet1"."""
+    m = _IFACE_RX.match(name)
+    if m is None:
+        return name
+    prefix = m.group(1).lower()
+    for short, full in _IFACE_PREFIXES.items():
+        if prefix == full.lower() or prefix == short:
+            return f"{full}{m.group(2)}"
+    return name
+
+
+def link_state(value: object) -> str:
+    """Lower-case link state without separators; EOS "adminDown" counts as "down"."""
+    state = re.sub(r"[\s_-]", "", str(value)).lower()
+    return "down" if state == "admindown" else state
+
+
+def bgp_state(value: object) -> str | None:
+    """Canonical session state from any source, or None if ``value`` is not one."""
+    # Text tables qualify states ("Idle(Admin)"); the qualifier is not part of the state.
+    state = re.sub(r"[\s_-]", "", str(value).split("(")[0]).upper()
+    state = _BGP_ALIASES.get(state, state)
+    return state if state in BGP_STATES else None
+
+
+def bgp_neighbors(sessions: dict[str, object]) -> dict:
+    """Parsed BGP summary shape shared by every source."""
+    neighbors = {address: bgp_state(state) or "UNKNOWN" for address, state in sessions.items()}
+    established = sum(1 for state in neighbors.values() if state == "ESTABLISHED")
+    return {"established": established, "total": len(neighbors), "neighbors": neighbors}
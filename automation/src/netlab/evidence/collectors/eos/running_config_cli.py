@@ -1,6 +1,12 @@
+from netlab.adapters.base import exec_fields
 from netlab.evidence.client import EvidenceClient
 
+COMMAND = "show running-config"
+
 
 def collect_running_config(client: EvidenceClient, node: str) -> dict:
-    r = client.cli.eos(node, "show running-config")
-    return {"rc": r.rc, "raw": r.stdout, "err": r.stderr}
+    def _cli() -> dict:
+        r = client.cli.eos(node, COMMAND)
+        return {"rc": r.rc, "raw": r.stdout, "err": r.stderr, **exec_fields(r)}
+
+    return client.collect(cache_key=f"running-config:{node}", gnmi_path=None, node=node, cli_fetcher=_cli).get("data", {})
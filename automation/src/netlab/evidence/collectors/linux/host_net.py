@@ -1,5 +1,14 @@
+import json
+import re
+import shlex
+
+from netlab.adapters.base import exec_fields
 from netlab.adapters.containerlab import ContainerlabAdapter
 
+_PING_MARKER = "@@NETLAB-PING"
+_LOSS_RE = re.compile(r"([\d.]+)% packet loss")
+_RTT_RE = re.compile(r"min/avg/max(?:/mdev)? = ([\d.]+)/([\d.]+)/([\d.]+)")
+
 
 def interfaces_present(adapter: ContainerlabAdapter, host: str) -> dict:
     r = adapter.exec(host, "ip -o link show | awk -F': ' '{print $2}'")
@@ -10,9 +19,95 @@ def interfaces_present(adapter: ContainerlabAdapter, host: str) -> dict:
 def ping(adapter: ContainerlabAdapter, host: str, target: str, interface: str | None = None) -> dict:
     cmd = f"ping -c 2 -W 1 {target}" if not interface else f"ping -I {interface} -c 2 -W 1 {target}"
     r = adapter.exec(host, cmd)
-    return {"rc": r.rc, "out": r.stdout, "err": r.stderr}
+    return {"rc": r.rc, "out": r.stdout, "err": r.stderr, **exec_fields(r)}
+
+
+def parse_ping_output(text: str) -> dict:
+    out: dict = {"loss_pct": None, "rtt_min_ms": None, "rtt_avg_ms": None, "rtt_max_ms": None}
+    loss = _LOSS_RE.search(text)
+    if loss:
+        out["loss_pct"] = float(loss.group(1))
+    rtt = _RTT_RE.search(text)
+    if rtt:
+        out["rtt_min_ms"], out["rtt_avg_ms"], out["rtt_max_ms"] = (float(x) for x in rtt.groups())
+    return out
+
+
+def split_ping_many(stdout: str, targets: list[str]) -> dict[str, dict]:
+    chunks: dict[int, tuple[int, list[str]]] = {}
+    current: int | None = None
+    for line in stdout.splitlines():
+        if line.startswith(_PING_MARKER + " "):
+            parts = line.split()
+            if len(parts) == 3 and parts[1].isdigit():
+                current = int(parts[1])
+                rc = int(parts[2]) if parts[2].lstrip("-").isdigit() else 1
+                chunks[current] = (rc, [])
+                continue
+        if current is not None:
+            chunks[current][1].append(line)
+
+    results: dict[str, dict] = {}
+    for idx, target in enumerate(targets):
+        rc, lines = chunks.get(idx, (1, []))
+        text = "\n".join(lines)
+        results[target] = {"rc": rc, **parse_ping_output(text), "out": text}
+    return results
+
+
+def ping_many(adapter: ContainerlabAdapter, host: str, targets: list[str], interface: str | None = None) -> dict:
+    # All pings run in parallel inside the container; outputs are printed in target order afterwards.
+    iface = f"-I {shlex.quote(interface)} " if interface else ""
+    lines = ['d=$(mktemp -d)']
+    for idx, target in enumerate(targets):
+        lines.append(f'( ping {iface}-c 2 -W 1 {shlex.quote(target)} >"$d/{idx}" 2>&1; echo $? >"$d/{idx}.rc" ) &')
+    lines.append("wait")
+    for idx in range(len(targets)):
+        lines.append(f'echo "{_PING_MARKER} {idx} $(cat "$d/{idx}.rc")"; cat "$d/{idx}"')
+    lines.append('rm -rf "$d"')
+    r = adapter.exec(host, "\n".join(lines))
+    return {"rc": r.rc, "err": r.stderr, "targets": split_ping_many(r.stdout, targets), **exec_fields(r)}
 
 
 def neigh_show(adapter: ContainerlabAdapter, host: str, interface: str) -> dict:
     r = adapter.exec(host, f"ip neigh show dev {interface}")
-    return {"rc": r.rc, "out": r.stdout, "err": r.stderr}
+    return {"rc": r.rc, "out": r.stdout, "err": r.stderr, **exec_fields(r)}
+
+
+def _neigh_text_entry(line: str) -> dict | None:
+    tokens = line.split()
+    if not tokens:
+        return None
+    entry: dict = {"dst": tokens[0], "state": []}
+    rest = iter(tokens[1:])
+    for token in rest:
+        if token in ("dev", "lladdr"):
+            entry[token] = next(rest, "")
+        elif token.isupper():
+            entry["state"].append(token)
+    return entry
+
+
+def index_neighbors(stdout: str) -> dict[str, dict[str, dict]]:
+    """Neighbor table as {interface: {address: entry}}, from `ip -j neigh` or, failing that, plain `ip neigh`."""
+    try:
+        entries = json.loads(stdout)
+    except ValueError:
+        entries = [e for e in (_neigh_text_entry(line) for line in stdout.splitlines()) if e is not None]
+    index: dict[str, dict[str, dict]] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if isinstance(entry, dict) and "dst" in entry:
+            index.setdefault(str(entry.get("dev", "")), {})[str(entry["dst"])] = entry
+    return index
+
+
+def probe_neighbors(adapter: ContainerlabAdapter, host: str, probes: list[tuple[str, str]]) -> dict:
+    """Ping every (target_ip, interface) in parallel, then dump the neighbor table once, all in one exec."""
+    lines = [
+        f"ping -I {shlex.quote(interface)} -c 2 -W 1 {shlex.quote(target)} >/dev/null 2>&1 &"
+        for target, interface in dict.fromkeys(probes)
+    ]
+    # iproute2 builds without JSON support (e.g. busybox) still answer the plain form.
+    lines += ["wait", "ip -j neigh show 2>/dev/null || ip neigh show"]
+    r = adapter.exec(host, "\n".join(lines))
+    return {"rc": r.rc, "err": r.stderr, "neighbors": index_neighbors(r.stdout), **exec_fields(r)}
@@ -1,4 +1,37 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
 from dataclasses import dataclass
+from typing import Any, Callable
+
+from netlab.intent.schema import GnmiDefaults
+
+# Optional dependency (pip install netlab-automation[gnmi]), imported on first use by _load_grpc:
+# grpc and the generated stubs cost more at startup than the rest of netlab together.
+grpc = None
+gnmi_pb2 = None
+gnmi_pb2_grpc = None
+_GRPC_TRIED = False
+
+
+def _load_grpc() -> bool:
+    global grpc, gnmi_pb2, gnmi_pb2_grpc, _GRPC_TRIED
+    if not _GRPC_TRIED:
+        try:
+            import grpc as _grpc
+            from pygnmi.spec.v080 import gnmi_pb2 as _pb2, gnmi_pb2_grpc as _pb2_grpc
+        except ImportError:  # pragma: no cover - exercised only without the extra installed
+            pass
+        else:
+            grpc, gnmi_pb2, gnmi_pb2_grpc = _grpc, _pb2, _pb2_grpc
+        _GRPC_TRIED = True
+    return grpc is not None
+
+
+_ELEM_RE = re.compile(r"^([^\[]+)((?:\[[^\]]+\])*)$")
+_KEY_RE = re.compile(r"\[([^=\]]+)=([^\]]*)\]")
 
 
 @dataclass(slots=True)
@@ -8,9 +41,124 @@ class GnmiResponse:
     error: str | None = None
 
 
+def strip_prefixes(value: Any) -> dict[str, Any]:
+    # OpenConfig JSON_IETF keys carry module prefixes ("openconfig-interfaces:state").
+    if not isinstance(value, dict):
+        return {}
+    return {str(k).split(":")[-1]: v for k, v in value.items()}
+
+
+def split_path(path: str) -> list[dict[str, Any]]:
+    elems: list[dict[str, Any]] = []
+    for part in [p for p in path.strip("/").split("/") if p]:
+        m = _ELEM_RE.match(part)
+        if not m:
+            raise ValueError(f"Invalid gNMI path element: {part}")
+        elems.append({"name": m.group(1), "key": dict(_KEY_RE.findall(m.group(2)))})
+    return elems
+
+
+def _to_proto_path(path: str):
+    return gnmi_pb2.Path(elem=[gnmi_pb2.PathElem(name=e["name"], key=e["key"]) for e in split_path(path)])
+
+
+def _from_proto_path(path) -> list[dict[str, Any]]:
+    return [{"name": e.name, "key": dict(e.key)} for e in path.elem]
+
+
+def _decode_value(val) -> Any:
+    kind = val.WhichOneof("value")
+    if kind in ("json_ietf_val", "json_val"):
+        return json.loads(getattr(val, kind) or b"null")
+    if kind is None:
+        return None
+    return getattr(val, kind)
+
+
+def _belongs_to(requested: list[dict[str, Any]], elems: list[dict[str, Any]]) -> bool:
+    # Servers may answer at a deeper (per-key) or shallower (container) level than requested.
+    req_names = [e["name"].split(":")[-1] for e in requested]
+    got_names = [e["name"].split(":")[-1] for e in elems]
+    size = min(len(req_names), len(got_names))
+    return req_names[:size] == got_names[:size]
+
+
+class _Session:
+    def __init__(self, target: str, settings: GnmiDefaults, insecure: bool) -> None:
+        address = f"{target}:{settings.port}"
+        self.channel = grpc.insecure_channel(address) if insecure else grpc.secure_channel(address, grpc.ssl_channel_credentials())
+        self.stub = gnmi_pb2_grpc.gNMIStub(self.channel)
+        self.metadata = [("username", settings.username), ("password", settings.password)]
+
+
 class GnmiTransport:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        settings: GnmiDefaults | None = None,
+        resolve_target: Callable[[str], str | None] | None = None,
+        timeout: float = 5.0,
+        insecure: bool = True,
+    ) -> None:
         self._unsupported_reason = "gNMI client unavailable in this environment"
+        self.settings = settings
+        self.resolve_target = resolve_target
+        self.timeout = timeout
+        self.insecure = insecure
+        self._sessions: dict[str, _Session] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings is not None and self.resolve_target is not None and _load_grpc()
+
+    def _session(self, node: str) -> _Session | None:
+        with self._lock:
+            if node in self._sessions:
+                return self._sessions[node]
+        target = self.resolve_target(node) if self.resolve_target else None
+        if not target:
+            return None
+        with self._lock:
+            # One long-lived channel per node; another thread may have raced us here.
+            if node not in self._sessions:
+                self._sessions[node] = _Session(target, self.settings, self.insecure)
+            return self._sessions[node]
 
     def get(self, node: str, path: str) -> GnmiResponse:
-        return GnmiResponse(ok=False, payload={}, error=f"{self._unsupported_reason}: {node}:{path}")
+        return self.get_many(node, [path])[path]
+
+    def get_many(self, node: str, paths: list[str]) -> dict[str, GnmiResponse]:
+        if not self.enabled:
+            return {p: GnmiResponse(ok=False, payload={}, error=f"{self._unsupported_reason}: {node}:{p}") for p in paths}
+        session = self._session(node)
+        if session is None:
+            return {p: GnmiResponse(ok=False, payload={}, error=f"no gNMI target address for {node}") for p in paths}
+
+        request = gnmi_pb2.GetRequest(path=[_to_proto_path(p) for p in paths], encoding=gnmi_pb2.Encoding.JSON_IETF)
+        try:
+            response = session.stub.Get(request, metadata=session.metadata, timeout=self.timeout)
+        except grpc.RpcError as exc:
+            error = f"{node}: {exc.code().name if hasattr(exc, 'code') else exc}"
+            return {p: GnmiResponse(ok=False, payload={}, error=error) for p in paths}
+
+        requested = {p: split_path(p) for p in paths}
+        updates: dict[str, list[dict[str, Any]]] = {p: [] for p in paths}
+        for notification in response.notification:
+            prefix = _from_proto_path(notification.prefix) if notification.HasField("prefix") else []
+            for update in notification.update:
+                elems = prefix + _from_proto_path(update.path)
+                item = {"elems": elems, "val": _decode_value(update.val)}
+                for p, req in requested.items():
+                    if _belongs_to(req, elems):
+                        updates[p].append(item)
+                        break
+        return {
+            p: GnmiResponse(ok=bool(items), payload={"updates": items}, error=None if items else f"{node}: empty response for {p}")
+            for p, items in updates.items()
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.channel.close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.collectors.eos import bgp_oc, evpn_cli, interfaces_oc, running_config_cli
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceKind:
+    name: str
+    collect: Callable[[EvidenceClient, str], dict]
+    eos_commands: tuple[str, ...] = ()
+    gnmi_paths: tuple[str, ...] = ()
+
+    def cache_key(self, node: str) -> str:
+        return f"{self.name}:{node}"
+
+
+EVIDENCE_KINDS: dict[str, EvidenceKind] = {
+    kind.name: kind
+    for kind in [
+        EvidenceKind("interfaces", interfaces_oc.collect_interfaces, (interfaces_oc.EOS_JSON.cli,), (interfaces_oc.GNMI_PATH,)),
+        EvidenceKind("bgp-summary", bgp_oc.collect_bgp_summary, (bgp_oc.EOS_JSON.cli,), (bgp_oc.GNMI_PATH,)),
+        EvidenceKind("evpn-routes", evpn_cli.collect_evpn_routes, (evpn_cli.ROUTES_COMMAND,)),
+        EvidenceKind(
+            "evpn-summary",
+            evpn_cli.collect_evpn_summary,
+            (bgp_oc.EOS_JSON.cli, evpn_cli.SUMMARY_COMMAND),
+            (bgp_oc.GNMI_PATH,),
+        ),
+        EvidenceKind("running-config", running_config_cli.collect_running_config, (running_config_cli.COMMAND,)),
+    ]
+}
+
+
+@dataclass(slots=True)
+class EvidencePlan:
+    # node -> evidence kind names, in first-requested order
+    items: dict[str, list[str]] = field(default_factory=dict)
+
+    def add(self, node: str, kinds: Iterable[str]) -> None:
+        bucket = self.items.setdefault(node, [])
+        for kind in kinds:
+            if kind not in EVIDENCE_KINDS:
+                raise KeyError(f"Unknown evidence kind: {kind}")
+            if kind not in bucket:
+                bucket.append(kind)
+
+    def __len__(self) -> int:
+        return sum(len(kinds) for kinds in self.items.values())
+
+    def eos_commands(self, node: str) -> list[str]:
+        out: list[str] = []
+        for kind in self.items.get(node, []):
+            out.extend(c for c in EVIDENCE_KINDS[kind].eos_commands if c not in out)
+        return out
+
+    def gnmi_paths(self, node: str) -> list[str]:
+        out: list[str] = []
+        for kind in self.items.get(node, []):
+            out.extend(p for p in EVIDENCE_KINDS[kind].gnmi_paths if p not in out)
+        return out
+
+    def to_lines(self) -> list[str]:
+        lines = [f"Evidence plan: {len(self)} items across {len(self.items)} nodes"]
+        for node, kinds in self.items.items():
+            lines.append(f"  {node}: {', '.join(kinds)}")
+            commands = self.eos_commands(node)
+            if commands:
+                lines.append(f"    eos: {' | '.join(commands)}")
+            paths = self.gnmi_paths(node)
+            if paths:
+                lines.append(f"    gnmi: {' '.join(paths)}")
+        return lines
+
+
+def _prefetch_node(client: EvidenceClient, adapter, plan: EvidencePlan, node: str) -> None:
+    kinds = [k for k in plan.items[node] if not client.is_cached(EVIDENCE_KINDS[k].cache_key(node), node)]
+    if not kinds:
+        return
+    sub = EvidencePlan({node: kinds})
+    client.prefetch_gnmi(node, sub.gnmi_paths(node))
+    if getattr(adapter, "eos_batch", False):
+        adapter.prime_eos(node, sub.eos_commands(node))
+    for kind in kinds:
+        EVIDENCE_KINDS[kind].collect(client, node)
+
+
+def prefetch(client: EvidenceClient, adapter, plan: EvidencePlan, jobs: int = 1, pool: Executor | None = None) -> None:
+    nodes = list(plan.items)
+    if pool is not None:
+        for future in [pool.submit(_prefetch_node, client, adapter, plan, n) for n in nodes]:
+            future.result()
+        return
+    if jobs <= 1 or len(nodes) <= 1:
+        for node in nodes:
+            _prefetch_node(client, adapter, plan, node)
+        return
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="netlab-evidence") as pool:
+        list(pool.map(lambda n: _prefetch_node(client, adapter, plan, n), nodes))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from typing import Any
+
+from netlab.core.errors import IntentValidationError
+from netlab.core.model import Severity
+
+from .params import parse_params
+from .schema import CheckDef, IntentModel
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCheck:
+    check: CheckDef
+    severity: Severity
+    params: Any
+    nodes: tuple[str, ...]
+    depends_on: tuple[str, ...] = ()
+    # Phases whose failures block this check, nearest first (transitive closure of the phase graph).
+    after_phases: tuple[str, ...] = ()
+    # Execution wave: every check this one waits for has a lower level.
+    level: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPlan:
+    intent_hash: str
+    checks: tuple[CompiledCheck, ...]
+
+
+PHASES = ("intent", "underlay", "control-plane", "dataplane")
+DEFAULT_PHASE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "control-plane": ("underlay",),
+    "dataplane": ("control-plane",),
+}
+
+_PLANS: dict[str, CompiledPlan] = {}
+_PLANS_LOCK = threading.Lock()
+
+
+def clear_compiled_plans() -> None:
+    with _PLANS_LOCK:
+        _PLANS.clear()
+
+
+def parse_severity(value: str) -> Severity:
+    if value.upper() == "WARN":
+        return Severity.WARN
+    if value.upper() == "INFO":
+        return Severity.INFO
+    return Severity.ERROR
+
+
+def resolve_nodes(inventory: dict[str, Any], selector: dict[str, Any]) -> tuple[str, ...]:
+    inventory_nodes = inventory.get("nodes", {})
+    if "node" in selector:
+        return (str(selector["node"]),)
+    if "nodes" in selector:
+        return tuple(str(x) for x in selector.get("nodes", []))
+
+    out: list[str] = []
+    role = selector.get("role")
+    group = selector.get("group")
+    for node, attrs in inventory_nodes.items():
+        roles = attrs.get("roles", [])
+        groups = attrs.get("groups", [])
+        if role and role not in roles:
+            continue
+        if group and group not in groups:
+            continue
+        out.append(node)
+    return tuple(sorted(set(out)))
+
+
+def _compile_check(inventory: dict[str, Any], check: CheckDef) -> CompiledCheck:
+    params = parse_params(check.name, check.kind, check.params)
+    selector = getattr(params, "selector", None)
+    nodes = resolve_nodes(inventory, selector) if selector is not None else ()
+    return CompiledCheck(check=check, severity=parse_severity(check.severity), params=params, nodes=nodes)
+
+
+def phase_dependencies(overrides: dict[str, list[str]] | None = None) -> dict[str, tuple[str, ...]]:
+    """Transitive phase dependencies, nearest first, with intent-level ``phases:`` overrides applied."""
+    direct = dict(DEFAULT_PHASE_DEPENDENCIES)
+    for phase, deps in (overrides or {}).items():
+        for name in (phase, *deps):
+            if name not in PHASES:
+                raise IntentValidationError(f"phases: unknown phase '{name}'")
+        direct[phase] = tuple(deps)
+
+    def _walk(path: list[str]) -> list[str]:
+        out: list[str] = []
+        for dep in direct.get(path[-1], ()):
+            if dep in path:
+                raise IntentValidationError(f"phase dependency cycle: {' -> '.join([*path, dep])}")
+            out += [dep, *_walk([*path, dep])]
+        return out
+
+    return {phase: tuple(dict.fromkeys(_walk([phase]))) for phase in PHASES}
+
+
+def _levels(checks: list[CompiledCheck], after: dict[str, tuple[str, ...]]) -> dict[str, int]:
+    by_name: dict[str, CompiledCheck] = {}
+    for c in checks:
+        # Levels and run gating are keyed by name; a second check of the same name would alias the first.
+        if c.check.name in by_name:
+            raise IntentValidationError(f"duplicate check name '{c.check.name}'")
+        by_name[c.check.name] = c
+    by_phase: dict[str, list[str]] = {}
+    for c in checks:
+        by_phase.setdefault(c.check.phase, []).append(c.check.name)
+        for dep in c.check.depends_on:
+            if dep not in by_name:
+                raise IntentValidationError(f"check '{c.check.name}': depends_on references unknown check '{dep}'")
+
+    levels: dict[str, int] = {}
+    phase_levels: dict[str, int] = {}
+    visiting: list[str] = []
+
+    def _phase(phase: str) -> int:
+        if phase not in phase_levels:
+            phase_levels[phase] = max((_check(n) for n in by_phase.get(phase, ())), default=-1)
+        return phase_levels[phase]
+
+    def _check(name: str) -> int:
+        if name in levels:
+            return levels[name]
+        if name in visiting:
+            cycle = [*visiting[visiting.index(name):], name]
+            raise IntentValidationError(f"check dependency cycle: {' -> '.join(cycle)}")
+        visiting.append(name)
+        check = by_name[name].check
+        waits = [_check(dep) for dep in check.depends_on] + [_phase(p) for p in after.get(check.phase, ())]
+        levels[name] = max(waits, default=-1) + 1
+        visiting.pop()
+        return levels[name]
+
+    for name in by_name:
+        _check(name)
+    return levels
+
+
+def compile_intent(intent: IntentModel) -> CompiledPlan:
+    """Compile checks into typed params and resolved node lists, memoized by intent file hash."""
+    key = intent.source_hash
+    if key:
+        with _PLANS_LOCK:
+            cached = _PLANS.get(key)
+        if cached is not None:
+            return cached
+
+    checks = [_compile_check(intent.inventory, check) for check in intent.checks]
+    after = phase_dependencies(intent.phases)
+    levels = _levels(checks, after)
+    checks = [
+        replace(
+            c,
+            depends_on=tuple(c.check.depends_on),
+            after_phases=after.get(c.check.phase, ()),
+            level=levels[c.check.name],
+        )
+        for c in checks
+    ]
+    plan = CompiledPlan(key, tuple(checks))
+    if key:
+        with _PLANS_LOCK:
+            _PLANS[key] = plan
+    return plan
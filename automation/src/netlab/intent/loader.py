@@ -3,8 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 
 from netlab.core.errors import IntentValidationError
-from netlab.utils.yaml import load_yaml
+from netlab.utils.yaml import load_yaml_hashed
 
+from .compiler import compile_intent
 from .schema import CheckDef, GnmiDefaults, IntentModel
 
 
@@ -14,9 +15,23 @@ def _required(data: dict, key: str):
     return data[key]
 
 
+def _names(value, what: str) -> list[str]:
+    if not isinstance(value, list):
+        raise IntentValidationError(f"{what} must be a list")
+    return [str(x) for x in value]
+
+
+def intent_path(repo_root: Path, lab: str) -> Path:
+    return Path(repo_root) / lab / "intent" / "intent.yml"
+
+
+def discover_labs(repo_root: Path) -> list[str]:
+    return sorted(p.parents[1].name for p in Path(repo_root).glob("*/intent/intent.yml"))
+
+
 def load_intent(repo_root: Path, lab: str) -> IntentModel:
-    path = repo_root / lab / "intent" / "intent.yml"
-    data = load_yaml(path)
+    path = intent_path(repo_root, lab)
+    data, source_hash = load_yaml_hashed(path)
 
     inventory = dict(_required(data, "inventory"))
     services = dict(data.get("services", {}))
@@ -36,9 +51,18 @@ def load_intent(repo_root: Path, lab: str) -> IntentModel:
                 kind=str(_required(item, "kind")),
                 severity=str(item.get("severity", "ERROR")),
                 params=dict(item.get("params", {})),
+                depends_on=_names(item.get("depends_on", []), f"check '{item['name']}': depends_on"),
             )
         )
 
+    phases_data = data.get("phases", {})
+    if not isinstance(phases_data, dict):
+        raise IntentValidationError("phases must be a mapping")
+    phases = {
+        str(phase): _names((attrs or {}).get("depends_on", []), f"phases.{phase}.depends_on")
+        for phase, attrs in phases_data.items()
+    }
+
     gnmi_data = data.get("gnmi", {})
     gnmi = GnmiDefaults(
         port=int(gnmi_data.get("port", 6030)),
@@ -46,11 +70,16 @@ def load_intent(repo_root: Path, lab: str) -> IntentModel:
         password=str(gnmi_data.get("password", "clab")),
     )
 
-    return IntentModel(
+    intent = IntentModel(
         lab_name=lab,
         gnmi=gnmi,
         inventory=inventory,
         services=services,
         checks=checks,
         raw=data,
+        source_hash=source_hash,
+        phases=phases,
     )
+    # Compile once so bad check params fail here, before any container is touched.
+    intent.plan = compile_intent(intent)
+    return intent
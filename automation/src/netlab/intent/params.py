@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from netlab.core.errors import IntentValidationError
+from netlab.evidence.collectors.eos.evpn_cli import normalize_mac, route_type
+
+_SELECTOR_KEYS = {"node", "nodes", "role", "group"}
+
+
+class _Reader:
+    def __init__(self, check: str, params: dict[str, Any]) -> None:
+        self.check = check
+        self.params = params
+
+    def fail(self, key: str, message: str) -> IntentValidationError:
+        return IntentValidationError(f"check '{self.check}': params.{key} {message}")
+
+    def selector(self) -> dict[str, Any]:
+        value = self.params.get("selector", {})
+        if not isinstance(value, dict):
+            raise self.fail("selector", "must be a mapping")
+        unknown = set(value) - _SELECTOR_KEYS
+        if unknown:
+            raise self.fail("selector", f"has unknown keys: {sorted(unknown)}")
+        if "nodes" in value and not isinstance(value["nodes"], list):
+            raise self.fail("selector.nodes", "must be a list")
+        return dict(value)
+
+    def str_list(self, key: str, default: list[str] | None = None) -> tuple[str, ...]:
+        value = self.params.get(key, default if default is not None else [])
+        if not isinstance(value, list):
+            raise self.fail(key, "must be a list")
+        return tuple(str(x) for x in value)
+
+    def regex_list(self, key: str) -> tuple[re.Pattern[str], ...]:
+        out = []
+        for rx in self.str_list(key):
+            try:
+                out.append(re.compile(rx))
+            except re.error as exc:
+                raise self.fail(key, f"has invalid regex {rx!r}: {exc}") from exc
+        return tuple(out)
+
+    def integer(self, key: str, default: int) -> int:
+        value = self.params.get(key, default)
+        if isinstance(value, bool):
+            raise self.fail(key, "must be an integer")
+        try:
+            return int(value)
+        except (TypeError, ValueError) as exc:
+            raise self.fail(key, "must be an integer") from exc
+
+    def boolean(self, key: str, default: bool) -> bool:
+        value = self.params.get(key, default)
+        if not isinstance(value, bool):
+            raise self.fail(key, "must be true or false")
+        return value
+
+    def choice(self, key: str, default: str, choices: set[str]) -> str:
+        value = str(self.params.get(key, default))
+        if value not in choices:
+            raise self.fail(key, f"must be one of {sorted(choices)}")
+        return value
+
+    def probes(self, required: tuple[str, ...]) -> list[dict[str, Any]]:
+        value = self.params.get("probes", [])
+        if not isinstance(value, list):
+            raise self.fail("probes", "must be a list")
+        for idx, probe in enumerate(value):
+            if not isinstance(probe, dict):
+                raise self.fail(f"probes[{idx}]", "must be a mapping")
+            missing = [k for k in required if probe.get(k) is None]
+            if missing:
+                raise self.fail(f"probes[{idx}]", f"is missing {missing}")
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigContainsParams:
+    selector: dict[str, Any]
+    required: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class InterfacesUpParams:
+    selector: dict[str, Any]
+    required_interfaces: frozenset[str]
+    required_interface_regex: tuple[re.Pattern[str], ...]
+    required_description_regex: tuple[re.Pattern[str], ...]
+    ignore_interfaces: frozenset[str]
+    ignore_interface_regex: tuple[re.Pattern[str], ...]
+
+    @property
+    def scoped(self) -> bool:
+        return bool(self.required_interfaces or self.required_interface_regex or self.required_description_regex)
+
+
+@dataclass(frozen=True, slots=True)
+class BgpEstablishedParams:
+    selector: dict[str, Any]
+    min_total: int
+    require_all: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RouteThreshold:
+    route_type: str | None
+    vni: str | None
+    rd: str | None
+    count: int
+
+    def describe(self) -> str:
+        scope = f"vni {self.vni}" if self.vni else f"rd {self.rd}" if self.rd else "all"
+        return f"{self.route_type or 'any'} routes in {scope}"
+
+
+@dataclass(frozen=True, slots=True)
+class EvpnRoutesParams:
+    selector: dict[str, Any]
+    patterns: tuple[str, ...]
+    require: str
+    min_routes: tuple[RouteThreshold, ...] = ()
+    macs: tuple[str, ...] = ()
+    ips: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class PingTargetsParams:
+    interface: str | None
+    # source -> targets, merged across probes in first-seen order
+    probes: tuple[tuple[str, tuple[str, ...]], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class NeighborProbe:
+    source: str
+    target_ip: str
+    interface: str
+
+
+@dataclass(frozen=True, slots=True)
+class L2NeighborAbsentParams:
+    probes: tuple[NeighborProbe, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class IntentDistinctParams:
+    paths: tuple[str, ...]
+
+
+def _config_contains(r: _Reader) -> ConfigContainsParams:
+    return ConfigContainsParams(r.selector(), r.str_list("required"))
+
+
+def _interfaces_up(r: _Reader) -> InterfacesUpParams:
+    return InterfacesUpParams(
+        selector=r.selector(),
+        required_interfaces=frozenset(r.str_list("required_interfaces")),
+        required_interface_regex=r.regex_list("required_interface_regex"),
+        required_description_regex=r.regex_list("required_description_regex"),
+        ignore_interfaces=frozenset(r.str_list("ignore_interfaces")),
+        ignore_interface_regex=r.regex_list("ignore_interface_regex"),
+    )
+
+
+def _bgp_established(r: _Reader) -> BgpEstablishedParams:
+    return BgpEstablishedParams(r.selector(), r.integer("min_total", 1), r.boolean("require_all", True))
+
+
+def _route_thresholds(r: _Reader) -> tuple[RouteThreshold, ...]:
+    value = r.params.get("min_routes", [])
+    if not isinstance(value, list):
+        raise r.fail("min_routes", "must be a list")
+    out = []
+    for idx, item in enumerate(value):
+        key = f"min_routes[{idx}]"
+        if not isinstance(item, dict):
+            raise r.fail(key, "must be a mapping")
+        unknown = set(item) - {"type", "vni", "rd", "count"}
+        if unknown:
+            raise r.fail(key, f"has unknown keys: {sorted(unknown)}")
+        if "vni" in item and "rd" in item:
+            raise r.fail(key, "takes either vni or rd, not both")
+        count = _Reader(r.check, item).integer("count", 1)
+        rtype = route_type(item["type"]) if item.get("type") is not None else None
+        vni = str(item["vni"]) if item.get("vni") is not None else None
+        rd = str(item["rd"]) if item.get("rd") is not None else None
+        out.append(RouteThreshold(rtype, vni, rd, count))
+    return tuple(out)
+
+
+def _evpn_routes_present(r: _Reader) -> EvpnRoutesParams:
+    return EvpnRoutesParams(
+        r.selector(),
+        r.str_list("patterns", ["mac-ip", "ip-prefix"]),
+        r.choice("require", "any", {"any", "all"}),
+        _route_thresholds(r),
+        tuple(normalize_mac(m) for m in r.str_list("macs")),
+        r.str_list("ips"),
+    )
+
+
+def _ping_targets(r: _Reader) -> PingTargetsParams:
+    interface = r.params.get("interface")
+    by_source: dict[str, list[str]] = {}
+    for idx, probe in enumerate(r.probes(("source",))):
+        targets = probe.get("targets", [])
+        if not isinstance(targets, list):
+            raise r.fail(f"probes[{idx}].targets", "must be a list")
+        bucket = by_source.setdefault(str(probe["source"]), [])
+        bucket.extend(t for t in (str(x) for x in targets) if t not in bucket)
+    return PingTargetsParams(
+        str(interface) if interface is not None else None,
+        tuple((source, tuple(targets)) for source, targets in by_source.items()),
+    )
+
+
+def _l2_neighbor_absent(r: _Reader) -> L2NeighborAbsentParams:
+    probes = r.probes(("source", "target_ip", "interface"))
+    return L2NeighborAbsentParams(
+        tuple(NeighborProbe(str(p["source"]), str(p["target_ip"]), str(p["interface"])) for p in probes)
+    )
+
+
+def _intent_distinct(r: _Reader) -> IntentDistinctParams:
+    return IntentDistinctParams(r.str_list("paths"))
+
+
+PARAM_PARSERS: dict[str, Callable[[_Reader], Any]] = {
+    "config_contains": _config_contains,
+    "interfaces_up": _interfaces_up,
+    "bgp_established": _bgp_established,
+    "evpn_routes_present": _evpn_routes_present,
+    "ping_targets": _ping_targets,
+    "l2_neighbor_absent": _l2_neighbor_absent,
+    "intent_distinct": _intent_distinct,
+}
+
+
+def parse_params(check_name: str, kind: str, params: dict[str, Any]) -> Any:
+    parser = PARAM_PARSERS.get(kind)
+    if parser is None:
+        return None
+    return parser(_Reader(check_name, params))
@@ -18,6 +18,8 @@ class CheckDef:
     kind: str
     severity: str = "ERROR"
     params: dict[str, Any] = field(default_factory=dict)
+    # Names of checks that must not have failed for this one to run.
+    depends_on: list[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -28,3 +30,7 @@ class IntentModel:
     services: dict[str, Any]
     checks: list[CheckDef]
     raw: dict[str, Any]
+    source_hash: str = ""
+    plan: Any = None
+    # Per-phase overrides of the default phase dependencies (phase -> phases it waits for).
+    phases: dict[str, list[str]] = field(default_factory=dict)
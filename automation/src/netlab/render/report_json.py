@@ -1,7 +1,23 @@
 import json
 from pathlib import Path
+from typing import Any
+
+from netlab.render.report_ndjson import iter_results_ordered
 
 
 def write_json_report(payload: dict, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def write_json_report_from_stream(stream_path: Path, summary: dict[str, Any], out_path: Path) -> None:
+    # Same document as write_json_report, written one result at a time.
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as fh:
+        fh.write('{\n  "results": [')
+        for idx, item in enumerate(iter_results_ordered(stream_path)):
+            fh.write(",\n    " if idx else "\n    ")
+            fh.write(json.dumps(item, sort_keys=True))
+        fh.write('\n  ],\n  "summary": ')
+        fh.write(json.dumps(summary, sort_keys=True))
+        fh.write("\n}")
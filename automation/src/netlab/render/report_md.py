@@ -1,23 +1,45 @@
 from pathlib import Path
+from typing import Any, Iterable
 
+from netlab.render.report_ndjson import iter_results_ordered
 
-def write_markdown_report(payload: dict, out_path: Path) -> None:
+
+def _header(summary: dict[str, Any]) -> list[str]:
     lines = ["# netlab report", "", "## Summary"]
-    summary = payload.get("summary", {})
     lines.append(f"- Exit code: {summary.get('exit_code', 1)}")
     lines.append(f"- Status counts: {summary.get('counts_by_status', {})}")
     lines.append("")
     lines.append("## Results")
+    return lines
+
+
+def _phase_lines(phase: str, items: Iterable[dict]) -> list[str]:
+    lines = [f"### {phase}"]
+    for item in items:
+        lines.append(f"- **{item['status']}** `{item['name']}`: {item['message']}")
+    lines.append("")
+    return lines
+
+
+def write_markdown_report(payload: dict, out_path: Path) -> None:
+    lines = _header(payload.get("summary", {}))
 
     grouped: dict[str, list[dict]] = {}
     for item in payload.get("results", []):
         grouped.setdefault(item.get("phase", "other"), []).append(item)
 
     for phase, items in grouped.items():
-        lines.append(f"### {phase}")
-        for item in items:
-            lines.append(f"- **{item['status']}** `{item['name']}`: {item['message']}")
-        lines.append("")
+        lines.extend(_phase_lines(phase, items))
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def write_markdown_report_from_stream(stream_path: Path, summary: dict[str, Any], out_path: Path) -> None:
+    # One pass over the stream per phase keeps memory flat regardless of result count.
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as fh:
+        fh.write("\n".join(_header(summary)))
+        for phase in summary.get("counts_by_phase", {}):
+            items = (item for item in iter_results_ordered(stream_path) if item.get("phase", "other") == phase)
+            fh.write("\n" + "\n".join(_phase_lines(phase, items)))
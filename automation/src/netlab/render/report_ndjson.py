@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+from netlab.core.model import CheckResult, CheckStatus
+
+
+class ResultStream:
+    """Appends one NDJSON line per result as it completes and keeps summary counters."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = path.open("w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.counts_by_status = {status.value: 0 for status in CheckStatus}
+        self.counts_by_phase: dict[str, int] = {}
+        self.failed = False
+
+    def write(self, results: list[CheckResult], unit: int | None = None) -> None:
+        # ``unit`` lets reports restore unit order; lines are appended in completion order.
+        extra = {} if unit is None else {"unit": unit}
+        lines = [json.dumps({**r.to_dict(), **extra}, sort_keys=True) + "\n" for r in results]
+        with self._lock:
+            self._fh.writelines(lines)
+            self._fh.flush()
+            for r in results:
+                self.counts_by_status[r.status.value] += 1
+                self.counts_by_phase[r.phase] = self.counts_by_phase.get(r.phase, 0) + 1
+                if r.fails_run:
+                    self.failed = True
+
+    @property
+    def exit_code(self) -> int:
+        return 1 if self.failed else 0
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "counts_by_status": dict(self.counts_by_status),
+                "counts_by_phase": dict(self.counts_by_phase),
+                "exit_code": self.exit_code,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+    def __enter__(self) -> ResultStream:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_results(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_results_ordered(path: Path) -> Iterator[dict[str, Any]]:
+    """Results in unit order, as a non-streamed run reports them, without the ``unit`` field.
+
+    Only (unit, offset) pairs are held in memory; each record is read back from its offset.
+    """
+    index: list[tuple[int, int]] = []
+    with path.open("rb") as fh:
+        offset = 0
+        for line in fh:
+            if line.strip():
+                index.append((json.loads(line).get("unit", 0), offset))
+            offset += len(line)
+        # sort is stable, so results of one unit keep their order
+        index.sort(key=lambda entry: entry[0])
+        for _, offset in index:
+            fh.seek(offset)
+            item = json.loads(fh.readline())
+            item.pop("unit", None)
+            yield item
@@ -1,14 +1,94 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_yaml(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+_CACHE_DIR: Path | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def set_yaml_cache(root: Path | None) -> None:
+    """Keep parsed YAML documents under ``root`` (``None`` disables the cache)."""
+    global _CACHE_DIR
+    _CACHE_DIR = Path(root) if root is not None else None
+
+
+def yaml_cache_dir() -> Path | None:
+    return _CACHE_DIR
+
+
+def _parse(path: Path, raw: bytes) -> dict[str, Any]:
+    data = yaml.load(raw, Loader=_Loader) or {}
     if not isinstance(data, dict):
         raise ValueError(f"YAML at {path} must be a mapping")
     return data
+
+
+def default_yaml_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "netlab" / "yaml"
+
+
+def _cache_path(root: Path, path: Path) -> Path:
+    return root / f"{hashlib.sha256(str(path).encode('utf-8')).hexdigest()}.json"
+
+
+def _read_entry(cache_file: Path) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _write_entry(cache_file: Path, entry: dict[str, Any]) -> None:
+    try:
+        payload = json.dumps(entry)
+    except (TypeError, ValueError):
+        return
+    # Only plain JSON documents are cached: dates, non-string keys and the like would not come back unchanged.
+    if json.loads(payload)["data"] != entry["data"]:
+        return
+    try:
+        with _CACHE_LOCK:
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, cache_file)
+    except OSError:
+        # The cache only saves time; an unwritable directory is not an error.
+        return
+
+
+def load_yaml_hashed(path: Path) -> tuple[dict[str, Any], str]:
+    """Parsed mapping and SHA-256 of the file, reusing the parsed-YAML cache when it is enabled.
+
+    The file is always read and hashed; a cache entry only replaces the parse, and only when its hash matches.
+    """
+    path = Path(path).resolve()
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    root = _CACHE_DIR
+    if root is None:
+        return _parse(path, raw), digest
+
+    cache_file = _cache_path(root, path)
+    entry = _read_entry(cache_file)
+    if entry is not None and entry.get("path") == str(path) and entry.get("sha256") == digest:
+        data = entry.get("data")
+        if isinstance(data, dict):
+            return data, digest
+    data = _parse(path, raw)
+    _write_entry(cache_file, {"path": str(path), "sha256": digest, "data": data})
+    return data, digest
+
+
+def load_yaml(path: Path) -> dict[str, Any]:
+    return load_yaml_hashed(path)[0]
@@ -1,53 +1,56 @@
 from __future__ import annotations
 
+import io
+import threading
+from concurrent.futures import Executor
 from pathlib import Path
-import re
-from typing import Any
+from typing import Any, Callable
 
 from netlab.core.model import CheckResult, CheckStatus, Severity, ValidationContext
+from netlab.evidence.blobs import preview
 from netlab.evidence.collectors.eos.bgp_oc import collect_bgp_summary
+from netlab.evidence.collectors.eos.evpn_cli import (
+    ROUTE_TYPES,
+    collect_evpn_routes,
+    index_evpn_routes,
+    route_count,
+    route_type,
+)
 from netlab.evidence.collectors.eos.interfaces_oc import collect_interfaces
-from netlab.evidence.collectors.linux.host_net import neigh_show, ping
-
-
-def _severity(value: str) -> Severity:
-    if value.upper() == "WARN":
-        return Severity.WARN
-    if value.upper() == "INFO":
-        return Severity.INFO
-    return Severity.ERROR
+from netlab.evidence.collectors.linux.host_net import ping_many, probe_neighbors
+from netlab.evidence.plan import EvidencePlan, prefetch
+from netlab.intent.compiler import PHASES, CompiledCheck, compile_intent
+from netlab.intent.params import NeighborProbe
+from netlab.validators.executor import CheckUnit, stream_units
+from netlab.validators.gating import RunGate
 
 
 def _mk(phase: str, name: str, ok: bool, severity: Severity, message: str, evidence: dict | None = None) -> CheckResult:
+    evidence = evidence or {}
+    if evidence.get("unreachable"):
+        # Nothing was observed on the node, so the check cannot pass; all its checks share this cause.
+        ok = False
+        message = f"node unreachable: {evidence['unreachable']}"
+    timed_out = evidence.get("timed_out") and not evidence.get("unreachable")
+    failed = CheckStatus.TIMEOUT if timed_out else CheckStatus.FAIL
     return CheckResult(
         phase=phase,
         name=name,
-        status=CheckStatus.PASS if ok else CheckStatus.FAIL,
+        status=CheckStatus.PASS if ok else failed,
         severity=Severity.INFO if ok else severity,
         message=message,
-        evidence=evidence or {},
+        evidence=evidence,
     )
 
 
-def _resolve_nodes(ctx: ValidationContext, selector: dict[str, Any]) -> list[str]:
-    inventory_nodes = ctx.intent.inventory.get("nodes", {})
-    if "node" in selector:
-        return [str(selector["node"])]
-    if "nodes" in selector:
-        return [str(x) for x in selector.get("nodes", [])]
-
-    out: list[str] = []
-    role = selector.get("role")
-    group = selector.get("group")
-    for node, attrs in inventory_nodes.items():
-        roles = attrs.get("roles", [])
-        groups = attrs.get("groups", [])
-        if role and role not in roles:
-            continue
-        if group and group not in groups:
-            continue
-        out.append(node)
-    return sorted(set(out))
+def _exec_flags(*data: dict) -> dict:
+    out: dict = {}
+    for d in data:
+        if d.get("timed_out"):
+            out["timed_out"] = True
+        if d.get("unreachable"):
+            out.setdefault("unreachable", d["unreachable"])
+    return out
 
 
 def _resolve_path(raw: dict[str, Any], dotted: str) -> Any:
@@ -59,154 +62,291 @@ def _resolve_path(raw: dict[str, Any], dotted: str) -> Any:
     return cur
 
 
-def run_checks(ctx: ValidationContext, mode: str) -> list[CheckResult]:
-    checks = ctx.intent.checks
-    phases = {"intent", "underlay", "control-plane", "dataplane"} if mode == "all" else {mode}
-    out: list[CheckResult] = []
+def _config_contains(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+
+    def _cfg(node: str) -> Path:
+        return Path(ctx.adapter.repo_root) / ctx.lab / "configs" / f"{node}.cfg"
+
+    def _eval(node: str) -> list[CheckResult]:
+        cfg = _cfg(node)
+        text = cfg.read_text(encoding="utf-8") if cfg.exists() else ""
+        missing = [needle for needle in params.required if needle not in text]
+        ok = len(missing) == 0
+        return [_mk(check.phase, f"{check.name}::{node}", ok, sev, "config assertion", {"missing": missing})]
+
+    return [
+        CheckUnit(check.name, node, lambda n=node: _eval(n), files=(str(_cfg(node)),)) for node in compiled.nodes
+    ]
+
+
+def _interfaces_up(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+
+    def _selected(entry: dict) -> bool:
+        iface = entry.get("interface", "")
+        desc = entry.get("description", "")
+        if iface in params.ignore_interfaces:
+            return False
+        if any(rx.search(iface) for rx in params.ignore_interface_regex):
+            return False
+        # If no explicit scope is provided, preserve legacy behavior.
+        if not params.scoped:
+            return True
+        return (
+            iface in params.required_interfaces
+            or any(rx.search(iface) for rx in params.required_interface_regex)
+            or any(rx.search(desc) for rx in params.required_description_regex)
+        )
+
+    def _eval(node: str) -> list[CheckResult]:
+        data = collect_interfaces(ctx.evidence_client, node).get("data", {})
+        selected = [entry for entry in data.get("parsed", []) if _selected(entry)]
+        bad = [
+            item for item in selected if not (item.get("status") == "up" and item.get("protocol") == "up")
+        ]
+        ok = data.get("rc", 1) == 0 and (len(selected) > 0) and (len(bad) == 0)
+        evidence = {
+            "selected_count": len(selected),
+            "bad_count": len(bad),
+            "bad_interfaces": [f"{i.get('interface')}:{i.get('status')}/{i.get('protocol')}" for i in bad],
+            **_exec_flags(data),
+        }
+        return [_mk(check.phase, f"{check.name}::{node}", ok, sev, "interface status", evidence)]
+
+    return [CheckUnit(check.name, node, lambda n=node: _eval(n), ("interfaces",)) for node in compiled.nodes]
+
+
+def _bgp_established(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+
+    def _eval(node: str) -> list[CheckResult]:
+        data = collect_bgp_summary(ctx.evidence_client, node).get("data", {})
+        parsed = data.get("parsed", {})
+        total = int(parsed.get("total", 0))
+        est = int(parsed.get("established", 0))
+        min_total = params.min_total
+        ok = total >= min_total and ((est == total) if params.require_all else (est >= min_total))
+        evidence = {**parsed, **_exec_flags(data)}
+        return [_mk(check.phase, f"{check.name}::{node}", ok, sev, f"established {est}/{total}", evidence)]
+
+    return [CheckUnit(check.name, node, lambda n=node: _eval(n), ("bgp-summary",)) for node in compiled.nodes]
+
+
+def _evpn_routes_present(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+    patterns = list(params.patterns)
+
+    def _pattern_hit(index: dict, raw: Any, pattern: str) -> bool:
+        rtype = route_type(pattern)
+        if rtype in ROUTE_TYPES.values():
+            return route_count(index, rtype) > 0
+        return pattern in ctx.evidence_client.text(raw)
+
+    def _eval(node: str) -> list[CheckResult]:
+        data = collect_evpn_routes(ctx.evidence_client, node).get("data", {})
+        rc = data.get("rc", 1)
+        index = data.get("parsed")
+        if index is None:
+            index = index_evpn_routes(io.StringIO(ctx.evidence_client.text(data.get("raw", ""))))
+        shortfalls = []
+        missing_macs: list[str] = []
+        missing_ips: list[str] = []
+        ok = False
+        if rc == 0:
+            hits = [_pattern_hit(index, data.get("raw", ""), p) for p in patterns]
+            ok = all(hits) if params.require == "all" else any(hits)
+            for want in params.min_routes:
+                have = route_count(index, want.route_type, want.vni, want.rd)
+                if have < want.count:
+                    shortfalls.append({"routes": want.describe(), "min": want.count, "found": have})
+            missing_macs = [m for m in params.macs if m not in index.get("macs", {})]
+            missing_ips = [ip for ip in params.ips if ip not in index.get("ips", {})]
+            ok = ok and not shortfalls and not missing_macs and not missing_ips
+        evidence = {
+            "rc": rc,
+            "patterns": patterns,
+            "routes": index.get("routes", 0),
+            "by_type": index.get("by_type", {}),
+            "by_vni": index.get("by_vni", {}),
+            # A digest or preview only: without a blob store the full dump would land in every report.
+            "raw": preview(data.get("raw", "")),
+            **_exec_flags(data),
+        }
+        if shortfalls:
+            evidence["shortfalls"] = shortfalls
+        if missing_macs:
+            evidence["missing_macs"] = missing_macs
+        if missing_ips:
+            evidence["missing_ips"] = missing_ips
+        return [_mk(check.phase, f"{check.name}::{node}", ok, sev, "evpn routes check", evidence)]
+
+    return [CheckUnit(check.name, node, lambda n=node: _eval(n), ("evpn-routes",)) for node in compiled.nodes]
+
+
+def _ping_targets(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+
+    def _eval(source: str, targets: list[str]) -> list[CheckResult]:
+        res = ping_many(ctx.adapter, source, targets, interface=params.interface)
+        out: list[CheckResult] = []
+        for target in targets:
+            item = res["targets"][target]
+            evidence = {k: item[k] for k in ("rc", "loss_pct", "rtt_min_ms", "rtt_avg_ms", "rtt_max_ms")}
+            evidence.update(_exec_flags(res))
+            out.append(_mk(check.phase, f"{check.name}::{source}->{target}", item["rc"] == 0, sev, "ping", evidence))
+        return out
+
+    return [
+        CheckUnit(check.name, source, lambda s=source, t=list(targets): _eval(s, t), live=True)
+        for source, targets in params.probes
+    ]
 
-    for check in checks:
+
+def _l2_neighbor_absent(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev, params = compiled.check, compiled.severity, compiled.params
+    by_source: dict[str, list[NeighborProbe]] = {}
+    for probe in params.probes:
+        by_source.setdefault(probe.source, []).append(probe)
+
+    def _eval(source: str, probes: list[NeighborProbe]) -> list[CheckResult]:
+        res = probe_neighbors(ctx.adapter, source, [(p.target_ip, p.interface) for p in probes])
+        flags = _exec_flags(res)
+        out: list[CheckResult] = []
+        for p in probes:
+            entry = res["neighbors"].get(p.interface, {}).get(p.target_ip)
+            learned = entry is not None and "lladdr" in entry
+            # An absence seen through a wedged exec, or without a neighbor table, proves nothing.
+            ok = not learned and not flags and res["rc"] == 0
+            evidence = {"interface": p.interface, "rc": res["rc"], "neighbor": entry, "learned": learned, **flags}
+            out.append(_mk(check.phase, f"{check.name}::{source}->{p.target_ip}", ok, sev, "neighbor absence", evidence))
+        return out
+
+    return [
+        CheckUnit(check.name, source, lambda s=source, ps=list(probes): _eval(s, ps), live=True)
+        for source, probes in by_source.items()
+    ]
+
+
+def _intent_distinct(ctx: ValidationContext, compiled: CompiledCheck) -> list[CheckUnit]:
+    check, sev = compiled.check, compiled.severity
+    paths = list(compiled.params.paths)
+
+    def _eval() -> list[CheckResult]:
+        values = [_resolve_path(ctx.intent.raw, p) for p in paths]
+        comparable = [v for v in values if v is not None]
+        ok = len(comparable) == len(set(str(x) for x in comparable)) and len(comparable) == len(paths)
+        return [_mk(check.phase, check.name, ok, sev, "intent values must be distinct", {"paths": paths, "values": values})]
+
+    return [CheckUnit(check.name, None, _eval)]
+
+
+UnitBuilder = Callable[[ValidationContext, CompiledCheck], list[CheckUnit]]
+
+CHECK_KINDS: dict[str, UnitBuilder] = {
+    "config_contains": _config_contains,
+    "interfaces_up": _interfaces_up,
+    "bgp_established": _bgp_established,
+    "evpn_routes_present": _evpn_routes_present,
+    "ping_targets": _ping_targets,
+    "l2_neighbor_absent": _l2_neighbor_absent,
+    "intent_distinct": _intent_distinct,
+}
+
+
+def build_units(ctx: ValidationContext, mode: str) -> list[CheckUnit]:
+    phases = set(PHASES) if mode == "all" else {mode}
+    plan = ctx.intent.plan or compile_intent(ctx.intent)
+    units: list[CheckUnit] = []
+    for compiled in plan.checks:
+        check = compiled.check
         if check.phase not in phases:
             continue
-        sev = _severity(check.severity)
-        params = check.params
-
-        if check.kind == "config_contains":
-            selector = dict(params.get("selector", {}))
-            required = [str(x) for x in params.get("required", [])]
-            nodes = _resolve_nodes(ctx, selector)
-            for node in nodes:
-                cfg = Path(ctx.adapter.repo_root) / ctx.lab / "configs" / f"{node}.cfg"
-                text = cfg.read_text(encoding="utf-8") if cfg.exists() else ""
-                missing = [needle for needle in required if needle not in text]
-                ok = len(missing) == 0
-                out.append(_mk(check.phase, f"{check.name}::{node}", ok, sev, "config assertion", {"missing": missing}))
+        builder = CHECK_KINDS.get(check.kind)
+        if builder is None:
+            result = _mk(check.phase, check.name, False, compiled.severity, f"Unsupported check kind: {check.kind}")
+            units.append(CheckUnit(check.name, None, lambda r=result: [r]))
             continue
+        units.extend(builder(ctx, compiled))
+    return units
 
-        if check.kind == "interfaces_up":
-            nodes = _resolve_nodes(ctx, dict(params.get("selector", {})))
-            required_interfaces = {str(x) for x in params.get("required_interfaces", [])}
-            required_interface_regex = [str(x) for x in params.get("required_interface_regex", [])]
-            required_description_regex = [str(x) for x in params.get("required_description_regex", [])]
-            ignore_interfaces = {str(x) for x in params.get("ignore_interfaces", [])}
-            ignore_interface_regex = [str(x) for x in params.get("ignore_interface_regex", [])]
-            for node in nodes:
-                data = collect_interfaces(ctx.evidence_client, node).get("data", {})
-                parsed = data.get("parsed", [])
-                selected = []
-                for entry in parsed:
-                    iface = entry.get("interface", "")
-                    desc = entry.get("description", "")
-
-                    if iface in ignore_interfaces:
-                        continue
-                    if any(re.search(rx, iface) for rx in ignore_interface_regex):
-                        continue
-
-                    selected_by_rule = False
-                    if required_interfaces and iface in required_interfaces:
-                        selected_by_rule = True
-                    if required_interface_regex and any(re.search(rx, iface) for rx in required_interface_regex):
-                        selected_by_rule = True
-                    if required_description_regex and any(re.search(rx, desc) for rx in required_description_regex):
-                        selected_by_rule = True
-
-                    # If no explicit scope is provided, preserve legacy behavior.
-                    if not (required_interfaces or required_interface_regex or required_description_regex):
-                        selected_by_rule = True
-
-                    if selected_by_rule:
-                        selected.append(entry)
-
-                bad = [
-                    item for item in selected if not (item.get("status") == "up" and item.get("protocol") == "up")
-                ]
-                ok = data.get("rc", 1) == 0 and (len(selected) > 0) and (len(bad) == 0)
-                evidence = {
-                    "selected_count": len(selected),
-                    "bad_count": len(bad),
-                    "bad_interfaces": [f"{i.get('interface')}:{i.get('status')}/{i.get('protocol')}" for i in bad],
-                }
-                out.append(_mk(check.phase, f"{check.name}::{node}", ok, sev, "interface status", evidence))
-            continue
 
-        if check.kind == "bgp_established":
-            nodes = _resolve_nodes(ctx, dict(params.get("selector", {})))
-            min_total = int(params.get("min_total", 1))
-            require_all = bool(params.get("require_all", True))
-            for node in nodes:
-                parsed = collect_bgp_summary(ctx.evidence_client, node).get("data", {}).get("parsed", {})
-                total = int(parsed.get("total", 0))
-                est = int(parsed.get("established", 0))
-                ok = total >= min_total and ((est == total) if require_all else (est >= min_total))
-                out.append(_mk(check.phase, f"{check.name}::{node}", ok, sev, f"established {est}/{total}", parsed))
-            continue
+def plan_evidence(units: list[CheckUnit]) -> EvidencePlan:
+    plan = EvidencePlan()
+    for unit in units:
+        if unit.node is not None and unit.evidence:
+            plan.add(unit.node, unit.evidence)
+    return plan
 
-        if check.kind == "evpn_routes_present":
-            nodes = _resolve_nodes(ctx, dict(params.get("selector", {})))
-            patterns = [str(x) for x in params.get("patterns", ["mac-ip", "ip-prefix"])]
-            require = str(params.get("require", "any"))
-            for node in nodes:
-                r = ctx.adapter.eos_cli(node, "show bgp evpn")
-                ok = False
-                if r.rc == 0:
-                    if require == "all":
-                        ok = all(p in r.stdout for p in patterns)
-                    else:
-                        ok = any(p in r.stdout for p in patterns)
-                out.append(_mk(check.phase, f"{check.name}::{node}", ok, sev, "evpn routes check", {"rc": r.rc, "patterns": patterns}))
-            continue
 
-        if check.kind == "ping_targets":
-            interface = params.get("interface")
-            probes = params.get("probes", [])
-            for probe in probes:
-                source = str(probe.get("source"))
-                targets = [str(x) for x in probe.get("targets", [])]
-                for target in targets:
-                    res = ping(ctx.adapter, source, target, interface=interface)
-                    out.append(_mk(check.phase, f"{check.name}::{source}->{target}", res.get("rc", 1) == 0, sev, "ping", {"rc": res.get("rc", 1)}))
-            continue
+# Receives each finished unit's results with the unit's index; calls are serialized.
+ResultSink = Callable[[int, list[CheckResult]], None]
 
-        if check.kind == "l2_neighbor_absent":
-            probes = params.get("probes", [])
-            for probe in probes:
-                source = str(probe.get("source"))
-                target_ip = str(probe.get("target_ip"))
-                interface = str(probe.get("interface"))
-                ping(ctx.adapter, source, target_ip, interface=interface)
-                neigh = neigh_show(ctx.adapter, source, interface)
-                raw = neigh.get("out", "")
-                matched_lines = [
-                    line.strip()
-                    for line in raw.splitlines()
-                    if line.strip().startswith(target_ip + " ")
-                ]
-                learned_lines = [line for line in matched_lines if " lladdr " in line]
-                ok = len(learned_lines) == 0
-                out.append(
-                    _mk(
-                        check.phase,
-                        f"{check.name}::{source}->{target_ip}",
-                        ok,
-                        sev,
-                        "neighbor absence",
-                        {
-                            "interface": interface,
-                            "matched_lines": matched_lines,
-                            "learned_lines": learned_lines,
-                        },
-                    )
-                )
-            continue
+# Runs one wave: ``units`` are the gated units for ``indexes`` and report each finished unit to ``done``.
+WaveExecutor = Callable[[list[int], list[CheckUnit], Callable[[int, list[CheckResult]], None]], None]
 
-        if check.kind == "intent_distinct":
-            paths = [str(x) for x in params.get("paths", [])]
-            values = [_resolve_path(ctx.intent.raw, p) for p in paths]
-            comparable = [v for v in values if v is not None]
-            ok = len(comparable) == len(set(str(x) for x in comparable)) and len(comparable) == len(paths)
-            out.append(_mk(check.phase, check.name, ok, sev, "intent values must be distinct", {"paths": paths, "values": values}))
-            continue
 
-        out.append(_mk(check.phase, check.name, False, sev, f"Unsupported check kind: {check.kind}"))
+def run_units(
+    ctx: ValidationContext,
+    units: list[CheckUnit],
+    execute_wave: WaveExecutor,
+    sink: ResultSink | None = None,
+    max_failures: int = 0,
+) -> list[CheckResult]:
+    """Drive ``units`` through ``execute_wave`` in dependency waves, skipping what earlier failures block."""
+    plan = ctx.intent.plan or compile_intent(ctx.intent)
+    compiled = {c.check.name: c for c in plan.checks}
+    gate = RunGate(max_failures)
+    chunks: list[list[CheckResult]] = [[] for _ in units]
+    waves: dict[int, list[int]] = {}
+    sink_lock = threading.Lock()
+    for idx, unit in enumerate(units):
+        waves.setdefault(compiled[unit.check_name].level, []).append(idx)
 
-    return out
+    def _done(idx: int, results: list[CheckResult]) -> None:
+        gate.observe(compiled[units[idx].check_name], results)
+        if sink is not None:
+            with sink_lock:
+                sink(idx, results)
+        else:
+            chunks[idx] = results
+
+    for level in sorted(waves):
+        runnable: list[int] = []
+        for idx in waves[level]:
+            skipped = gate.skip(compiled[units[idx].check_name], units[idx])
+            if skipped is None:
+                runnable.append(idx)
+            else:
+                _done(idx, [skipped])
+        if runnable:
+            wave = [
+                gate.wrap(compiled[units[idx].check_name], units[idx], lambda results, idx=idx: _done(idx, results))
+                for idx in runnable
+            ]
+            execute_wave(runnable, wave, _done)
+    # Results are reported in unit order whatever wave produced them, so report order matches serial runs.
+    return [result for chunk in chunks for result in chunk]
+
+
+def run_checks(
+    ctx: ValidationContext,
+    mode: str,
+    jobs: int = 1,
+    per_node: int = 1,
+    pool: Executor | None = None,
+    sink: ResultSink | None = None,
+    max_failures: int = 0,
+) -> list[CheckResult]:
+    """Run checks for ``mode``; with a ``sink`` results are streamed to it, with their unit index, as they complete and [] is returned.
+
+    Checks run in dependency waves; units of checks blocked by an earlier failure, or left over once
+    ``max_failures`` is reached, are reported as SKIP without collecting their evidence.
+    """
+
+    def _execute(indexes: list[int], wave: list[CheckUnit], done: Callable[[int, list[CheckResult]], None]) -> None:
+        # Fetch every (node, evidence) item of the wave exactly once before any of its checks is evaluated.
+        prefetch(ctx.evidence_client, ctx.adapter, plan_evidence(wave), jobs=jobs, pool=pool)
+        stream_units(wave, lambda results: None, jobs=jobs, per_node=per_node, pool=pool)
+
+    return run_units(ctx, build_units(ctx, mode), _execute, sink=sink, max_failures=max_failures)
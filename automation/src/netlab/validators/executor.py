@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable
+
+from netlab.core.model import CheckResult
+from netlab.core.tracing import span
+
+
+@dataclass(slots=True)
+class CheckUnit:
+    # Smallest independently schedulable piece of a check, usually one node.
+    check_name: str
+    node: str | None
+    evaluate: Callable[[], list[CheckResult]]
+    evidence: tuple[str, ...] = ()
+    # Repo files read by the unit, and whether it probes the lab directly (pings).
+    files: tuple[str, ...] = ()
+    live: bool = False
+
+
+class _NodeLimiter:
+    def __init__(self, per_node: int) -> None:
+        self.per_node = max(1, per_node)
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.Semaphore] = {}
+
+    def slot(self, node: str) -> threading.Semaphore:
+        with self._lock:
+            if node not in self._slots:
+                self._slots[node] = threading.Semaphore(self.per_node)
+            return self._slots[node]
+
+
+def _evaluate(unit: CheckUnit) -> list[CheckResult]:
+    label = f"{unit.check_name}::{unit.node}" if unit.node else unit.check_name
+    with span("check", f"check {label}", check=unit.check_name, node=unit.node):
+        return unit.evaluate()
+
+
+def execute_unit_results(
+    units: list[CheckUnit],
+    jobs: int = 1,
+    per_node: int = 1,
+    pool: Executor | None = None,
+) -> list[list[CheckResult]]:
+    """Evaluate units and return their results grouped per unit, in unit order.
+
+    A caller-owned ``pool`` is used as-is so several runs can share one bounded set of workers.
+    """
+    if pool is None and (jobs <= 1 or len(units) <= 1):
+        return [_evaluate(unit) for unit in units]
+
+    limiter = _NodeLimiter(per_node)
+
+    def _run(unit: CheckUnit) -> list[CheckResult]:
+        if unit.node is None:
+            return _evaluate(unit)
+        with limiter.slot(unit.node):
+            return _evaluate(unit)
+
+    # Results are collected by unit index so report order matches serial runs.
+    if pool is not None:
+        return [f.result() for f in [pool.submit(_run, unit) for unit in units]]
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="netlab-check") as own:
+        return [f.result() for f in [own.submit(_run, unit) for unit in units]]
+
+
+def execute_units(
+    units: list[CheckUnit],
+    jobs: int = 1,
+    per_node: int = 1,
+    pool: Executor | None = None,
+) -> list[CheckResult]:
+    return [result for chunk in execute_unit_results(units, jobs, per_node, pool) for result in chunk]
+
+
+def stream_units(
+    units: list[CheckUnit],
+    sink: Callable[[list[CheckResult]], None],
+    jobs: int = 1,
+    per_node: int = 1,
+    pool: Executor | None = None,
+) -> None:
+    """Hand each unit's results to ``sink`` as soon as it finishes; nothing is kept here."""
+    if pool is None and (jobs <= 1 or len(units) <= 1):
+        for unit in units:
+            sink(_evaluate(unit))
+        return
+
+    limiter = _NodeLimiter(per_node)
+
+    def _run(unit: CheckUnit) -> None:
+        if unit.node is None:
+            sink(_evaluate(unit))
+            return
+        with limiter.slot(unit.node):
+            results = _evaluate(unit)
+        sink(results)
+
+    if pool is not None:
+        for future in as_completed([pool.submit(_run, unit) for unit in units]):
+            future.result()
+        return
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="netlab-check") as own:
+        for future in as_completed([own.submit(_run, unit) for unit in units]):
+            future.result()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import replace
+from typing import Callable
+
+from netlab.core.model import CheckResult, CheckStatus, Severity
+from netlab.intent.compiler import CompiledCheck
+from netlab.validators.executor import CheckUnit
+
+
+def _skip(compiled: CompiledCheck, unit: CheckUnit, message: str, evidence: dict) -> CheckResult:
+    name = f"{unit.check_name}::{unit.node}" if unit.node else unit.check_name
+    return CheckResult(compiled.check.phase, name, CheckStatus.SKIP, Severity.INFO, message, evidence)
+
+
+class RunGate:
+    """Tracks blocking failures while a run proceeds wave by wave.
+
+    A check is blocked when one of its ``depends_on`` checks, or any check of a phase it waits for,
+    failed or was itself blocked; ``max_failures`` (0 = unlimited) stops the run once reached.
+    """
+
+    def __init__(self, max_failures: int = 0) -> None:
+        self.max_failures = max_failures
+        self.failures = 0
+        # check -> root-cause check, and phase -> first check in it that failed or was blocked.
+        self._failed: dict[str, str] = {}
+        self._phases: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stopped(self) -> bool:
+        return self.max_failures > 0 and self.failures >= self.max_failures
+
+    def _mark(self, compiled: CompiledCheck, root: str) -> None:
+        with self._lock:
+            self._failed.setdefault(compiled.check.name, root)
+            self._phases.setdefault(compiled.check.phase, compiled.check.name)
+
+    def blocker(self, compiled: CompiledCheck) -> str | None:
+        for dep in compiled.depends_on:
+            if dep in self._failed:
+                return dep
+        for phase in compiled.after_phases:
+            if phase in self._phases:
+                return self._phases[phase]
+        return None
+
+    def skip(self, compiled: CompiledCheck, unit: CheckUnit) -> CheckResult | None:
+        """SKIP result for a unit that must not run, or None if it may."""
+        blocker = self.blocker(compiled)
+        if blocker is not None:
+            root = self._failed[blocker]
+            self._mark(compiled, root)
+            message = f"skipped: depends on {blocker} which did not pass"
+            if root != blocker:
+                message += f" (root cause: {root})"
+            return _skip(compiled, unit, message, {"blocked_by": blocker, "root_cause": root})
+        if self.stopped:
+            message = f"skipped: run stopped after {self.failures} failure(s)"
+            return _skip(compiled, unit, message, {"stopped_after": self.failures})
+        return None
+
+    def observe(self, compiled: CompiledCheck, results: list[CheckResult]) -> None:
+        failing = sum(1 for r in results if r.fails_run)
+        if failing:
+            with self._lock:
+                self.failures += failing
+            self._mark(compiled, compiled.check.name)
+
+    def wrap(self, compiled: CompiledCheck, unit: CheckUnit, done: Callable[[list[CheckResult]], None]) -> CheckUnit:
+        """Unit that re-checks the gate when it starts (fail-fast mid-wave) and hands its results to ``done``."""
+
+        def _evaluate() -> list[CheckResult]:
+            skipped = self.skip(compiled, unit)
+            results = [skipped] if skipped is not None else unit.evaluate()
+            done(results)
+            return results
+
+        return replace(unit, evaluate=_evaluate)
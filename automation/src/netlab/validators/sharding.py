@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import multiprocessing
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable
+
+from netlab.core.model import CheckResult, ValidationContext
+from netlab.evidence.plan import prefetch
+from netlab.validators.engine import ResultSink, build_units, plan_evidence, run_units
+from netlab.validators.executor import CheckUnit, execute_unit_results
+
+SHARD_KEYS = ("hash", "role", "group")
+
+# Per worker process: the context built by the run's factory and the run's units, in coordinator order.
+_WORKER: dict[str, Any] = {}
+
+
+def _stable_shard(key: str, shards: int) -> int:
+    # str hashes are salted per process; every process must agree on where a node lives.
+    return zlib.crc32(key.encode("utf-8")) % shards
+
+
+def assign_shards(units: list[CheckUnit], inventory: dict[str, Any], shards: int, by: str = "hash") -> list[int]:
+    """Shard index of every unit; all units of one node (or one role/group set) land on the same shard.
+
+    ``hash`` spreads nodes by a stable hash. ``role``/``group`` keep nodes with the same roles/groups together
+    and place the largest sets first on the least loaded shard.
+    """
+    if by not in SHARD_KEYS:
+        raise ValueError(f"shard key must be one of {'|'.join(SHARD_KEYS)}")
+    nodes = inventory.get("nodes", {})
+
+    def _key(unit: CheckUnit) -> str:
+        if unit.node is None:
+            return f"check:{unit.check_name}"
+        if by == "hash":
+            return unit.node
+        values = (nodes.get(unit.node) or {}).get("roles" if by == "role" else "groups", [])
+        return ",".join(sorted(str(v) for v in values)) or unit.node
+
+    keys = [_key(unit) for unit in units]
+    if by == "hash":
+        return [_stable_shard(key, shards) for key in keys]
+    load = [0] * shards
+    owner: dict[str, int] = {}
+    for key, weight in sorted(Counter(keys).items(), key=lambda kv: (-kv[1], kv[0])):
+        shard = min(range(shards), key=lambda s: load[s])
+        owner[key] = shard
+        load[shard] += weight
+    return [owner[key] for key in keys]
+
+
+def _init_worker(factory: Callable[[], ValidationContext], mode: str, jobs: int, per_node: int) -> None:
+    ctx = factory()
+    _WORKER.update(ctx=ctx, units=build_units(ctx, mode), jobs=jobs, per_node=per_node)
+
+
+def _run_shard(indexes: list[int]) -> list[tuple[int, list[CheckResult]]]:
+    ctx, jobs = _WORKER["ctx"], _WORKER["jobs"]
+    wave = [_WORKER["units"][idx] for idx in indexes]
+    prefetch(ctx.evidence_client, ctx.adapter, plan_evidence(wave), jobs=jobs)
+    return list(zip(indexes, execute_unit_results(wave, jobs=jobs, per_node=_WORKER["per_node"])))
+
+
+def run_sharded(
+    factory: Callable[[], ValidationContext],
+    mode: str,
+    shards: int,
+    by: str = "hash",
+    jobs: int = 1,
+    per_node: int = 1,
+    sink: ResultSink | None = None,
+    max_failures: int = 0,
+) -> list[CheckResult]:
+    """Like ``run_checks``, but units are evaluated by ``shards`` worker processes.
+
+    ``factory`` must be picklable (a module-level function or a ``functools.partial`` of one): each worker
+    calls it once to build its own adapter and evidence client. Each shard keeps one process for the whole run,
+    so a node's evidence and breaker state stay in one place; ``jobs`` threads run inside every worker.
+    Dependency gating happens here between waves, so ``max_failures`` is applied at wave boundaries.
+    """
+    ctx = factory()
+    units = build_units(ctx, mode)
+    owner = assign_shards(units, ctx.intent.inventory, shards, by)
+    # spawn, not fork: the coordinator may already have threads (and Docker connections) running.
+    spawn = multiprocessing.get_context("spawn")
+    pools = [
+        ProcessPoolExecutor(1, mp_context=spawn, initializer=_init_worker, initargs=(factory, mode, jobs, per_node))
+        for _ in range(shards)
+    ]
+
+    def _execute(indexes: list[int], wave: list[CheckUnit], done: Callable[[int, list[CheckResult]], None]) -> None:
+        by_shard: dict[int, list[int]] = {}
+        for idx in indexes:
+            by_shard.setdefault(owner[idx], []).append(idx)
+        futures = [pools[shard].submit(_run_shard, chunk) for shard, chunk in by_shard.items()]
+        for future in as_completed(futures):
+            for idx, results in future.result():
+                done(idx, results)
+
+    try:
+        return run_units(ctx, units, _execute, sink=sink, max_failures=max_failures)
+    finally:
+        for pool in pools:
+            pool.shutdown(cancel_futures=True)
+        ctx.close()
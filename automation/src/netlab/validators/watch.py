@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from netlab.core.errors import IntentValidationError
+from netlab.core.model import CheckResult, ValidationContext
+from netlab.core.results import RunSummary
+from netlab.evidence.plan import EVIDENCE_KINDS, prefetch
+from netlab.intent.loader import intent_path, load_intent
+from netlab.utils.hashing import sha256_file, sha256_json
+from netlab.validators.engine import build_units, plan_evidence
+from netlab.validators.executor import CheckUnit, execute_unit_results
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Transition:
+    result: CheckResult
+    previous: str | None  # None when the result is new
+
+    def to_line(self) -> str:
+        before = self.previous or "NEW"
+        r = self.result
+        return f"[{r.phase}] {r.name}: {before} -> {r.status.value} - {r.message}"
+
+
+def evidence_fingerprint(data: dict) -> str:
+    # Parsed evidence only: raw text carries counters and timers that tick every poll.
+    if "parsed" in data:
+        return sha256_json({"rc": data.get("rc"), "parsed": data["parsed"]})
+    return sha256_json(data)
+
+
+def _file_fingerprint(path: str) -> str:
+    try:
+        return sha256_file(Path(path))
+    except OSError:
+        return ""
+
+
+class Watcher:
+    """Keeps a warm context and re-evaluates only units whose inputs changed between polls."""
+
+    def __init__(self, ctx: ValidationContext, mode: str, jobs: int = 1, per_node: int = 1) -> None:
+        self.ctx = ctx
+        self.mode = mode
+        self.jobs = jobs
+        self.per_node = per_node
+        self.polls = 0
+        self.evaluated = 0
+        self._units: list[CheckUnit] = []
+        self._unit_results: list[list[CheckResult]] = []
+        self._evidence: dict[str, str] = {}
+        self._files: dict[str, str] = {}
+        self._intent_fp = ""
+        # Disk-cached evidence would hide changes between polls.
+        ctx.evidence_client.refresh = True
+
+    def summary(self) -> RunSummary:
+        summary = RunSummary()
+        for chunk in self._unit_results:
+            for result in chunk:
+                summary.add(result)
+        return summary
+
+    def _reload_intent(self) -> bool:
+        path = intent_path(self.ctx.adapter.repo_root, self.ctx.lab)
+        fp = _file_fingerprint(str(path))
+        if fp == self._intent_fp:
+            return False
+        if self._intent_fp:
+            try:
+                self.ctx.intent = load_intent(Path(self.ctx.adapter.repo_root), self.ctx.lab)
+            except IntentValidationError as exc:
+                log.warning("Keeping previous intent, reload failed: %s", exc)
+                self._intent_fp = fp
+                return False
+        self._intent_fp = fp
+        self._units = build_units(self.ctx, self.mode)
+        self._unit_results = [[] for _ in self._units]
+        return True
+
+    def _changed_evidence(self) -> set[str]:
+        plan = plan_evidence(self._units)
+        prefetch(self.ctx.evidence_client, self.ctx.adapter, plan, jobs=self.jobs)
+        changed: set[str] = set()
+        for node, kinds in plan.items.items():
+            for name in kinds:
+                kind = EVIDENCE_KINDS[name]
+                fp = evidence_fingerprint(kind.collect(self.ctx.evidence_client, node).get("data", {}))
+                key = kind.cache_key(node)
+                if self._evidence.get(key) != fp:
+                    changed.add(key)
+                self._evidence[key] = fp
+        return changed
+
+    def _changed_files(self) -> set[str]:
+        changed: set[str] = set()
+        for path in {p for unit in self._units for p in unit.files}:
+            fp = _file_fingerprint(path)
+            if self._files.get(path) != fp:
+                changed.add(path)
+            self._files[path] = fp
+        return changed
+
+    def _dirty(self, unit: CheckUnit, evidence: set[str], files: set[str]) -> bool:
+        if unit.live:
+            return True
+        if any(EVIDENCE_KINDS[k].cache_key(unit.node) in evidence for k in unit.evidence):
+            return True
+        return any(p in files for p in unit.files)
+
+    def poll(self) -> list[Transition]:
+        # Fresh evidence every poll; the transports and connections stay warm.
+        self.ctx.evidence_client.invalidate()
+        forget = getattr(self.ctx.adapter, "forget_eos", None)
+        if forget is not None:
+            forget()
+        health = getattr(self.ctx.adapter, "health", None)
+        if health is not None:
+            # A node stopped in one poll may be back in the next.
+            health.reset()
+
+        before = {r.name: r.status.value for chunk in self._unit_results for r in chunk}
+        rebuilt = self._reload_intent()
+        evidence = self._changed_evidence()
+        files = self._changed_files()
+        first = self.polls == 0 or rebuilt
+        self.polls += 1
+
+        indexes = [i for i, unit in enumerate(self._units) if first or self._dirty(unit, evidence, files)]
+        chunks = execute_unit_results([self._units[i] for i in indexes], jobs=self.jobs, per_node=self.per_node)
+        for i, chunk in zip(indexes, chunks):
+            self._unit_results[i] = chunk
+        self.evaluated += len(indexes)
+
+        out: list[Transition] = []
+        for chunk in chunks:
+            for result in chunk:
+                previous = before.get(result.name)
+                if previous != result.status.value:
+                    out.append(Transition(result, previous))
+        return out
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from netlab.adapters.base import CmdResult
+from netlab.cli import RunOptions, _ctx, app
+from netlab.core.model import ValidationContext
+from netlab.evidence.blobs import INLINE_LIMIT, BlobStore
+from netlab.evidence.cache import DiskEvidenceCache
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.collectors.eos.evpn_cli import collect_evpn_routes
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import run_checks
+
+ROUTES = "\n".join(f" * >  RD: 10.255.1.1:10100 mac-ip 0000.0000.{i:04d}" for i in range(50))
+
+
+class _Adapter:
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        return CmdResult(0, ROUTES, "")
+
+
+def test_raw_output_stored_once_by_digest(tmp_path: Path) -> None:
+    blobs = BlobStore(tmp_path / "blobs")
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(_Adapter()), blobs=blobs)
+
+    data = collect_evpn_routes(client, "leaf1")["data"]
+    ref = data["raw"]
+    assert ref["bytes"] == len(ROUTES) and len(ref["preview"]) == INLINE_LIMIT
+    assert data["err"] == ""
+    assert client.text(ref) == ROUTES
+    collect_evpn_routes(client, "leaf2")
+    assert len(list((tmp_path / "blobs").rglob("*.gz"))) == 1
+
+    result = CliRunner().invoke(app, ["--no-yaml-cache", "evidence", "show", ref["digest"][:10], "--blob-dir", str(tmp_path / "blobs")])
+    assert result.exit_code == 0 and result.output == ROUTES
+
+
+def test_disk_cache_entry_with_missing_blob_is_a_miss(tmp_path: Path) -> None:
+    disk = DiskEvidenceCache(tmp_path / "cache", "lab")
+    first = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(_Adapter()), disk_cache=disk, blobs=BlobStore(tmp_path / "a"))
+    collect_evpn_routes(first, "leaf1")
+
+    second = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(_Adapter()), disk_cache=disk, blobs=BlobStore(tmp_path / "b"))
+    assert not second.is_cached("evpn-routes:leaf1", "leaf1")
+    assert second.text(collect_evpn_routes(second, "leaf1")["data"]["raw"]) == ROUTES
+
+
+def test_check_evidence_keeps_only_a_preview_without_blob_store() -> None:
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(_Adapter()))
+    checks = [CheckDef("evpn", "control-plane", "evpn_routes_present", params={"selector": {"node": "leaf1"}})]
+    intent = IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, checks, {})
+    (result,) = run_checks(ValidationContext("lab", "fast", intent, _Adapter(), client), "all")
+    assert result.evidence["raw"] == {"bytes": len(ROUTES), "preview": ROUTES[:INLINE_LIMIT]}
+
+
+def test_blob_store_is_opt_in(tmp_path: Path) -> None:
+    with _ctx("ceos-4s4l", "fast") as ctx:
+        assert ctx.evidence_client.blobs is None
+    with _ctx("ceos-4s4l", "fast", RunOptions(gnmi=False, blob_dir=tmp_path / "blobs")) as ctx:
+        assert ctx.evidence_client.blobs.root == tmp_path / "blobs"
@@ -0,0 +1,75 @@
+import pytest
+
+from netlab.core.errors import IntentValidationError
+from netlab.core.model import CheckStatus, ValidationContext
+from netlab.intent.compiler import compile_intent
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import run_checks
+
+RAW = {"a": 1, "b": 2, "same": 1}
+
+
+def _check(name: str, phase: str, ok: bool = True, depends_on: tuple[str, ...] = ()) -> CheckDef:
+    paths = ["a", "b"] if ok else ["a", "same"]
+    return CheckDef(name, phase, "intent_distinct", params={"paths": paths}, depends_on=list(depends_on))
+
+
+def _intent(*checks: CheckDef, phases: dict | None = None) -> IntentModel:
+    return IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, list(checks), RAW, phases=phases or {})
+
+
+def _run(intent: IntentModel, **kwargs) -> dict[str, tuple[CheckStatus, dict]]:
+    ctx = ValidationContext("lab", "fast", intent, adapter=None, evidence_client=None)
+    return {r.name: (r.status, r.evidence) for r in run_checks(ctx, "all", **kwargs)}
+
+
+def test_default_phase_order() -> None:
+    plan = compile_intent(
+        _intent(_check("dp", "dataplane"), _check("cp", "control-plane"), _check("ul", "underlay"), _check("i", "intent"))
+    )
+    assert {c.check.name: c.level for c in plan.checks} == {"dp": 2, "cp": 1, "ul": 0, "i": 0}
+    assert plan.checks[0].after_phases == ("control-plane", "underlay")
+
+
+@pytest.mark.parametrize(
+    "checks, phases, match",
+    [
+        ([_check("x", "underlay", depends_on=("nope",))], None, "unknown check 'nope'"),
+        ([_check("x", "underlay", depends_on=("y",)), _check("y", "underlay", depends_on=("x",))], None, "cycle"),
+        ([_check("x", "underlay", depends_on=("y",)), _check("y", "dataplane")], None, "cycle"),
+        ([], {"underlay": ["dataplane"]}, "phase dependency cycle"),
+        ([], {"overlay": []}, "unknown phase"),
+        ([_check("x", "underlay"), _check("x", "dataplane")], None, "duplicate check name 'x'"),
+    ],
+)
+def test_bad_dependencies_rejected(checks: list, phases: dict | None, match: str) -> None:
+    with pytest.raises(IntentValidationError, match=match):
+        compile_intent(_intent(*checks, phases=phases))
+
+
+def test_failure_skips_dependents_with_root_cause() -> None:
+    results = _run(
+        _intent(
+            _check("dp", "dataplane"),
+            _check("ul-bad", "underlay", ok=False),
+            _check("ul-ok", "underlay"),
+            _check("cp", "control-plane"),
+            _check("i1", "intent", ok=False),
+            _check("i2", "intent", depends_on=("i1",)),
+        ),
+        jobs=4,
+    )
+    assert list(results) == ["dp", "ul-bad", "ul-ok", "cp", "i1", "i2"]
+    assert results["ul-ok"][0] == CheckStatus.PASS
+    assert results["cp"] == (CheckStatus.SKIP, {"blocked_by": "ul-bad", "root_cause": "ul-bad"})
+    assert results["dp"] == (CheckStatus.SKIP, {"blocked_by": "cp", "root_cause": "ul-bad"})
+    assert results["i2"] == (CheckStatus.SKIP, {"blocked_by": "i1", "root_cause": "i1"})
+
+
+def test_phase_override_and_max_failures() -> None:
+    intent = _intent(_check("ul", "underlay", ok=False), _check("dp", "dataplane"), phases={"dataplane": []})
+    assert _run(intent)["dp"][0] == CheckStatus.PASS
+
+    results = _run(_intent(_check("i1", "intent", ok=False), _check("i2", "intent", ok=False)), max_failures=1)
+    assert results["i1"][0] == CheckStatus.FAIL
+    assert results["i2"] == (CheckStatus.SKIP, {"stopped_after": 1})
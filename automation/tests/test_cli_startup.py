@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import time
+
+# Cold `netlab --help` wall time, best of three. Typer and rich account for most of it; the old
+# eager imports (engine, collectors, grpc, renderers) roughly doubled it.
+HELP_BUDGET_S = 1.5
+
+_HELP = """
+import sys
+from netlab.cli import app
+try:
+    app(["--help"])
+except SystemExit:
+    pass
+print("\\n".join(sorted(sys.modules)))
+"""
+
+
+def test_help_does_not_import_subcommand_dependencies() -> None:
+    out = subprocess.run([sys.executable, "-c", _HELP], capture_output=True, text=True, check=True).stdout
+    modules = set(out.split("\n"))
+    heavy = {
+        "grpc",
+        "http.client",
+        "netlab.adapters.containerlab",
+        "netlab.drift.baseline",
+        "netlab.evidence.client",
+        "netlab.render.report_md",
+        "netlab.validators.engine",
+        "yaml",
+    }
+    assert heavy & modules == set()
+
+
+def test_help_startup_budget() -> None:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "netlab.cli", "--help"], capture_output=True, check=True)
+        best = min(best, time.perf_counter() - started)
+    assert best < HELP_BUDGET_S, f"netlab --help took {best:.2f}s (budget {HELP_BUDGET_S}s)"
@@ -0,0 +1,105 @@
+import json
+import socketserver
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from netlab.adapters.docker_api import DockerApiBackend
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+class _FakeDocker(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    execs: dict[str, list[str]] = {}
+
+    def log_message(self, *args) -> None:
+        return None
+
+    def _send(self, status: int, body: bytes, close: bool = False, ctype: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        else:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_POST(self) -> None:
+        parts = self.path.strip("/").split("/")
+        body = self._body()
+        if parts[0] == "containers" and parts[1] == "clab-lab-wedged":
+            # A wedged daemon accepts the exec create and never answers.
+            time.sleep(2)
+        if parts[0] == "containers" and parts[2] == "exec":
+            exec_id = f"e{len(self.execs)}"
+            self.execs[exec_id] = body["Cmd"]
+            self._send(201, json.dumps({"Id": exec_id}).encode())
+            return
+        if parts[0] == "exec" and parts[2] == "start":
+            cmd = " ".join(self.execs[parts[1]])
+            self._send(200, _frame(1, f"ran: {cmd}\n".encode()) + _frame(2, b"warn\n"), close=True, ctype="application/vnd.docker.raw-stream")
+            return
+        self._send(404, b"{}")
+
+    def do_GET(self) -> None:
+        parts = self.path.strip("/").split("/")
+        if parts[0] == "exec":
+            self._send(200, json.dumps({"ExitCode": 3, "Running": False}).encode())
+            return
+        if parts[0] == "containers" and parts[1] == "clab-lab-leaf1":
+            info = {"State": {"Running": True}, "NetworkSettings": {"Networks": {"clab": {"IPAddress": "172.20.0.5"}}}}
+            self._send(200, json.dumps(info).encode())
+            return
+        self._send(404, b'{"message": "No such container"}')
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def test_docker_api_exec_and_inspect(tmp_path) -> None:
+    sock = str(tmp_path / "docker.sock")
+    server = _Server(sock, _FakeDocker)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        backend = DockerApiBackend(sock)
+        res = backend.exec("clab-lab-leaf1", ["Cli", "-c", "show version"])
+        assert res.rc == 3
+        assert res.stdout == "ran: Cli -c show version"
+        assert res.stderr == "warn"
+
+        for _ in range(3):
+            assert backend.inspect("clab-lab-leaf1")["NetworkSettings"]["Networks"]["clab"]["IPAddress"] == "172.20.0.5"
+        assert backend.inspect("clab-lab-missing") is None
+        # create + start (hijacked, closed) + inspect calls: keep-alive reuses the pooled connection.
+        assert backend.pool.opened == 2
+        backend.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_exec_create_honours_the_deadline(tmp_path) -> None:
+    sock = str(tmp_path / "docker.sock")
+    server = _Server(sock, _FakeDocker)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        backend = DockerApiBackend(sock)
+        started = time.monotonic()
+        res = backend.exec("clab-lab-wedged", ["Cli", "-c", "show version"], timeout=0.2)
+        assert res.timed_out and "/exec" in res.stderr
+        assert time.monotonic() - started < 1.5
+        backend.close()
+    finally:
+        server.shutdown()
+        server.server_close()
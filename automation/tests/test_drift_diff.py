@@ -1,4 +1,17 @@
-from netlab.drift.diff import diff_dict
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from netlab.adapters.base import CmdResult
+from netlab.cli import app
+from netlab.core.model import ValidationContext
+from netlab.drift.baseline import collect_baseline, collection_failures, merkle_fingerprint
+from netlab.drift.diff import diff_dict, diff_fingerprints
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.schema import GnmiDefaults, IntentModel
 
 
 def test_diff_dict_changed_value() -> None:
@@ -7,3 +20,66 @@ def test_diff_dict_changed_value() -> None:
     diffs = diff_dict(old, new)
     assert len(diffs) == 1
     assert diffs[0]["path"] == "b.c"
+
+
+def test_diff_fingerprints_names_changed_items() -> None:
+    old = {
+        "leaf1": merkle_fingerprint({"interfaces": {"Ethernet1": {"status": "up"}}, "bgp": {"10.0.0.1": "ESTABLISHED"}}),
+        "leaf2": merkle_fingerprint({"interfaces": {"Ethernet1": {"status": "up"}}, "bgp": {}}),
+    }
+    new = {
+        "leaf1": merkle_fingerprint({"interfaces": {"Ethernet1": {"status": "up"}}, "bgp": {"10.0.0.1": "DOWN", "10.0.0.3": "ESTABLISHED"}}),
+        "leaf2": old["leaf2"],
+    }
+    diffs = diff_fingerprints(old, new)
+    assert [(d["path"], d["type"]) for d in diffs] == [
+        (["fingerprints", "leaf1", "bgp", "10.0.0.1"], "changed"),
+        (["fingerprints", "leaf1", "bgp", "10.0.0.3"], "added"),
+    ]
+
+
+class _Adapter:
+    def __init__(self, hung: str) -> None:
+        self.hung = hung
+
+    def list_nodes(self) -> list[str]:
+        return ["leaf1", "leaf2"]
+
+    def node_kind(self, node: str) -> str:
+        return "ceos"
+
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        if node == self.hung:
+            return CmdResult(124, "", "", timed_out=True)
+        if command.endswith("| json"):
+            return CmdResult(1, "", "")
+        if command.startswith("show bgp"):
+            return CmdResult(0, "  10.0.0.1  4 65000  5  5  0  0 00:01:00 Established", "")
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+
+def _baseline(hung: str = "") -> dict:
+    adapter = _Adapter(hung)
+    intent = IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, [], {})
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    return collect_baseline(ValidationContext("lab", "fast", intent, adapter=adapter, evidence_client=client))
+
+
+def test_failed_collection_is_recorded_not_hashed_as_state() -> None:
+    healthy = _baseline()
+    assert collection_failures(healthy) == []
+    broken = _baseline(hung="leaf2")
+    assert collection_failures(broken) == ["leaf2.bgp: timed out", "leaf2.interfaces: timed out"]
+    diffs = diff_fingerprints(healthy["fingerprints"], broken["fingerprints"])
+    assert {(tuple(d["path"]), d["type"]) for d in diffs} == {
+        (("fingerprints", "leaf2", "bgp"), "uncollected"),
+        (("fingerprints", "leaf2", "interfaces"), "uncollected"),
+    }
+
+
+def test_drift_rejects_flat_baseline(tmp_path: Path) -> None:
+    baseline = tmp_path / "old.json"
+    baseline.write_text(json.dumps({"lab": "ceos-4s4l", "fingerprints": {"leaf1": {"hash": "abc", "key_count": 2}}}))
+    result = CliRunner().invoke(app, ["--no-yaml-cache", "drift", "--lab", "ceos-4s4l", "--baseline", str(baseline)])
+    assert result.exit_code == 2
+    assert "netlab baseline" in result.output
@@ -0,0 +1,48 @@
+import threading
+import time
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.core.model import ValidationContext
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import run_checks
+
+
+class _SlowAdapter:
+    def __init__(self) -> None:
+        self.repo_root = Path("/nonexistent")
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def exec(self, node: str, cmd: str) -> CmdResult:
+        with self._lock:
+            self.active[node] = self.active.get(node, 0) + 1
+            self.peak[node] = max(self.peak.get(node, 0), self.active[node])
+        time.sleep(0.02)
+        with self._lock:
+            self.active[node] -= 1
+        return CmdResult(0, "", "")
+
+
+def _ctx(adapter: _SlowAdapter) -> ValidationContext:
+    checks = [
+        CheckDef(
+            name="pings",
+            phase="dataplane",
+            kind="ping_targets",
+            params={"probes": [{"source": f"h{i}", "targets": ["10.0.0.1", "10.0.0.2"]} for i in range(4)]},
+        ),
+        CheckDef(name="distinct", phase="intent", kind="intent_distinct", params={"paths": ["a", "b"]}),
+    ]
+    intent = IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, checks, {"a": 1, "b": 2})
+    return ValidationContext(lab="lab", profile="fast", intent=intent, adapter=adapter, evidence_client=None)
+
+
+def test_concurrent_run_preserves_serial_order() -> None:
+    serial = [r.name for r in run_checks(_ctx(_SlowAdapter()), "all")]
+    adapter = _SlowAdapter()
+    parallel = [r.name for r in run_checks(_ctx(adapter), "all", jobs=8, per_node=1)]
+    assert parallel == serial
+    assert serial[0] == "pings::h0->10.0.0.1"
+    assert max(adapter.peak.values()) == 1
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.adapters.containerlab import ContainerlabAdapter, split_eos_batch
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_split_eos_batch_per_command() -> None:
+    marker = "__NETLAB_ab12cd34_"
+    stdout = f"""
+{marker}0
+Interface  Status  Protocol  Description
+Et1        up      up        to-spine1
+{marker}1
+BGP summary information for VRF default
+{marker}end
+"""
+    chunks = split_eos_batch(stdout, marker, 3)
+    assert chunks[0].startswith("Interface")
+    assert chunks[1] == "BGP summary information for VRF default"
+    assert chunks[2] == ""
+
+
+class _Backend:
+    """Runs the batch heredoc the way Cli would: markers echoed, each command answered from ``outputs``."""
+
+    def __init__(self, outputs: dict[str, str]) -> None:
+        self.outputs = outputs
+        self.calls: list[list[str]] = []
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        self.calls.append(argv)
+        if argv[0] == "Cli":
+            output = self.outputs.get(argv[2])
+            return CmdResult(0, output, "") if output is not None else CmdResult(1, "% Unrecognized command", "")
+        out = []
+        for line in argv[2].splitlines()[1:-1]:
+            if line.startswith("bash echo "):
+                out.append(line[len("bash echo "):])
+            elif line != "enable":
+                out.append(self.outputs.get(line, "% Unrecognized command"))
+        return CmdResult(0, "\n".join(out), "")
+
+    def close(self) -> None:
+        pass
+
+
+def test_prime_eos_serves_one_batch_per_node() -> None:
+    backend = _Backend({"show version": "cEOSLab", "show interfaces description": "Et1  up  up  to-spine1"})
+    adapter = ContainerlabAdapter(REPO_ROOT, "ceos-4s4l", eos_batch=True, backend=backend)
+    adapter.prime_eos("leaf1", ["show version", "show bogus", "show interfaces description", "show version"])
+    assert len(backend.calls) == 1
+
+    assert adapter.eos_cli("leaf1", "show version").stdout == "cEOSLab"
+    assert adapter.eos_cli("leaf1", "show interfaces description").stdout.startswith("Et1")
+    assert len(backend.calls) == 1
+    # The failing command's chunk is not primed, so it goes to the device on its own.
+    assert adapter.eos_cli("leaf1", "show bogus").rc == 1
+    assert backend.calls[-1] == ["Cli", "-c", "show bogus"]
+
+    adapter.prime_eos("leaf1", ["show version"])
+    assert len(backend.calls) == 2
+    adapter.forget_eos()
+    adapter.eos_cli("leaf1", "show version")
+    assert backend.calls[-1] == ["Cli", "-c", "show version"]
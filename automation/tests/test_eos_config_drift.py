@@ -0,0 +1,96 @@
+from netlab.drift.eos_config import diff_sections, parse_config
+
+DESIRED = """hostname leaf1
+!
+username clab privilege 15 secret 0 clab
+!
+interface Ethernet1
+   description to-spine1
+   no switchport
+   ip address 10.0.0.0/31
+!
+router bgp 65101
+   neighbor 10.0.0.1 peer group SPINE
+   neighbor SPINE peer group
+   !
+   vlan 10
+      rd auto
+      route-target both 65000:10100
+!
+end
+"""
+
+RUNNING = """! Command: show running-config
+! device: leaf1 (cEOSLab, EOS-4.32)
+!
+no aaa root
+!
+username clab privilege 15 role network-admin secret sha512 $6$abc$def
+!
+hostname leaf1
+!
+spanning-tree mode mstp
+!
+interface Ethernet1
+   description to-spine1
+   no shutdown
+   no switchport
+   ip address 10.0.0.0/31
+!
+interface Management0
+   ip address 172.20.20.2/24
+!
+router bgp 65101
+   neighbor SPINE peer group
+   neighbor 10.0.0.1 peer group SPINE
+   vlan 10
+      route-target both 65000:10100
+      rd auto
+!
+management api gnmi
+   transport grpc default
+!
+end
+"""
+
+
+def test_equivalent_configs_have_no_drift() -> None:
+    desired = parse_config(DESIRED)
+    running = parse_config(RUNNING)
+    assert desired.children["router bgp 65101"].digest == running.children["router bgp 65101"].digest
+    assert diff_sections(desired, running) == []
+
+
+def test_delta_is_reported_per_section() -> None:
+    changed = RUNNING.replace("65000:10100", "65000:99999").replace("description to-spine1", "description x")
+    changed += "vlan 30\n   name EXTRA\n"
+    deltas = {d["section"]: d for d in diff_sections(parse_config(DESIRED), parse_config(changed))}
+    assert set(deltas) == {"interface Ethernet1", "router bgp 65101", "vlan 30"}
+    assert deltas["router bgp 65101"]["missing"] == ["vlan 10 > route-target both 65000:10100"]
+    assert deltas["router bgp 65101"]["unexpected"] == ["vlan 10 > route-target both 65000:99999"]
+    assert deltas["interface Ethernet1"]["missing"] == ["description to-spine1"]
+    assert deltas["vlan 30"] == {"section": "vlan 30", "status": "unexpected", "lines": 2}
+
+
+def test_ordered_sections_compare_by_sequence_number() -> None:
+    acl = "ip access-list EDGE\n   10 permit ip 10.0.0.0/8 any\n   20 deny ip any any\n"
+    # EOS renders numbered entries sorted by number, so line order alone is not drift.
+    swapped = "ip access-list EDGE\n   20 deny ip any any\n   10 permit ip 10.0.0.0/8 any\n"
+    assert diff_sections(parse_config(acl), parse_config(swapped)) == []
+    renumbered = "ip access-list EDGE\n   10 deny ip any any\n   20 permit ip 10.0.0.0/8 any\n"
+    assert diff_sections(parse_config(acl), parse_config(renumbered))[0]["section"] == "ip access-list EDGE"
+
+    plain = "ip prefix-list LOOPBACKS\n   permit 10.0.0.0/24 le 32\n   deny 0.0.0.0/0 le 32\n"
+    reordered = "ip prefix-list LOOPBACKS\n   deny 0.0.0.0/0 le 32\n   permit 10.0.0.0/24 le 32\n"
+    assert diff_sections(parse_config(plain), parse_config(reordered))[0]["status"] == "changed"
+    doubled = plain + "   deny 0.0.0.0/0 le 32\n"
+    assert diff_sections(parse_config(plain), parse_config(doubled)) == [
+        {"section": "ip prefix-list LOOPBACKS", "status": "changed", "missing": [], "unexpected": ["deny 0.0.0.0/0 le 32"]}
+    ]
+
+    # route-map clauses are not sequences; their order is ignored like any other section's.
+    route_map = "route-map RM permit 10\n   match ip address prefix-list LOOPBACKS\n   set local-preference 200\n"
+    flipped = "route-map RM permit 10\n   set local-preference 200\n   match ip address prefix-list LOOPBACKS\n"
+    assert diff_sections(parse_config(route_map), parse_config(flipped)) == []
+    # Unordered sections still ignore sibling order.
+    assert diff_sections(parse_config(DESIRED), parse_config(RUNNING)) == []
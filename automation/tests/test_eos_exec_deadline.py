@@ -0,0 +1,83 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from netlab.adapters.base import TIMEOUT_RC, CmdResult
+from netlab.adapters.containerlab import ContainerlabAdapter, eos_command_family
+from netlab.adapters.docker_cli import DockerCliBackend
+from netlab.core.model import CheckStatus, ValidationContext
+from netlab.core.results import RunSummary
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.loader import load_intent
+from netlab.validators.engine import run_checks
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class _Backend:
+    def __init__(self, wedged: set[str] = frozenset()) -> None:
+        self.wedged = wedged
+        self.calls: list[list[str]] = []
+        self.containers: list[str] = []
+        self.timeouts: list[float | None] = []
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        self.calls.append(argv)
+        self.containers.append(container)
+        self.timeouts.append(timeout)
+        if container.endswith(tuple(self.wedged)):
+            return CmdResult(TIMEOUT_RC, "", f"timed out after {timeout:g}s", timed_out=True)
+        if argv[0] == "Cli":
+            return CmdResult(1, "% Invalid input (privileged mode required)", "")
+        return CmdResult(0, "hostname leaf1", "")
+
+    def close(self) -> None:
+        pass
+
+
+def test_enable_only_family_is_remembered_per_node() -> None:
+    backend = _Backend()
+    adapter = ContainerlabAdapter(REPO_ROOT, "ceos-4s4l", backend=backend, exec_timeout=7.5)
+    assert adapter.eos_cli("leaf1", "show running-config").stdout == "hostname leaf1"
+    assert len(backend.calls) == 2
+    adapter.eos_cli("leaf1", "show running-config | section bgp")
+    assert len(backend.calls) == 3
+    assert backend.calls[-1][0] == "bash"
+    # Another node learns on its own.
+    adapter.eos_cli("leaf2", "show running-config")
+    assert len(backend.calls) == 5
+    assert set(backend.timeouts) == {7.5}
+    assert eos_command_family("show bgp evpn | json") == "show bgp"
+
+
+def test_timeout_is_not_retried_and_reported_as_timeout() -> None:
+    backend = _Backend(wedged={"leaf1"})
+    adapter = ContainerlabAdapter(REPO_ROOT, "ceos-4s4l", backend=backend, exec_timeout=1, breaker_threshold=0)
+    result = adapter.eos_cli("leaf1", "show bgp summary")
+    assert result.timed_out and len(backend.calls) == 1
+
+    intent = load_intent(REPO_ROOT, "ceos-4s4l")
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    ctx = ValidationContext("ceos-4s4l", "fast", intent, adapter, client)
+    results = [r for r in run_checks(ctx, "underlay") if r.name.endswith("::leaf1")]
+    assert results and all(r.status == CheckStatus.TIMEOUT for r in results)
+    assert all("timed_out" in r.evidence for r in results)
+    assert RunSummary(results=results).exit_code == 1
+    # JSON and text variants are not both waited out.
+    leaf1 = [argv for container, argv in zip(backend.containers, backend.calls) if container.endswith("leaf1")]
+    assert len([argv for argv in leaf1 if "bgp summary" in argv[-1]]) == 2
+
+
+def test_docker_cli_timeout(monkeypatch) -> None:
+    def _run(*args, **kwargs):
+        raise subprocess.TimeoutExpired(args[0], kwargs["timeout"], output=b"partial")
+
+    monkeypatch.setattr(subprocess, "run", _run)
+    result = DockerCliBackend().exec("clab-lab-leaf1", ["Cli", "-c", "show version"], timeout=2)
+    assert result == CmdResult(TIMEOUT_RC, "partial", "timed out after 2s", timed_out=True)
+
+    with pytest.raises(TimeoutError, match="docker inspect timed out after 2s"):
+        DockerCliBackend().inspect("clab-lab-leaf1", timeout=2)
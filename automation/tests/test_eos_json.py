@@ -0,0 +1,127 @@
+import json
+
+from netlab.adapters.base import CmdResult
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.collectors.eos import bgp_oc, interfaces_oc
+from netlab.evidence.gnmi import GnmiTransport
+
+BGP_JSON = {
+    "vrfs": {
+        "default": {
+            "peers": {
+                "10.0.0.1": {"peerState": "Established"},
+                "fd00::1": {"peerState": "Active"},
+            }
+        },
+        "TENANT1": {"peers": {"192.168.10.2": {"peerState": "Established"}}},
+    }
+}
+IFACES_JSON = {
+    "interfaceDescriptions": {
+        "Ethernet1": {"interfaceStatus": "up", "lineProtocolStatus": "up", "description": "to-spine1 a very long description"},
+        "Ethernet2": {"interfaceStatus": "adminDown", "lineProtocolStatus": "down", "description": ""},
+    }
+}
+
+
+class _Adapter:
+    def __init__(self, json_ok: bool) -> None:
+        self.json_ok = json_ok
+        self.commands: list[str] = []
+
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        self.commands.append(command)
+        if command.endswith("| json"):
+            if not self.json_ok:
+                return CmdResult(0, "% Invalid input", "")
+            payload = BGP_JSON if command.startswith(bgp_oc.COMMAND) else IFACES_JSON
+            return CmdResult(0, json.dumps(payload), "")
+        if command == bgp_oc.COMMAND:
+            return CmdResult(0, "  10.0.0.1  4 65000  5  5  0  0 00:01:00 Established", "")
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+
+def _client(adapter: _Adapter) -> EvidenceClient:
+    return EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+
+
+def test_json_path_maps_to_parsed_shape() -> None:
+    client = _client(_Adapter(json_ok=True))
+    bgp = bgp_oc.collect_bgp_summary(client, "leaf1")
+    assert bgp["source"] == "cli-json"
+    assert bgp["data"]["parsed"] == {
+        "established": 1,
+        "total": 2,
+        "neighbors": {"10.0.0.1": "ESTABLISHED", "fd00::1": "ACTIVE"},
+    }
+    ifaces = interfaces_oc.collect_interfaces(client, "leaf1")
+    assert ifaces["source"] == "cli-json"
+    assert ifaces["data"]["up"] == 1 and ifaces["data"]["down"] == 1
+    assert ifaces["data"]["parsed"][0]["description"] == "to-spine1 a very long description"
+    assert ifaces["data"]["parsed"][1]["status"] == "down"
+
+
+def test_text_fallback_when_json_is_not_understood() -> None:
+    adapter = _Adapter(json_ok=False)
+    client = _client(adapter)
+    first = bgp_oc.collect_bgp_summary(client, "leaf1")
+    client.invalidate()
+    bgp_oc.collect_bgp_summary(client, "leaf1")
+    assert first["source"] == "cli"
+    assert first["data"]["parsed"]["established"] == 1
+    # Once a node answers with something that is not JSON, the structured variant is not retried on it.
+    assert adapter.commands.count(bgp_oc.EOS_JSON.cli) == 1
+
+
+def test_json_rejection_is_per_node() -> None:
+    adapter = _Adapter(json_ok=False)
+    client = _client(adapter)
+    assert bgp_oc.collect_bgp_summary(client, "leaf1")["source"] == "cli"
+    adapter.json_ok = True
+    assert bgp_oc.collect_bgp_summary(client, "leaf2")["source"] == "cli-json"
+
+
+def _oc(path: list[tuple[str, dict]], val) -> dict:
+    return {"elems": [{"name": name, "key": key} for name, key in path], "val": val}
+
+
+def test_every_source_yields_the_same_parsed_shape() -> None:
+    text = (
+        "Interface    Status       Protocol  Description\n"
+        "Et1          up           up        to-spine1 a very long description\n"
+        "Et2          admin down   down\n"
+    )
+    iface_oc = {
+        "updates": [
+            _oc(
+                [("interfaces", {}), ("interface", {"name": name}), ("state", {})],
+                {"openconfig-interfaces:admin-status": admin, "oper-status": oper, "description": desc},
+            )
+            for name, admin, oper, desc in (
+                ("Ethernet1", "UP", "UP", "to-spine1 a very long description"),
+                ("Ethernet2", "DOWN", "DOWN", ""),
+            )
+        ]
+    }
+    from_text = interfaces_oc._parse_interfaces_description(text)
+    assert from_text == interfaces_oc._from_eos_json(IFACES_JSON)["parsed"] == interfaces_oc._from_openconfig(iface_oc)["parsed"]
+    assert [e["interface"] for e in from_text] == ["Ethernet1", "Ethernet2"]
+
+    bgp_text = (
+        "  10.0.0.1  4 65000  5  5  0  0 00:01:00 Established\n"
+        "  fd00::1  4 65000  0  0  0  0 00:01:00 Active\n"
+    )
+    neighbor = [("network-instances", {}), ("network-instance", {"name": "default"}), ("protocols", {}), ("protocol", {})]
+    bgp_oc_payload = {
+        "updates": [
+            _oc(neighbor + [("bgp", {}), ("neighbors", {}), ("neighbor", {"neighbor-address": addr}), ("state", {}), ("session-state", {})], state)
+            for addr, state in (("10.0.0.1", "ESTABLISHED"), ("fd00::1", "ACTIVE"))
+        ]
+    }
+    assert (
+        bgp_oc._parse_bgp_summary(bgp_text)
+        == bgp_oc._from_eos_json(BGP_JSON)["parsed"]
+        == bgp_oc._from_openconfig(bgp_oc_payload)["parsed"]
+        == {"established": 1, "total": 2, "neighbors": {"10.0.0.1": "ESTABLISHED", "fd00::1": "ACTIVE"}}
+    )
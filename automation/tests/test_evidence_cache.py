@@ -0,0 +1,59 @@
+import os
+import time
+
+from netlab.evidence.cache import DiskEvidenceCache
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+
+
+def _collect(client: EvidenceClient, calls: list[int], rc: int = 0) -> dict:
+    def _cli() -> dict:
+        calls.append(1)
+        return {"rc": rc, "parsed": {"total": 1}}
+
+    return client.collect("bgp-summary:leaf1", "/bgp", "leaf1", _cli)
+
+
+def test_disk_cache_shared_between_clients(tmp_path) -> None:
+    calls: list[int] = []
+    first = EvidenceClient(GnmiTransport(), cli=None, disk_cache=DiskEvidenceCache(tmp_path, "lab"))
+    second = EvidenceClient(GnmiTransport(), cli=None, disk_cache=DiskEvidenceCache(tmp_path, "lab"))
+    assert _collect(first, calls) == _collect(second, calls)
+    assert len(calls) == 1
+
+    refreshing = EvidenceClient(GnmiTransport(), cli=None, disk_cache=DiskEvidenceCache(tmp_path, "lab"), refresh=True)
+    _collect(refreshing, calls)
+    assert len(calls) == 2
+
+
+def test_disk_cache_ttl_and_failures(tmp_path) -> None:
+    cache = DiskEvidenceCache(tmp_path, "lab", ttl=30)
+    cache.put("leaf1", "k", {"data": {}})
+    path = next((tmp_path / "lab").glob("*.json"))
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    assert cache.get("leaf1", "k") is None
+
+    calls: list[int] = []
+    _collect(EvidenceClient(GnmiTransport(), cli=None, disk_cache=cache), calls, rc=1)
+    _collect(EvidenceClient(GnmiTransport(), cli=None, disk_cache=cache), calls, rc=1)
+    assert len(calls) == 2
+
+
+def test_disk_cache_size_bound(tmp_path) -> None:
+    cache = DiskEvidenceCache(tmp_path, "lab", max_bytes=400)
+    for i in range(10):
+        cache.put("leaf1", f"k{i}", {"data": {"blob": "x" * 50}})
+    assert sum(p.stat().st_size for p in (tmp_path / "lab").glob("*.json")) <= 400
+    assert cache.get("leaf1", "k9") is not None
+
+
+def test_disk_cache_scans_directory_once(tmp_path, monkeypatch) -> None:
+    cache = DiskEvidenceCache(tmp_path, "lab", max_bytes=400)
+    scans: list[int] = []
+    real_scan = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or real_scan())
+    for i in range(50):
+        cache.put("leaf1", f"k{i}", {"data": {"blob": "x" * 50}})
+    assert scans == [1]
+    assert sum(p.stat().st_size for p in (tmp_path / "lab").glob("*.json")) <= 400
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.core.model import ValidationContext
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import build_units, plan_evidence, run_checks
+
+IFACES_JSON = '{"interfaceDescriptions": {"Ethernet1": {"interfaceStatus": "up", "lineProtocolStatus": "up", "description": "to-spine1"}}}'
+
+
+class _CountingAdapter:
+    def __init__(self) -> None:
+        self.repo_root = Path("/nonexistent")
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        with self._lock:
+            self.calls[(node, command)] += 1
+        time.sleep(0.01)
+        if command.endswith("| json"):
+            return CmdResult(0, IFACES_JSON, "")
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+
+def _ctx(adapter: _CountingAdapter) -> ValidationContext:
+    inventory = {"nodes": {"leaf1": {"roles": ["eos", "leaf"]}, "leaf2": {"roles": ["eos", "leaf"]}}}
+    checks = [
+        CheckDef("ifaces-all", "underlay", "interfaces_up", params={"selector": {"role": "eos"}}),
+        CheckDef("ifaces-leaf", "underlay", "interfaces_up", params={"selector": {"role": "leaf"}}),
+        CheckDef("evpn", "control-plane", "evpn_routes_present", params={"selector": {"role": "leaf"}}),
+    ]
+    intent = IntentModel("lab", GnmiDefaults(), inventory, {}, checks, {})
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    return ValidationContext(lab="lab", profile="fast", intent=intent, adapter=adapter, evidence_client=client)
+
+
+def test_plan_deduplicates_items() -> None:
+    ctx = _ctx(_CountingAdapter())
+    plan = plan_evidence(build_units(ctx, "all"))
+    assert plan.items == {"leaf1": ["interfaces", "evpn-routes"], "leaf2": ["interfaces", "evpn-routes"]}
+    assert len(plan) == 4
+
+
+def test_each_item_fetched_once() -> None:
+    adapter = _CountingAdapter()
+    results = run_checks(_ctx(adapter), "all", jobs=4)
+    assert len(results) == 6
+    assert set(adapter.calls.values()) == {1}
+    assert len(adapter.calls) == 4
+
+
+def test_single_flight_collect() -> None:
+    adapter = _CountingAdapter()
+    client = _ctx(adapter).evidence_client
+    fetches: list[int] = []
+
+    def _cli() -> dict:
+        fetches.append(1)
+        time.sleep(0.05)
+        return {"rc": 0}
+
+    threads = [threading.Thread(target=client.collect, args=("k:leaf1", None, "leaf1", _cli)) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert fetches == [1]
@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from netlab.core.errors import IntentValidationError
+from netlab.evidence.collectors.eos.evpn_cli import index_evpn_routes, route_count
+from netlab.intent.params import parse_params
+
+ROUTES = """BGP routing table information for VRF default
+Router identifier 10.255.1.1, local AS number 65101
+          Network                Next Hop              Metric  LocPref Weight  Path
+ * >      RD: 10.255.1.3:10 mac-ip 0050.7966.6806
+                                 10.255.1.3            -       100     0       65000 65103 i
+ *  ec    RD: 10.255.1.3:10 mac-ip 0050.7966.6806
+                                 10.255.1.3            -       100     0       65000 65103 i
+ * >      RD: 10.255.1.3:10 mac-ip 0050.7966.6806 10.10.10.13
+                                 10.255.1.3            -       100     0       65000 65103 i
+ * >      RD: 10.255.1.4:1 mac-ip 10100 0050.7966.6807
+                                 10.255.1.4            -       100     0       65000 65104 i
+ * >      RD: 10.255.1.3:10 imet 10.255.1.3
+                                 10.255.1.3            -       100     0       65000 65103 i
+ * >      RD: 10.255.1.3:10000 ip-prefix 192.168.10.0/24
+                                 10.255.1.3            -       100     0       65000 65103 i
+"""
+
+DETAIL = """BGP routing table entry for mac-ip 0050.7966.6808, Route Distinguisher: 10.255.1.5:10
+ Paths: 1 available
+  65000 65105
+    10.255.1.5 from 10.255.0.1 (10.255.0.1)
+      Extended Community: Route-Target-AS:65000:10200 TunnelEncap:tunnelTypeVxlan
+      VNI: 10200 ESI: 0000:0000:0000:0000:0000
+BGP routing table entry for imet 10.255.1.5, Route Distinguisher: 10.255.1.5:10
+ Paths: 1 available
+"""
+
+
+def test_index_counts_routes_once_per_path_set() -> None:
+    index = index_evpn_routes(io.StringIO(ROUTES))
+    assert index["routes"] == 5
+    assert index["by_type"] == {"mac-ip": 3, "imet": 1, "ip-prefix": 1}
+    assert index["by_rd"]["10.255.1.3:10"] == {"mac-ip": 2, "imet": 1}
+    # Ethernet tag and large RD assigned numbers give the VNI; `rd auto` VLAN ids do not.
+    assert index["by_vni"] == {"10100": {"mac-ip": 1}, "10000": {"ip-prefix": 1}}
+    assert index["macs"] == {"0050.7966.6806": 2, "0050.7966.6807": 1}
+    assert index["ips"] == {"10.10.10.13": 1}
+    assert route_count(index, "mac-ip", vni="10100") == 1
+    assert route_count(index, rd="10.255.1.3:10") == 3
+
+
+def test_index_reads_vni_from_detail_output() -> None:
+    index = index_evpn_routes(DETAIL.splitlines())
+    assert index["by_vni"] == {"10200": {"mac-ip": 1}}
+    assert index["by_type"] == {"mac-ip": 1, "imet": 1}
+
+
+def test_min_routes_params() -> None:
+    params = parse_params(
+        "evpn",
+        "evpn_routes_present",
+        {"min_routes": [{"type": "type-2", "vni": 10100, "count": 4}], "macs": ["00:50:79:66:68:06"]},
+    )
+    assert params.min_routes[0].route_type == "mac-ip"
+    assert params.min_routes[0].vni == "10100"
+    assert params.macs == ("0050.7966.6806",)
+    with pytest.raises(IntentValidationError, match="either vni or rd"):
+        parse_params("evpn", "evpn_routes_present", {"min_routes": [{"vni": 1, "rd": "1:1"}]})
@@ -0,0 +1,89 @@
+import json
+from concurrent import futures
+
+import pytest
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("pygnmi")
+
+from pygnmi.spec.v080 import gnmi_pb2, gnmi_pb2_grpc  # noqa: E402
+
+from netlab.evidence.client import EvidenceClient  # noqa: E402
+from netlab.evidence.collectors.eos import bgp_oc, interfaces_oc  # noqa: E402
+from netlab.evidence.gnmi import GnmiTransport  # noqa: E402
+from netlab.intent.schema import GnmiDefaults  # noqa: E402
+
+
+def _update(path: list[tuple[str, dict]], value) -> "gnmi_pb2.Update":
+    return gnmi_pb2.Update(
+        path=gnmi_pb2.Path(elem=[gnmi_pb2.PathElem(name=n, key=k) for n, k in path]),
+        val=gnmi_pb2.TypedValue(json_ietf_val=json.dumps(value).encode()),
+    )
+
+
+class _StandInGnmi(gnmi_pb2_grpc.gNMIServicer):
+    def __init__(self) -> None:
+        self.requests: list[int] = []
+
+    def Get(self, request, context):
+        meta = dict(context.invocation_metadata())
+        if meta.get("username") != "clab" or meta.get("password") != "clab":
+            context.abort(grpc.StatusCode.UNAUTHENTICATED, "bad credentials")
+        self.requests.append(len(request.path))
+        iface = [("interfaces", {}), ("interface", {"name": "Ethernet1"}), ("state", {})]
+        nbr = [
+            ("network-instances", {}),
+            ("network-instance", {"name": "default"}),
+            ("protocols", {}),
+            ("protocol", {"identifier": "BGP", "name": "BGP"}),
+            ("bgp", {}),
+            ("neighbors", {}),
+            ("neighbor", {"neighbor-address": "10.0.0.1"}),
+            ("state", {}),
+            ("session-state", {}),
+        ]
+        notification = gnmi_pb2.Notification(
+            update=[
+                _update(iface, {"openconfig-interfaces:admin-status": "UP", "oper-status": "UP", "description": "to-spine1"}),
+                _update(nbr, "ESTABLISHED"),
+            ]
+        )
+        return gnmi_pb2.GetResponse(notification=[notification])
+
+
+@pytest.fixture()
+def stand_in():
+    servicer = _StandInGnmi()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    gnmi_pb2_grpc.add_gNMIServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield servicer, port
+    server.stop(None)
+
+
+def test_multi_path_get_over_one_channel(stand_in) -> None:
+    servicer, port = stand_in
+    transport = GnmiTransport(GnmiDefaults(port=port), resolve_target=lambda node: "127.0.0.1")
+    client = EvidenceClient(gnmi=transport, cli=None)
+
+    client.prefetch_gnmi("leaf1", [interfaces_oc.GNMI_PATH, bgp_oc.GNMI_PATH])
+    ifaces = interfaces_oc.collect_interfaces(client, "leaf1")
+    bgp = bgp_oc.collect_bgp_summary(client, "leaf1")
+
+    assert servicer.requests == [2]
+    assert ifaces["source"] == "gnmi"
+    assert ifaces["data"]["parsed"] == [{"interface": "Ethernet1", "status": "up", "protocol": "up", "description": "to-spine1"}]
+    assert bgp["data"]["parsed"] == {"established": 1, "total": 1, "neighbors": {"10.0.0.1": "ESTABLISHED"}}
+
+    transport.get("leaf1", interfaces_oc.GNMI_PATH)
+    assert len(transport._sessions) == 1
+    transport.close()
+
+
+def test_bad_credentials_fall_back(stand_in) -> None:
+    _, port = stand_in
+    transport = GnmiTransport(GnmiDefaults(port=port, password="wrong"), resolve_target=lambda node: "127.0.0.1")
+    res = transport.get("leaf1", interfaces_oc.GNMI_PATH)
+    assert not res.ok and "UNAUTHENTICATED" in (res.error or "")
+    transport.close()
@@ -0,0 +1,18 @@
+from netlab.evidence.collectors.linux.host_net import split_ping_many
+
+
+def test_split_ping_many_parses_loss_and_rtt() -> None:
+    stdout = """@@NETLAB-PING 0 0
+PING 192.168.10.12 (192.168.10.12) 56(84) bytes of data.
+2 packets transmitted, 2 received, 0% packet loss, time 1001ms
+rtt min/avg/max/mdev = 0.412/0.530/0.648/0.118 ms
+@@NETLAB-PING 1 1
+PING 192.168.10.13 (192.168.10.13) 56(84) bytes of data.
+2 packets transmitted, 0 received, 100% packet loss, time 1015ms
+"""
+    res = split_ping_many(stdout, ["192.168.10.12", "192.168.10.13", "192.168.10.14"])
+    ok = res["192.168.10.12"]
+    assert ok["rc"] == 0 and ok["loss_pct"] == 0.0
+    assert (ok["rtt_min_ms"], ok["rtt_avg_ms"], ok["rtt_max_ms"]) == (0.412, 0.53, 0.648)
+    assert res["192.168.10.13"]["loss_pct"] == 100.0 and res["192.168.10.13"]["rtt_avg_ms"] is None
+    assert res["192.168.10.14"]["rc"] == 1
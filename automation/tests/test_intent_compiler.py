@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from netlab.core.errors import IntentValidationError
+from netlab.core.model import Severity
+from netlab.intent.compiler import compile_intent
+from netlab.intent.loader import load_intent
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+
+
+def _intent(*checks: CheckDef) -> IntentModel:
+    inventory = {"nodes": {"leaf1": {"roles": ["eos", "leaf"]}, "spine1": {"roles": ["eos", "spine"]}}}
+    return IntentModel("lab", GnmiDefaults(), inventory, {}, list(checks), {})
+
+
+def test_compile_resolves_nodes_and_params() -> None:
+    plan = compile_intent(
+        _intent(
+            CheckDef(
+                "ifaces",
+                "underlay",
+                "interfaces_up",
+                severity="WARN",
+                params={"selector": {"role": "leaf"}, "required_interface_regex": ["^Ethernet"]},
+            ),
+            CheckDef(
+                "ping",
+                "dataplane",
+                "ping_targets",
+                params={"probes": [{"source": "h1", "targets": ["a"]}, {"source": "h1", "targets": ["b", "a"]}]},
+            ),
+        )
+    )
+    ifaces, ping = plan.checks
+    assert ifaces.nodes == ("leaf1",)
+    assert ifaces.severity == Severity.WARN
+    assert ifaces.params.required_interface_regex[0].search("Ethernet1")
+    assert ping.params.probes == (("h1", ("a", "b")),)
+
+
+@pytest.mark.parametrize(
+    "kind, params",
+    [
+        ("interfaces_up", {"required_interface_regex": ["(unclosed"]}),
+        ("ping_targets", {"probes": [{"source": "h1", "targets": "10.0.0.1"}]}),
+        ("bgp_established", {"min_total": "many"}),
+        ("evpn_routes_present", {"require": "most"}),
+        ("l2_neighbor_absent", {"probes": [{"source": "h1", "target_ip": "10.0.0.2"}]}),
+    ],
+)
+def test_compile_rejects_bad_params(kind: str, params: dict) -> None:
+    with pytest.raises(IntentValidationError, match="check 'bad'"):
+        compile_intent(_intent(CheckDef("bad", "underlay", kind, params=params)))
+
+
+def test_plan_is_cached_by_intent_hash() -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    first = load_intent(repo_root, "ceos-4s4l")
+    second = load_intent(repo_root, "ceos-4s4l")
+    assert first.source_hash and first.source_hash == second.source_hash
+    assert first.plan is second.plan
+    assert len(first.plan.checks) == len(first.checks)
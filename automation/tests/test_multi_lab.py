@@ -0,0 +1,83 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from netlab import cli
+from netlab.adapters.base import CmdResult
+from netlab.cli import _lab_report_path
+from netlab.core.model import ValidationContext
+from netlab.core.results import RunSummary, combine_summaries
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.loader import discover_labs
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import run_checks
+
+
+class _GaugeAdapter:
+    def __init__(self) -> None:
+        self.repo_root = Path("/nonexistent")
+        self.active = 0
+        self.peak = 0
+        self.closed = 0
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.closed += 1
+
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+
+def _ctx(lab: str, adapter: _GaugeAdapter) -> ValidationContext:
+    nodes = {f"leaf{i}": {"roles": ["eos"]} for i in range(4)}
+    checks = [CheckDef("ifaces", "underlay", "interfaces_up", params={"selector": {"role": "eos"}})]
+    intent = IntentModel(lab, GnmiDefaults(), {"nodes": nodes}, {}, checks, {})
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    return ValidationContext(lab=lab, profile="fast", intent=intent, adapter=adapter, evidence_client=client)
+
+
+def test_labs_share_one_bounded_pool() -> None:
+    adapter = _GaugeAdapter()
+    labs = ["lab-a", "lab-b", "lab-c"]
+    with ThreadPoolExecutor(max_workers=3) as pool, ThreadPoolExecutor(max_workers=len(labs)) as coordinators:
+        futures = {lab: coordinators.submit(run_checks, _ctx(lab, adapter), "all", 3, 1, pool) for lab in labs}
+        summaries = {lab: RunSummary(results=f.result()) for lab, f in futures.items()}
+
+    assert adapter.peak <= 3
+    combined = combine_summaries(summaries)
+    assert combined["summary"]["exit_code"] == 0
+    assert combined["summary"]["counts_by_status"]["PASS"] == 12
+    assert combined["results"][0]["name"] == "lab-a/ifaces::leaf0"
+    assert set(combined["labs"]) == set(labs)
+
+
+def test_discover_labs() -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    assert {"ceos-4s4l", "ceos-2dc-4s4l"} <= set(discover_labs(repo_root))
+
+
+def test_per_lab_reports_follow_explicit_outputs() -> None:
+    assert _lab_report_path(Path("out/run.json"), "ceos-4s4l", "json") == Path("out/run-ceos-4s4l.json")
+    assert _lab_report_path(None, "ceos-4s4l", "md") == Path("artifacts/ceos-4s4l-validate.md")
+
+
+def test_every_command_closes_its_contexts(tmp_path: Path, monkeypatch) -> None:
+    adapter = _GaugeAdapter()
+    monkeypatch.setattr(cli, "_ctx", lambda lab, profile, opts=None: _ctx(lab, adapter))
+    runner = CliRunner()
+    out = ["--json-out", str(tmp_path / "run.json"), "--md-out", str(tmp_path / "run.md")]
+    assert runner.invoke(cli.app, ["validate", "--lab", "lab-a", *out]).exit_code == 0
+    assert runner.invoke(cli.app, ["validate", "--lab", "lab-a", "--lab", "lab-b", *out]).exit_code == 0
+    assert runner.invoke(cli.app, ["validate", "--lab", "lab-a", "--plan"]).exit_code == 0
+    assert adapter.closed == 4
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.core.model import CheckStatus, ValidationContext
+from netlab.evidence.collectors.linux.host_net import index_neighbors
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.validators.engine import run_checks
+
+NEIGH_JSON = json.dumps(
+    [
+        {"dst": "192.168.20.12", "dev": "bond0.10", "lladdr": "aa:c1:ab:00:00:01", "state": ["STALE"]},
+        {"dst": "192.168.30.13", "dev": "bond0.10", "state": ["FAILED"]},
+        {"dst": "192.168.20.12", "dev": "eth0", "lladdr": "aa:c1:ab:00:00:02", "state": ["REACHABLE"]},
+    ]
+)
+
+
+class _Hosts:
+    def __init__(self) -> None:
+        self.repo_root = Path("/nonexistent")
+        self.execs: list[tuple[str, str]] = []
+
+    def exec(self, node: str, cmd: str) -> CmdResult:
+        self.execs.append((node, cmd))
+        return CmdResult(0, NEIGH_JSON if node == "h1" else "", "")
+
+
+def test_index_neighbors_json_and_text() -> None:
+    index = index_neighbors(NEIGH_JSON)
+    assert index["bond0.10"]["192.168.20.12"]["lladdr"] == "aa:c1:ab:00:00:01"
+    assert "lladdr" not in index["bond0.10"]["192.168.30.13"]
+
+    text = "192.168.20.120 dev bond0.10 lladdr aa:c1:ab:00:00:01 router REACHABLE\n192.168.20.12 dev bond0.10 FAILED\n"
+    index = index_neighbors(text)
+    assert index["bond0.10"]["192.168.20.120"] == {
+        "dst": "192.168.20.120", "dev": "bond0.10", "lladdr": "aa:c1:ab:00:00:01", "state": ["REACHABLE"]
+    }
+    # Prefix matches no longer count: only the exact address is looked up.
+    assert "lladdr" not in index["bond0.10"]["192.168.20.12"]
+
+
+def test_one_exec_per_source_host() -> None:
+    probes = [
+        {"source": "h1", "target_ip": "192.168.20.12", "interface": "bond0.10"},
+        {"source": "h1", "target_ip": "192.168.30.13", "interface": "bond0.10"},
+        {"source": "h2", "target_ip": "192.168.20.11", "interface": "bond0.10"},
+    ]
+    checks = [CheckDef("iso", "dataplane", "l2_neighbor_absent", params={"probes": probes})]
+    intent = IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, checks, {})
+    adapter = _Hosts()
+    results = run_checks(ValidationContext("lab", "fast", intent, adapter, None), "all")
+
+    assert [node for node, _ in adapter.execs] == ["h1", "h2"]
+    assert "ip -j neigh show" in adapter.execs[0][1]
+    assert {r.name: r.status for r in results} == {
+        "iso::h1->192.168.20.12": CheckStatus.FAIL,
+        "iso::h1->192.168.30.13": CheckStatus.PASS,
+        "iso::h2->192.168.20.11": CheckStatus.PASS,
+    }
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from netlab.adapters.base import TIMEOUT_RC, CmdResult
+from netlab.adapters.containerlab import ContainerlabAdapter
+from netlab.core.model import CheckStatus, ValidationContext
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.loader import load_intent
+from netlab.validators.engine import run_checks
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class _Backend:
+    def __init__(self, stopped: str, wedged: bool = False, daemon_hung: bool = False) -> None:
+        self.stopped = stopped
+        self.wedged = wedged
+        self.daemon_hung = daemon_hung
+        self.execs: list[str] = []
+        self.inspects = 0
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        self.execs.append(container)
+        if container.endswith(self.stopped):
+            if self.wedged:
+                return CmdResult(TIMEOUT_RC, "", "timed out after 1s", timed_out=True)
+            return CmdResult(1, "", f"Error response from daemon: container {container} is not running")
+        return CmdResult(0, "", "")
+
+    def inspect(self, container: str, timeout: float | None = None) -> dict | None:
+        self.inspects += 1
+        if self.daemon_hung:
+            raise TimeoutError(f"docker inspect timed out after {timeout:g}s")
+        running = self.wedged or not container.endswith(self.stopped)
+        return {"State": {"Running": running, "Status": "running" if running else "exited"}}
+
+    def close(self) -> None:
+        pass
+
+
+def _run(backend: _Backend, threshold: int = 3):
+    adapter = ContainerlabAdapter(REPO_ROOT, "ceos-4s4l", backend=backend, exec_timeout=1, breaker_threshold=threshold)
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    ctx = ValidationContext("ceos-4s4l", "fast", load_intent(REPO_ROOT, "ceos-4s4l"), adapter, client)
+    return adapter, run_checks(ctx, "all")
+
+
+def test_stopped_container_opens_breaker_after_inspect() -> None:
+    backend = _Backend("leaf1")
+    adapter, results = _run(backend)
+    assert backend.execs.count("clab-ceos-4s4l-leaf1") == 1
+    assert backend.inspects == 1
+    leaf1 = [r for r in results if r.name.endswith("::leaf1") and r.phase == "underlay"]
+    assert leaf1
+    assert {(r.status, r.message) for r in leaf1} == {
+        (CheckStatus.FAIL, "node unreachable: container not running (exited)")
+    }
+    # Control-plane checks wait for the underlay, so they are skipped rather than failed again.
+    assert {r.status for r in results if r.phase == "control-plane"} == {CheckStatus.SKIP}
+    assert adapter.health.open_nodes() == {"leaf1": "container not running (exited)"}
+
+
+def test_consecutive_timeouts_open_breaker() -> None:
+    backend = _Backend("leaf2", wedged=True)
+    adapter, _ = _run(backend, threshold=2)
+    assert backend.execs.count("clab-ceos-4s4l-leaf2") == 2
+    assert "2 consecutive exec failures" in adapter.health.open_nodes()["leaf2"]
+    adapter.health.reset()
+    assert adapter.health.cause("leaf2") is None
+
+
+def test_inspect_timeout_opens_breaker() -> None:
+    backend = _Backend("leaf3", wedged=True, daemon_hung=True)
+    adapter, _ = _run(backend)
+    assert backend.execs.count("clab-ceos-4s4l-leaf3") == 1
+    assert adapter.health.open_nodes() == {"leaf3": "docker inspect timed out after 1s"}
+    assert adapter.get_mgmt_ip("leaf1") is None
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.adapters.containerlab import ContainerlabAdapter
+from netlab.adapters.replay import Recording, ReplayAdapter
+from netlab.bench.fabric import build_fabric, write_fabric
+from netlab.bench.suite import bench_scale, replay_context
+from netlab.drift.config_drift import compute_config_drift
+from netlab.validators.engine import run_checks
+
+
+class _Backend:
+    name = "fake"
+
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        return CmdResult(0, f"{container}:{argv[-1]}", "")
+
+    def close(self) -> None:
+        pass
+
+
+def test_record_then_replay(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    live = ContainerlabAdapter(repo_root, "ceos-4s4l", backend=_Backend(), record=True)
+    first = live.eos_cli("leaf1", "show version")
+    live.exec("l4h1", "ip neigh")
+    live.recording.save(tmp_path / "ceos-4s4l.json")
+
+    replay = ReplayAdapter(repo_root, "ceos-4s4l", Recording.load(tmp_path / "ceos-4s4l.json"))
+    assert replay.eos_cli("leaf1", "show version") == first
+    assert replay.exec("l4h1", "ip neigh").stdout.endswith("ip neigh")
+    assert replay.node_kind("l4h1") == "linux"
+    assert replay.eos_cli("leaf1", "show clock").rc != 0
+
+
+def test_synthetic_fabric_validates_clean(tmp_path: Path) -> None:
+    fabric = build_fabric("synthetic", 40)
+    recording = Recording.load(write_fabric(tmp_path, fabric))
+    ctx = replay_context(tmp_path, "synthetic", recording)
+
+    results = run_checks(ctx, "all", jobs=4)
+    assert {r.status.value for r in results} == {"PASS"}
+    assert len([r for r in results if r.name.startswith("underlay-bgp::")]) == fabric.size
+    assert compute_config_drift(ctx) == []
+
+
+def test_bench_scale_reports_every_hot_path(tmp_path: Path) -> None:
+    row = bench_scale(tmp_path, 12, repeat=1)
+    assert row["exit_code"] == 0
+    assert set(row["seconds"]) >= {"load_intent", "run_checks", "collect_baseline", "diff_dict", "write_json_report"}
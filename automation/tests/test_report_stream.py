@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from netlab.core.model import CheckResult, CheckStatus, Severity
+from netlab.core.results import RunSummary
+from netlab.render.report_json import write_json_report, write_json_report_from_stream
+from netlab.render.report_md import write_markdown_report, write_markdown_report_from_stream
+from netlab.core.model import ValidationContext
+from netlab.intent.schema import CheckDef, GnmiDefaults, IntentModel
+from netlab.render.report_ndjson import ResultStream, iter_results
+from netlab.validators.engine import run_checks
+from netlab.validators.executor import CheckUnit, stream_units
+
+
+def _results() -> list[CheckResult]:
+    return [
+        CheckResult("underlay", "ifaces::leaf1", CheckStatus.PASS, Severity.ERROR, "ok", {"raw": "x" * 10}),
+        CheckResult("control-plane", "bgp::leaf1", CheckStatus.FAIL, Severity.ERROR, "established 0/2"),
+        CheckResult("underlay", "ifaces::leaf2", CheckStatus.FAIL, Severity.WARN, "down"),
+    ]
+
+
+def test_stream_renders_same_reports_as_summary(tmp_path: Path) -> None:
+    results = _results()
+    with ResultStream(tmp_path / "run.ndjson") as stream:
+        stream.write(results[:1])
+        assert len(list(iter_results(tmp_path / "run.ndjson"))) == 1
+        stream.write(results[1:])
+
+    expected = RunSummary(results=results).to_dict()
+    assert stream.summary() == expected["summary"]
+
+    write_json_report_from_stream(tmp_path / "run.ndjson", stream.summary(), tmp_path / "stream.json")
+    assert json.loads((tmp_path / "stream.json").read_text()) == expected
+
+    write_markdown_report(expected, tmp_path / "full.md")
+    write_markdown_report_from_stream(tmp_path / "run.ndjson", stream.summary(), tmp_path / "stream.md")
+    assert (tmp_path / "stream.md").read_text() == (tmp_path / "full.md").read_text()
+
+    write_json_report(expected, tmp_path / "full.json")
+    assert json.loads((tmp_path / "full.json").read_text()) == json.loads((tmp_path / "stream.json").read_text())
+
+
+def test_stream_units_hands_over_each_unit(tmp_path: Path) -> None:
+    results = _results()
+    units = [CheckUnit(r.name, r.name.split("::")[1], lambda r=r: [r]) for r in results]
+    seen: list[str] = []
+    stream_units(units, lambda chunk: seen.extend(r.name for r in chunk), jobs=3)
+    assert sorted(seen) == sorted(r.name for r in results)
+
+
+def test_stream_reports_follow_unit_order(tmp_path: Path) -> None:
+    results = _results()
+    with ResultStream(tmp_path / "run.ndjson") as stream:
+        # Completion order differs from unit order under --jobs.
+        for unit in (2, 0, 1):
+            stream.write([results[unit]], unit)
+    write_json_report_from_stream(tmp_path / "run.ndjson", stream.summary(), tmp_path / "stream.json")
+    assert json.loads((tmp_path / "stream.json").read_text()) == RunSummary(results=results).to_dict()
+
+
+def test_run_checks_sink_gets_unit_indexes() -> None:
+    checks = [CheckDef(f"c{i}", "intent", "intent_distinct", params={"paths": ["a", "b"]}) for i in range(8)]
+    intent = IntentModel("lab", GnmiDefaults(), {"nodes": {}}, {}, checks, {"a": 1, "b": 2})
+    ctx = ValidationContext("lab", "fast", intent, adapter=None, evidence_client=None)
+    seen: list[tuple[int, str]] = []
+    run_checks(ctx, "all", jobs=4, sink=lambda unit, chunk: seen.extend((unit, r.name) for r in chunk))
+    assert sorted(seen) == [(i, f"c{i}") for i in range(8)]
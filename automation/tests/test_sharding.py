@@ -0,0 +1,37 @@
+from functools import partial
+from pathlib import Path
+
+from netlab.bench.fabric import build_fabric, write_fabric
+from netlab.bench.suite import replay_context
+from netlab.validators.engine import build_units, run_checks
+from netlab.validators.sharding import assign_shards, run_sharded
+
+
+def _fabric(tmp_path: Path):
+    fabric = build_fabric("shard-lab", 12, hosts=3)
+    return partial(replay_context, tmp_path, fabric.lab, write_fabric(tmp_path, fabric))
+
+
+def test_assign_shards_keeps_nodes_together(tmp_path: Path) -> None:
+    ctx = _fabric(tmp_path)()
+    units = build_units(ctx, "all")
+    inventory = ctx.intent.inventory
+    for by in ("hash", "role"):
+        owner = assign_shards(units, inventory, 3, by)
+        placed: dict[str, set[int]] = {}
+        for unit, shard in zip(units, owner):
+            placed.setdefault(unit.node or unit.check_name, set()).add(shard)
+        assert all(len(shards) == 1 for shards in placed.values())
+    owner = assign_shards(units, inventory, 3, "role")
+    leaves = {shard for unit, shard in zip(units, owner) if unit.node and unit.node.startswith("leaf")}
+    assert len(leaves) == 1
+
+
+def test_sharded_run_matches_in_process_run(tmp_path: Path) -> None:
+    factory = _fabric(tmp_path)
+    serial = [(r.name, r.status) for r in run_checks(factory(), "all")]
+    sharded = [(r.name, r.status) for r in run_sharded(factory, "all", shards=3, jobs=2)]
+    assert sharded == serial
+    streamed: list = []
+    run_sharded(factory, "all", shards=2, by="role", sink=lambda unit, results: streamed.extend(results))
+    assert sorted((r.name, r.status) for r in streamed) == sorted(serial)
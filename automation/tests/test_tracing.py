@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.adapters.containerlab import ContainerlabAdapter
+from netlab.core.tracing import span, start_tracing, stop_tracing
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.collectors.eos.interfaces_oc import collect_interfaces
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.validators.executor import CheckUnit, execute_units
+
+
+class _Backend:
+    def exec(self, container: str, argv: list[str], timeout: float | None = None) -> CmdResult:
+        if argv[-1].endswith("| json"):
+            return CmdResult(0, '{"interfaceDescriptions": {"Ethernet1": {"interfaceStatus": "up"}}}', "")
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+    def close(self) -> None:
+        pass
+
+
+def test_spans_cover_adapter_evidence_parse_and_checks(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    adapter = ContainerlabAdapter(repo_root, "ceos-4s4l", backend=_Backend())
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    unit = CheckUnit("ifaces", "leaf1", lambda: [] if collect_interfaces(client, "leaf1") else [])
+
+    start_tracing()
+    execute_units([unit, unit])
+    tracer = stop_tracing()
+
+    cats = [e.cat for e in tracer.events]
+    assert cats.count("adapter") == 1
+    assert cats.count("parse") == 1
+    assert cats.count("check") == 2
+    assert [e.args["cache"] for e in tracer.events if e.cat == "evidence"] == ["miss", "hit"]
+    assert tracer.slowest(1, {"adapter"})[0].name == "eos_cli leaf1: show interfaces description | json"
+
+    tracer.write(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_span_is_noop_when_tracing_off() -> None:
+    with span("adapter", "x") as args:
+        args["rc"] = 0
+    assert stop_tracing() is None
@@ -0,0 +1,83 @@
+from collections import Counter
+from pathlib import Path
+
+from netlab.adapters.base import CmdResult
+from netlab.core.model import ValidationContext
+from netlab.evidence.cli import CliTransport
+from netlab.evidence.client import EvidenceClient
+from netlab.evidence.gnmi import GnmiTransport
+from netlab.intent.loader import load_intent
+from netlab.validators.watch import Watcher
+
+INTENT = """
+inventory:
+  nodes:
+    leaf1: {kind: arista_ceos, roles: [eos, leaf]}
+checks:
+  - name: ifaces
+    phase: underlay
+    kind: interfaces_up
+    params: {selector: {role: leaf}}
+  - name: bgp
+    phase: control-plane
+    kind: bgp_established
+    params: {selector: {role: leaf}, min_total: 1}
+  - name: cfg
+    phase: intent
+    kind: config_contains
+    params: {selector: {role: leaf}, required: ["router bgp"]}
+"""
+
+BGP_UP = "  10.0.0.1  4 65000  10  10  0  0 00:00:0{tick} Established\n"
+
+
+class _FakeAdapter:
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.bgp_state = "Established"
+        self.tick = 0
+        self.calls: Counter = Counter()
+
+    def eos_cli(self, node: str, command: str) -> CmdResult:
+        self.calls[command] += 1
+        if command == "show bgp summary":
+            # Up/Down timer changes on every poll and must not count as a change.
+            self.tick += 1
+            return CmdResult(0, BGP_UP.format(tick=self.tick).replace("Established", self.bgp_state), "")
+        return CmdResult(0, "Et1  up  up  to-spine1", "")
+
+
+def _ctx(tmp_path: Path) -> tuple[ValidationContext, _FakeAdapter]:
+    (tmp_path / "lab" / "intent").mkdir(parents=True)
+    (tmp_path / "lab" / "configs").mkdir()
+    (tmp_path / "lab" / "intent" / "intent.yml").write_text(INTENT, encoding="utf-8")
+    (tmp_path / "lab" / "configs" / "leaf1.cfg").write_text("router bgp 65101\n", encoding="utf-8")
+    adapter = _FakeAdapter(tmp_path)
+    client = EvidenceClient(gnmi=GnmiTransport(), cli=CliTransport(adapter))
+    intent = load_intent(tmp_path, "lab")
+    return ValidationContext("lab", "fast", intent, adapter, client), adapter
+
+
+def test_watch_reevaluates_only_changed_inputs(tmp_path: Path) -> None:
+    ctx, adapter = _ctx(tmp_path)
+    watcher = Watcher(ctx, "all")
+
+    first = watcher.poll()
+    assert {t.result.name for t in first} == {"ifaces::leaf1", "bgp::leaf1", "cfg::leaf1"}
+    assert all(t.previous is None for t in first)
+    assert watcher.evaluated == 3
+
+    assert watcher.poll() == []
+    assert watcher.evaluated == 3
+    assert adapter.calls["show bgp summary"] == 2
+
+    adapter.bgp_state = "Active"
+    changed = watcher.poll()
+    assert [(t.result.name, t.previous, t.result.status.value) for t in changed] == [("bgp::leaf1", "PASS", "FAIL")]
+    assert watcher.evaluated == 4
+
+    (tmp_path / "lab" / "configs" / "leaf1.cfg").write_text("hostname leaf1\n", encoding="utf-8")
+    changed = watcher.poll()
+    assert [(t.result.name, t.result.status.value) for t in changed] == [("cfg::leaf1", "FAIL")]
+    assert watcher.evaluated == 5
+    assert watcher.summary().exit_code != 0
@@ -0,0 +1,66 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from netlab.utils import yaml as yaml_utils
+from netlab.utils.yaml import load_yaml_hashed, set_yaml_cache
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    set_yaml_cache(tmp_path / "cache")
+    yield tmp_path / "cache"
+    set_yaml_cache(None)
+
+
+def _no_parse(path, raw):
+    raise AssertionError(f"{path} was parsed again")
+
+
+def test_cached_yaml_skips_parsing_until_content_changes(cache: Path, tmp_path: Path, monkeypatch) -> None:
+    doc = tmp_path / "intent.yml"
+    doc.write_text("checks:\n  - name: a\n", encoding="utf-8")
+    data, digest = load_yaml_hashed(doc)
+    assert data == {"checks": [{"name": "a"}]}
+    assert list(cache.glob("*.json"))
+
+    with monkeypatch.context() as m:
+        m.setattr(yaml_utils, "_parse", _no_parse)
+        assert load_yaml_hashed(doc) == (data, digest)
+        # A new mtime with the same content is resolved by the content hash.
+        st = doc.stat()
+        os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        assert load_yaml_hashed(doc) == (data, digest)
+
+    doc.write_text("checks: []\n", encoding="utf-8")
+    data, new_digest = load_yaml_hashed(doc)
+    assert data == {"checks": []}
+    assert new_digest != digest
+
+
+def test_corrupt_cache_entry_is_ignored(cache: Path, tmp_path: Path) -> None:
+    doc = tmp_path / "lab.clab.yml"
+    doc.write_text("name: lab\n", encoding="utf-8")
+    load_yaml_hashed(doc)
+    for entry in cache.glob("*.json"):
+        entry.write_bytes(b"not json")
+    assert load_yaml_hashed(doc)[0] == {"name": "lab"}
+
+
+def test_entry_is_used_only_when_content_hash_matches(cache: Path, tmp_path: Path) -> None:
+    doc = tmp_path / "intent.yml"
+    doc.write_text("name: real\n", encoding="utf-8")
+    _, digest = load_yaml_hashed(doc)
+    (entry_file,) = cache.glob("*.json")
+    entry = json.loads(entry_file.read_text(encoding="utf-8"))
+    entry_file.write_text(json.dumps(dict(entry, data={"name": "forged"}, sha256="0" * 64)), encoding="utf-8")
+    assert load_yaml_hashed(doc) == ({"name": "real"}, digest)
+
+
+def test_documents_that_do_not_round_trip_through_json_are_not_cached(cache: Path, tmp_path: Path) -> None:
+    doc = tmp_path / "intent.yml"
+    doc.write_text("vlans:\n  10: {vni: 10100}\n", encoding="utf-8")
+    assert load_yaml_hashed(doc)[0] == {"vlans": {10: {"vni": 10100}}}
+    assert not list(cache.glob("*.json"))